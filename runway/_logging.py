@@ -1,6 +1,18 @@
 """Runway logging."""
 import logging
+import sys
+import threading
+import uuid
 from enum import IntEnum
+from typing import Any, Dict, List, Optional  # noqa pylint: disable=W
+
+if sys.version_info.major > 2:
+    from logging.handlers import QueueHandler, QueueListener
+
+#: Queue that log records of a worker process are sent to.
+_WORKER_QUEUE = None  # type: Any
+#: Unit of work (e.g. region or module) being processed by a worker process.
+_WORKER_UNIT = None  # type: Optional[str]
 
 
 class LogLevels(IntEnum):
@@ -179,3 +191,214 @@ class RunwayLogger(logging.Logger):
         """
         if self.isEnabledFor(LogLevels.VERBOSE):
             self._log(LogLevels.VERBOSE, msg, args, **kwargs)
+
+
+class LogUnitFilter(logging.Filter):
+    """Add the unit of work being processed by a worker process to records."""
+
+    def filter(self, record):
+        # type: (logging.LogRecord) -> bool
+        """Add the ``runway_unit`` attribute to a record.
+
+        Args:
+            record: Log record.
+
+        """
+        record.runway_unit = _WORKER_UNIT
+        return True
+
+
+class LogMultiplexHandler(logging.Handler):
+    """Handle records sent from worker processes to their parent process.
+
+    Records of a unit of work are buffered until it completes then handled
+    together by the loggers of the parent process so that the output of a
+    unit is not interwoven with the output of the others. Units of work
+    started within another unit are added to the buffer of their parent
+    unit when they complete.
+
+    """
+
+    def __init__(self, buffered=True):
+        # type: (bool) -> None
+        """Instantiate class.
+
+        Args:
+            buffered: Buffer the records of each unit of work until it
+                completes. If ``False``, records are handled as soon as they
+                are received.
+
+        """
+        super(LogMultiplexHandler, self).__init__()
+        self.buffered = buffered
+        self.buffers = {}  # type: Dict[str, List[logging.LogRecord]]
+        self._flush_lock = threading.Lock()
+
+    def emit(self, record):
+        # type: (logging.LogRecord) -> None
+        """Buffer or handle a record.
+
+        Args:
+            record: Log record.
+
+        """
+        unit = getattr(record, "runway_unit", None)
+        if getattr(record, "runway_unit_complete", False):
+            self.complete_unit(unit)
+        elif unit and self.buffered:
+            self.buffers.setdefault(unit, []).append(record)
+        else:
+            self.handle_records([record])
+
+    def complete_unit(self, unit):
+        # type: (str) -> None
+        """Handle the buffered records of a unit of work that has completed.
+
+        Args:
+            unit: ID of the unit of work.
+
+        """
+        records = self.buffers.pop(unit, [])
+        parent = unit.rpartition("/")[0]
+        if parent and self.buffered:
+            self.buffers.setdefault(parent, []).extend(records)
+        else:
+            self.handle_records(records)
+
+    def flush(self):
+        # type: () -> None
+        """Handle the records of units of work that did not complete."""
+        for unit in sorted(self.buffers, key=len, reverse=True):
+            self.handle_records(self.buffers.pop(unit))
+
+    def handle_records(self, records):
+        # type: (List[logging.LogRecord]) -> None
+        """Handle records with the logger each was created by.
+
+        Args:
+            records: Log records.
+
+        """
+        with self._flush_lock:
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+
+
+class LogMultiplexer(object):
+    """Receive log records from worker processes in the parent process.
+
+    Example:
+        >>> with LogMultiplexer(multiprocessing.get_context()) as multiplexer:
+        ...     executor = ProcessPoolExecutor(
+        ...         initializer=configure_worker_logging,
+        ...         initargs=(multiplexer.queue,),
+        ...     )
+
+    """
+
+    def __init__(self, mp_context, buffered=True):
+        # type: (Any, bool) -> None
+        """Instantiate class.
+
+        Args:
+            mp_context: Multiprocessing context used to start worker
+                processes.
+            buffered: Buffer the records of each unit of work until it
+                completes.
+
+        """
+        self.handler = LogMultiplexHandler(buffered=buffered)
+        self.queue = mp_context.Queue()
+        self._listener = QueueListener(self.queue, self.handler)
+
+    def start(self):
+        # type: () -> None
+        """Start receiving log records."""
+        self._listener.start()
+
+    def stop(self):
+        # type: () -> None
+        """Handle all remaining log records and stop receiving them."""
+        self._listener.stop()
+        self.handler.flush()
+
+    def __enter__(self):
+        # type: () -> LogMultiplexer
+        """Start receiving log records."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Stop receiving log records."""
+        self.stop()
+
+
+def configure_worker_logging(queue):
+    # type: (Any) -> None
+    """Send the log records of a worker process to its parent process.
+
+    Handlers inherited from the parent process are removed so that records
+    are only handled by the parent process.
+
+    Args:
+        queue: Queue of a :class:`LogMultiplexer`.
+
+    """
+    global _WORKER_QUEUE  # pylint: disable=global-statement
+    _WORKER_QUEUE = queue
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+    handler = QueueHandler(queue)
+    handler.addFilter(LogUnitFilter())
+    logging.getLogger().addHandler(handler)
+
+
+def get_worker_log_queue():
+    # type: () -> Any
+    """Get the queue the log records of the current process are sent to."""
+    return _WORKER_QUEUE
+
+
+def run_log_unit(unit, func, *args):
+    # type: (str, Any, Any) -> Any
+    """Run a function as a unit of work whose log records are grouped.
+
+    Args:
+        unit: ID of the unit of work from :func:`new_log_unit`.
+        func: Function to run.
+        *args: Positional arguments passed to the function.
+
+    Returns:
+        The return value of the function.
+
+    """
+    global _WORKER_UNIT  # pylint: disable=global-statement
+    previous, _WORKER_UNIT = _WORKER_UNIT, unit
+    try:
+        return func(*args)
+    finally:
+        _WORKER_UNIT = previous
+        if _WORKER_QUEUE is not None:
+            _WORKER_QUEUE.put_nowait(
+                logging.makeLogRecord(
+                    {
+                        "name": "runway",
+                        "runway_unit": unit,
+                        "runway_unit_complete": True,
+                    }
+                )
+            )
+
+
+def new_log_unit():
+    # type: () -> str
+    """Create the ID of a unit of work within the current unit of work."""
+    unit = uuid.uuid4().hex
+    return "%s/%s" % (_WORKER_UNIT, unit) if _WORKER_UNIT else unit
@@ -6,9 +6,10 @@ import threading
 
 import botocore.exceptions
 
-from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
+from ..dag import QueuedWalker, walk
 from ..exceptions import PlanFailed
 from ..plan import Graph, Plan, Step, merge_graphs
+from ..session_cache import SESSION_POOL
 from ..status import COMPLETE
 from ..util import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
 
@@ -38,6 +39,9 @@ def build_walker(concurrency):
     If concurrency is greater than 1, it will return a walker that will only
     execute a maximum of concurrency steps at any given time.
 
+    Steps are dispatched to a pool of worker threads as soon as their last
+    dependency completes rather than allocating a thread for every step.
+
     Args:
         concurrency (int): Number of threads to use while walking.
 
@@ -48,11 +52,7 @@ def build_walker(concurrency):
     if concurrency == 1:
         return walk
 
-    semaphore = UnlimitedSemaphore()
-    if concurrency > 1:
-        semaphore = threading.Semaphore(concurrency)
-
-    return ThreadedWalker(semaphore).walk
+    return QueuedWalker(concurrency).walk
 
 
 def stack_template_url(bucket_name, blueprint, endpoint):
@@ -117,6 +117,9 @@ class BaseAction(object):
         if not self.bucket_region and provider_builder:
             self.bucket_region = provider_builder.region
         self.s3_conn = self.context.s3_conn
+        self._template_keys = None
+        self._template_keys_listed = False
+        self._template_keys_lock = threading.Lock()
 
     @property
     def _stack_action(self):
@@ -163,6 +166,8 @@ class BaseAction(object):
         except PlanFailed as err:
             LOGGER.error(str(err))
             sys.exit(1)
+        finally:
+            LOGGER.debug("boto3 session pool statistics: %s", SESSION_POOL.stats)
 
     def pre_run(self, **kwargs):
         """Perform steps before running the action."""
@@ -178,7 +183,8 @@ class BaseAction(object):
         """Push the rendered blueprint's template to S3.
 
         Verifies that the template doesn't already exist in S3 before
-        pushing.
+        pushing. Template keys contain the version of the blueprint so the
+        keys already in the bucket are listed once and reused for all stacks.
 
         Returns:
             str: URL to the template in S3.
@@ -186,18 +192,7 @@ class BaseAction(object):
         """
         key_name = stack_template_key_name(blueprint)
         template_url = self.stack_template_url(blueprint)
-        try:
-            template_exists = (
-                self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name)
-                is not None
-            )
-        except botocore.exceptions.ClientError as err:
-            if err.response["Error"]["Code"] == "404":
-                template_exists = False
-            else:
-                raise
-
-        if template_exists and not force:
+        if not force and self._template_exists(key_name):
             LOGGER.debug("CloudFormation template already exists: %s", template_url)
             return template_url
         self.s3_conn.put_object(
@@ -207,9 +202,69 @@ class BaseAction(object):
             ServerSideEncryption="AES256",
             ACL="bucket-owner-full-control",
         )
+        with self._template_keys_lock:
+            if self._template_keys is not None:
+                self._template_keys.add(key_name)
         LOGGER.debug("blueprint %s pushed to %s", blueprint.name, template_url)
         return template_url
 
+    def _template_exists(self, key_name):
+        """Determine if a template already exists in the CloudFormation bucket.
+
+        The first call lists the templates of the namespace in the bucket.
+        If they can't be listed, each template is checked individually.
+
+        Args:
+            key_name (str): Key of the template object.
+
+        Returns:
+            bool
+
+        """
+        with self._template_keys_lock:
+            if not self._template_keys_listed:
+                self._template_keys = self._list_template_keys()
+                self._template_keys_listed = True
+            if self._template_keys is not None:
+                return key_name in self._template_keys
+        try:
+            return (
+                self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name)
+                is not None
+            )
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "404":
+                return False
+            raise
+
+    def _list_template_keys(self):
+        """List the keys of templates in the CloudFormation bucket.
+
+        Returns:
+            Optional[Set[str]]: Keys of the templates for the namespace or
+            ``None`` if they could not be listed.
+
+        """
+        prefix = "stack_templates/%s" % self.context.get_fqn()
+        keys = set()
+        try:
+            paginator = self.s3_conn.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                keys.update(obj["Key"] for obj in page.get("Contents", []))
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "NoSuchBucket":
+                return keys
+            LOGGER.debug(
+                "unable to list templates in bucket %s; checking each template",
+                self.bucket_name,
+                exc_info=True,
+            )
+            return None
+        LOGGER.debug(
+            "found %s existing template(s) in bucket %s", len(keys), self.bucket_name
+        )
+        return keys
+
     def stack_template_url(self, blueprint):
         """S3 URL for CloudFormation template object.
 
@@ -258,10 +258,9 @@ class Action(BaseAction):
         """
         stack_status = kwargs.get("status")
         wait_time = 0 if stack_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
-            return INTERRUPTED
-
         provider = self.build_provider(stack)
+        if provider.poll_stack(stack.fqn, self.cancel, wait_time):
+            return INTERRUPTED
 
         try:
             stack_data = provider.get_stack(stack.fqn)
@@ -286,6 +285,7 @@ class Action(BaseAction):
                 return WAITING
             LOGGER.debug("%s:destroying stack", stack.fqn)
             provider.destroy_stack(stack_data, action="build")
+            provider.invalidate_outputs(stack.fqn)
             return DESTROYING_STATUS
         except CancelExecution:
             return SkippedStatus(reason="canceled execution")
@@ -303,14 +303,13 @@ class Action(BaseAction):
         """
         old_status = kwargs.get("status")
         wait_time = 0 if old_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        provider = self.build_provider(stack)
+        if provider.poll_stack(stack.fqn, self.cancel, wait_time):
             return INTERRUPTED
 
         if not should_submit(stack):
             return NotSubmittedStatus()
 
-        provider = self.build_provider(stack)
-
         try:
             provider_stack = provider.get_stack(stack.fqn)
         except StackDoesNotExist:
@@ -360,6 +359,7 @@ class Action(BaseAction):
                 return FailedStatus(reason)
 
             elif provider.is_stack_completed(provider_stack):
+                provider.invalidate_outputs(stack.fqn)
                 stack.set_outputs(provider.get_output_dict(provider_stack))
                 return CompleteStatus(old_status.reason)
             else:
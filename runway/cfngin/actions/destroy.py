@@ -38,10 +38,9 @@ class Action(BaseAction):
     def _destroy_stack(self, stack, **kwargs):
         old_status = kwargs.get("status")
         wait_time = 0 if old_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
-            return INTERRUPTED
-
         provider = self.build_provider(stack)
+        if provider.poll_stack(stack.fqn, self.cancel, wait_time):
+            return INTERRUPTED
 
         try:
             provider_stack = provider.get_stack(stack.fqn)
@@ -65,6 +64,7 @@ class Action(BaseAction):
             return DESTROYING_STATUS
         LOGGER.debug("%s:destroying stack", stack.fqn)
         provider.destroy_stack(provider_stack)
+        provider.invalidate_outputs(stack.fqn)
         return DESTROYING_STATUS
 
     def pre_run(self, **kwargs):
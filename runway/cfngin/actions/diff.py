@@ -192,6 +192,10 @@ class Action(build.Action):
         try:
             stack.resolve(self.context, provider)
             parameters = self.build_parameters(stack)
+            if provider.is_stack_unchanged(
+                stack.fqn, stack.blueprint.rendered, parameters, tags
+            ):
+                raise exceptions.StackDidNotChange
             outputs = provider.get_stack_changes(
                 stack, self._template(stack.blueprint), parameters, tags
             )
@@ -1,12 +1,18 @@
 """CFNgin blueprint base classes."""
 import copy
 import hashlib
+import inspect
+import json
 import logging
+import os
 import string
+import tempfile
 
+import troposphere
 from six import string_types
 from troposphere import Output, Parameter, Ref, Template
 
+from runway import __version__
 from runway.variables import Variable
 
 from ..exceptions import (
@@ -22,6 +28,12 @@ from .variables.types import CFNType, TroposphereType
 
 LOGGER = logging.getLogger(__name__)
 
+# Directory where rendered templates are cached between runs. Caching is
+# disabled unless this is set.
+TEMPLATE_CACHE_DIR_ENV = "CFNGIN_TEMPLATE_CACHE_DIR"
+
+_SOURCE_HASHES = {}
+
 PARAMETER_PROPERTIES = {
     "default": "Default",
     "description": "Description",
@@ -287,6 +299,51 @@ def parse_user_data(variables, raw_user_data, blueprint_name):
     return res
 
 
+def get_source_hash(blueprint_class):
+    """Get a hash of the source of a blueprint class.
+
+    The source files of all classes the blueprint inherits from are included
+    so changes to helper functions or base classes are detected.
+
+    Args:
+        blueprint_class (Type[Blueprint]): Class to hash.
+
+    Returns:
+        Optional[str]: Hash of the source or ``None`` if the source of a
+        class can't be found.
+
+    """
+    if blueprint_class not in _SOURCE_HASHES:
+        source_hash = hashlib.md5()
+        try:
+            for cls in inspect.getmro(blueprint_class):
+                if cls is object:
+                    continue
+                with open(inspect.getsourcefile(cls), "rb") as source:
+                    source_hash.update(source.read())
+            _SOURCE_HASHES[blueprint_class] = source_hash.hexdigest()
+        except (IOError, OSError, TypeError):
+            LOGGER.debug(
+                "unable to find the source of %s", blueprint_class, exc_info=True
+            )
+            _SOURCE_HASHES[blueprint_class] = None
+    return _SOURCE_HASHES[blueprint_class]
+
+
+def _serialize_variable(value):
+    """Serialize a resolved variable value for use in a cache key.
+
+    Raises:
+        TypeError: The value can't be serialized.
+
+    """
+    if isinstance(value, CFNParameter):
+        return {"name": value.name, "value": value.value}
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError("%r can't be serialized" % value)
+
+
 class Blueprint(object):
     """Base implementation for rendering a troposphere template."""
 
@@ -310,6 +367,7 @@ class Blueprint(object):
         self.reset_template()
         self.resolved_variables = None
         self.description = description
+        self._from_cache = False
         self._rendered = None
         self._version = None
 
@@ -354,6 +412,10 @@ class Blueprint(object):
             output properties.
 
         """
+        if self._from_cache:
+            # the template was not built when it was read from the cache
+            self.render_template()
+            self._from_cache = False
         return {k: output.to_dict() for k, output in self.template.outputs.items()}
 
     def get_required_parameter_definitions(self):
@@ -480,6 +542,7 @@ class Blueprint(object):
     def reset_template(self):
         """Reset template."""
         self.template = Template()
+        self._from_cache = False
         self._rendered = None
         self._version = None
 
@@ -494,6 +557,86 @@ class Blueprint(object):
         version = hashlib.md5(rendered.encode()).hexdigest()[:8]
         return version, rendered
 
+    def get_template_cache_path(self):
+        """Get the path where the rendered template is cached.
+
+        Rendered templates are only cached when the
+        ``CFNGIN_TEMPLATE_CACHE_DIR`` environment variable is set. The path
+        is derived from the source of the blueprint class and everything
+        provided to the blueprint so unchanged blueprints can be read from
+        the cache instead of being rendered again. The versions of runway and
+        troposphere are included since they can change how a template is
+        rendered.
+
+        Returns:
+            Optional[str]: Path to the cached template or ``None`` if the
+            template can't be cached.
+
+        """
+        cache_dir = os.environ.get(TEMPLATE_CACHE_DIR_ENV)
+        if not cache_dir or self.resolved_variables is None:
+            return None
+        source_hash = get_source_hash(self.__class__)
+        if not source_hash:
+            return None
+        try:
+            data = json.dumps(
+                {
+                    "description": self.description,
+                    "environment": getattr(self.context, "environment", None),
+                    "indent": self.context.template_indent,
+                    "mappings": self.mappings,
+                    "name": self.name,
+                    "namespace": getattr(self.context, "namespace", None),
+                    "runway_version": __version__,
+                    "source": source_hash,
+                    "troposphere_version": troposphere.__version__,
+                    "variables": self.resolved_variables,
+                },
+                default=_serialize_variable,
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            LOGGER.debug(
+                "%s: unable to serialize variables; template will not be cached",
+                self.name,
+                exc_info=True,
+            )
+            return None
+        return os.path.join(
+            cache_dir, hashlib.sha256(data.encode()).hexdigest() + ".json"
+        )
+
+    def _render(self):
+        """Render the template or read it from the template cache.
+
+        Returns:
+            Tuple[str, str]: Version and rendered template.
+
+        """
+        cache_path = self.get_template_cache_path()
+        if cache_path and os.path.isfile(cache_path):
+            LOGGER.debug("%s: using cached template %s", self.name, cache_path)
+            with open(cache_path, "r") as cached:
+                rendered = cached.read()
+            self._from_cache = True
+            return hashlib.md5(rendered.encode()).hexdigest()[:8], rendered
+        version, rendered = self.render_template()
+        if cache_path:
+            try:
+                cache_dir = os.path.dirname(cache_path)
+                if not os.path.isdir(cache_dir):
+                    os.makedirs(cache_dir)
+                # write to a temporary file first so a partial template is
+                # never read by another process
+                handle, temp_path = tempfile.mkstemp(dir=cache_dir)
+                with os.fdopen(handle, "w") as temp:
+                    temp.write(rendered)
+                os.rename(temp_path, cache_path)
+            except (IOError, OSError):
+                LOGGER.debug("%s: unable to cache template", self.name, exc_info=True)
+        return version, rendered
+
     def to_json(self, variables=None):
         """Render the blueprint and return the template in json form.
 
@@ -560,20 +703,22 @@ class Blueprint(object):
     @property
     def requires_change_set(self):
         """Return true if the underlying template has transforms."""
+        if self._from_cache:
+            return "Transform" in json.loads(self._rendered)
         return self.template.transform is not None
 
     @property
     def rendered(self):
         """Return rendered blueprint."""
         if not self._rendered:
-            self._version, self._rendered = self.render_template()
+            self._version, self._rendered = self._render()
         return self._rendered
 
     @property
     def version(self):
         """Template version."""
         if not self._version:
-            self._version, self._rendered = self.render_template()
+            self._version, self._rendered = self._render()
         return self._version
 
     def create_template(self):
@@ -78,6 +78,7 @@ class Context(object):
         self.__boto3_credentials = boto3_credentials
         self._bucket_name = None
         self._persistent_graph = None
+        self._persistent_graph_content = None
         self._persistent_graph_lock_code = None
         self._persistent_graph_lock_tag = "cfngin_lock_code"
         self._s3_bucket_verified = None
@@ -95,11 +96,23 @@ class Context(object):
         self.environment = environment
         self.force_stacks = force_stacks or []
         self.hook_data = {}  # TODO change to MutableMap in next major release
+        # data retrieved by lookup handlers while variables are being resolved
+        self.lookup_cache = {}
         self.logger = PrefixAdaptor(config_path, LOGGER)
         self.region = region
         self.s3_conn = self.get_session(region=self.bucket_region).client("s3")
         self.stack_names = stack_names or []
 
+    @property
+    def boto3_credentials(self):
+        """Credentials used when creating a boto3 session from context.
+
+        Returns:
+            Optional[Dict[str, str]]
+
+        """
+        return self.__boto3_credentials
+
     @property
     def _base_fqn(self):
         """Return ``namespace`` sanitized for use as an S3 Bucket name."""
@@ -202,6 +215,7 @@ class Context(object):
     def persistent_graph(self, graph_dict):
         """Load a persistent graph dict as a :class:`runway.cfngin.plan.Graph`."""
         self._persistent_graph = Graph.from_dict(graph_dict, self)
+        self._persistent_graph_content = self._persistent_graph.dumps()
 
     @property
     def persistent_graph_location(self):
@@ -459,6 +473,9 @@ class Context(object):
     def put_persistent_graph(self, lock_code):
         """Upload persistent graph to s3.
 
+        The graph is not uploaded if it is unchanged since it was last
+        retrieved or uploaded.
+
         Args:
             lock_code (str): The code that will be used to lock the S3 object.
 
@@ -485,17 +502,21 @@ class Context(object):
                 lock_code, self.persistent_graph_lock_code
             )
 
+        content = self.persistent_graph.dumps()
+        if content == self._persistent_graph_content:
+            self.logger.debug("persistent graph unchanged; skipped update")
+            return
+
         self.s3_conn.put_object(
-            Body=self.persistent_graph.dumps(4),
+            Body=content,
             ServerSideEncryption="AES256",
             ACL="bucket-owner-full-control",
             ContentType="application/json",
             Tagging="{}={}".format(self._persistent_graph_lock_tag, lock_code),
             **self.persistent_graph_location
         )
-        self.logger.debug(
-            "persistent graph updated:\n%s", self.persistent_graph.dumps(indent=4)
-        )
+        self._persistent_graph_content = content
+        self.logger.debug("persistent graph updated:\n%s", content)
 
     def set_hook_data(self, key, data):
         """Set hook data for the given key.
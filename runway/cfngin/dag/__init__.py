@@ -3,7 +3,9 @@ import collections
 import logging
 from collections import OrderedDict, deque
 from copy import copy, deepcopy
-from threading import Thread
+from threading import Event, Lock, Thread
+
+from six.moves import queue
 
 LOGGER = logging.getLogger(__name__)
 
@@ -487,3 +489,117 @@ class ThreadedWalker(object):  # pylint: disable=too-few-public-methods
 
         # Wait for all threads to complete executing.
         wait_for(nodes)
+
+
+class QueuedWalker(object):  # pylint: disable=too-few-public-methods
+    """Walk a DAG using a ready queue and a bounded pool of worker threads.
+
+    Unlike :class:`ThreadedWalker`, a thread is not allocated for each node.
+    Instead, the number of incomplete dependencies of each node is tracked and
+    a node is only placed on the ready queue once its last dependency has
+    completed. Worker threads are started on demand, up to ``concurrency``.
+
+    """
+
+    def __init__(self, concurrency=0):
+        """Instantiate class.
+
+        Args:
+            concurrency (int): Maximum number of nodes that will be executed
+                in parallel. If the value is less than ``1``, the number of
+                workers is only constrained by the topology of the graph.
+
+        """
+        self.concurrency = concurrency
+
+    def walk(self, dag, walk_func):
+        """Walk each node of the graph, in parallel if it can.
+
+        The walk_func is only called when the nodes dependencies have been
+        satisfied. Nodes are still walked if a dependency raised an exception
+        so that walk_func can determine how to handle them.
+
+        """
+        # sorting also validates that the graph is acyclic
+        nodes = dag.topological_sort()
+        nodes.reverse()
+        if not nodes:
+            return
+
+        max_workers = len(nodes)
+        if self.concurrency > 0:
+            max_workers = min(self.concurrency, max_workers)
+
+        # node -> number of dependencies that have not completed
+        pending = {}
+        # node -> nodes that depend on it
+        dependents = dict((node, []) for node in nodes)
+        for node in nodes:
+            deps = dag.downstream(node)
+            pending[node] = len(deps)
+            for dep in deps:
+                dependents[dep].append(node)
+
+        ready = queue.Queue()
+        lock = Lock()  # protects the counters below & the list of workers
+        done = Event()
+        state = {"idle": 0, "remaining": len(nodes)}
+        workers = []
+
+        def dispatch(node):
+            """Place a node on the ready queue, starting a worker if needed.
+
+            Must be called while holding ``lock``.
+
+            """
+            LOGGER.debug("%s ready", node)
+            if state["idle"]:
+                state["idle"] -= 1  # reserve an idle worker for this node
+            elif len(workers) < max_workers:
+                worker = Thread(
+                    target=work, name="QueuedWalker-%s" % (len(workers) + 1)
+                )
+                worker.daemon = True
+                workers.append(worker)
+                worker.start()
+            ready.put(node)
+
+        def complete(node):
+            """Mark a node as complete, dispatching any unblocked nodes."""
+            with lock:
+                for dependent in dependents[node]:
+                    pending[dependent] -= 1
+                    if not pending[dependent]:
+                        dispatch(dependent)
+                state["remaining"] -= 1
+                if not state["remaining"]:
+                    done.set()
+                else:
+                    state["idle"] += 1
+
+        def work():
+            """Execute nodes from the ready queue until told to stop."""
+            while True:
+                node = ready.get()
+                if node is None:
+                    return
+                LOGGER.debug("%s starting", node)
+                try:
+                    walk_func(node)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception("%s raised an unhandled exception", node)
+                finally:
+                    complete(node)
+
+        with lock:
+            for node in nodes:
+                if not pending[node]:
+                    dispatch(node)
+
+        # Event.wait without a timeout can't be interrupted on python 2
+        while not done.wait(1):
+            pass
+        for _ in workers:
+            ready.put(None)
+        for worker in workers:
+            worker.join()
@@ -9,11 +9,14 @@ import shutil
 import stat
 import subprocess
 import sys
+import threading
 from distutils.util import strtobool  # pylint: disable=E
-from io import BytesIO as StringIO
+from io import BytesIO
+from multiprocessing.pool import ThreadPool
 from shutil import copyfile
+from tempfile import SpooledTemporaryFile
 from types import GeneratorType
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 # pylint import order false alerts appear to be specific to py2 on Windows
 import botocore
@@ -36,9 +39,32 @@ else:
 # mask to retrieve only UNIX file permissions from the external attributes
 # field of a ZIP entry.
 ZIP_PERMS_MASK = (stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO) << 16
+# size of the chunks read from files being zipped and hashed
+ZIP_READ_SIZE = 1024 * 1024
+# ZIP files larger than this are written to disk instead of kept in memory
+ZIP_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+# maximum number of sets of dependencies kept in the dependency cache
+DEPENDENCY_CACHE_MAX_ENTRIES = 25
 
 LOGGER = logging.getLogger(__name__)
 
+# name of the function being processed by the current thread
+_FUNCTION_STATE = threading.local()
+
+
+class _FunctionPrefixFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """Prefix messages with the name of the function being processed."""
+
+    def filter(self, record):
+        """Add the prefix to a log record."""
+        name = getattr(_FUNCTION_STATE, "name", None)
+        if name:
+            record.msg = "{}:{}".format(name, record.msg)
+        return True
+
+
+LOGGER.addFilter(_FunctionPrefixFilter())
+
 # list from python tags of https://hub.docker.com/r/lambci/lambda/tags
 SUPPORTED_RUNTIMES = [
     # Python 2.7 reached end-of-life on January 1st, 2020.
@@ -134,56 +160,84 @@ def should_use_docker(dockerize_pip=None):
 
 
 def _zip_files(files, root):
-    """Generate a ZIP file in-memory from a list of files.
+    """Generate a ZIP file from a list of files.
 
     Files will be stored in the archive with relative names, and have their
     UNIX permissions forced to 755 or 644 (depending on whether they are
     user-executable in the source filesystem).
 
+    The archive is written to a temporary file that is only kept in memory
+    while it is small. The hash of the files is calculated while they are
+    read into the archive.
+
     Args:
         files (List[str]): file names to add to the archive, relative to
             ``root``.
         root (str): base directory to retrieve files from.
 
     Returns:
-        Tuple[str, str]: Content of the ZIP file as a byte string and
-        calculated hash of all the files
+        Tuple[SpooledTemporaryFile, str]: ZIP file, positioned at the start,
+        and calculated hash of all the files. The ZIP file should be closed
+        by the caller.
 
     """
-    zip_data = StringIO()
+    zip_data = SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
     if isinstance(files, GeneratorType):
         # if file list is a generator, save the contents so it can be reused
         # since generators are empty after the first iteration and cannot be
         # rewound.
         LOGGER.debug("converting file generater to list for reuse...")
         files = list(files)
-    with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
-        for file_name in files:
-            zip_file.write(os.path.join(root, file_name), file_name)
-
-        # Fix file permissions to avoid any issues - only care whether a file
-        # is executable or not, choosing between modes 755 and 644 accordingly.
-        for zip_entry in zip_file.filelist:
-            perms = (zip_entry.external_attr & ZIP_PERMS_MASK) >> 16
-            if perms & stat.S_IXUSR != 0:
-                new_perms = 0o755
-            else:
-                new_perms = 0o644
-
-            if new_perms != perms:
-                LOGGER.debug(
-                    "fixing perms: %s: %o => %o", zip_entry.filename, perms, new_perms
-                )
-                new_attr = (zip_entry.external_attr & ~ZIP_PERMS_MASK) | (
-                    new_perms << 16
-                )
-                zip_entry.external_attr = new_attr
+    if sys.version_info.major < 3:  # TODO remove when dropping python 2
+        with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
+            for file_name in files:
+                zip_file.write(os.path.join(root, file_name), file_name)
+            for zip_entry in zip_file.filelist:
+                _fix_zip_entry_permissions(zip_entry)
+        content_hash = _calculate_hash(files, root)
+    else:
+        file_hash = hashlib.md5()
+        with ZipFile(zip_data, "w", ZIP_DEFLATED) as zip_file:
+            # files are sorted so the hash matches _calculate_hash
+            for file_name in sorted(files):
+                file_path = os.path.join(root, file_name)
+                zip_entry = ZipInfo.from_file(file_path, file_name)
+                zip_entry.compress_type = ZIP_DEFLATED
+                _fix_zip_entry_permissions(zip_entry)
+                file_hash.update((file_name + "\0").encode())
+                with open(file_path, "rb") as source, zip_file.open(
+                    zip_entry, "w"
+                ) as dest:
+                    for chunk in iter(lambda: source.read(ZIP_READ_SIZE), b""):
+                        file_hash.update(chunk)
+                        dest.write(chunk)
+                file_hash.update("\0".encode())
+        content_hash = file_hash.hexdigest()
+
+    zip_data.seek(0)
+    return zip_data, content_hash
+
+
+def _fix_zip_entry_permissions(zip_entry):
+    """Fix the permissions of a ZIP entry to avoid any issues.
+
+    Only care whether a file is executable or not, choosing between modes
+    755 and 644 accordingly.
 
-    contents = zip_data.getvalue()
-    zip_data.close()
-    content_hash = _calculate_hash(files, root)
+    Args:
+        zip_entry (zipfile.ZipInfo): Entry to update.
+
+    """
+    perms = (zip_entry.external_attr & ZIP_PERMS_MASK) >> 16
+    if perms & stat.S_IXUSR != 0:
+        new_perms = 0o755
+    else:
+        new_perms = 0o644
 
-    return contents, content_hash
+    if new_perms != perms:
+        LOGGER.debug("fixing perms: %s: %o => %o", zip_entry.filename, perms, new_perms)
+        new_attr = (zip_entry.external_attr & ~ZIP_PERMS_MASK) | (new_perms << 16)
+        zip_entry.external_attr = new_attr
 
 
 def _calculate_hash(files, root):
@@ -246,7 +300,7 @@ def _find_files(root, includes, excludes=None, follow_symlinks=False):
 
 
 def _zip_from_file_patterns(root, includes, excludes, follow_symlinks):
-    """Generate a ZIP file in-memory from file search patterns.
+    """Generate a ZIP file from file search patterns.
 
     Args:
         root (str): Base directory to list files from.
@@ -516,6 +570,271 @@ def _pip_has_no_color_option(python_path):
     return False
 
 
+def _get_python_version(python_path):
+    """Get the version and platform of a python interpreter.
+
+    Args:
+        python_path (str): Path to the python interpreter.
+
+    Returns:
+        Optional[str]: ``sys.version_info`` and ``sys.platform`` of the
+        interpreter or ``None`` if they could not be retrieved.
+
+    """
+    try:
+        output = subprocess.check_output(
+            [
+                python_path,
+                "-c",
+                "import sys;"
+                "sys.stdout.write(repr((tuple(sys.version_info), sys.platform)))",
+            ]
+        )
+    except (OSError, subprocess.CalledProcessError):
+        LOGGER.debug("unable to get the version of python: %s", python_path)
+        return None
+    if isinstance(output, bytes):  # python3 returns encoded bytes
+        output = output.decode("utf-8", "replace")
+    return output.strip()
+
+
+def _dependency_cache_key(
+    requirements_path, dockerize_pip=False, python_path=None, **kwargs
+):
+    """Get the key of the cached dependencies for a requirements file.
+
+    The key is derived from the content of the requirements file and
+    everything that can change what ``pip`` installs from it.
+
+    Args:
+        requirements_path (str): Path to the requirements file.
+        dockerize_pip (Union[bool, str]): Whether to use docker or under what
+            conditions docker will be used to run ``pip``.
+        python_path (Optional[str]): Explicit python interpreter to be used.
+        kwargs (Any): Options of the function.
+
+    Returns:
+        Optional[str]: Key of the cached dependencies or ``None`` if the
+        requirements file does not exist.
+
+    """
+    if not os.path.isfile(requirements_path):
+        return None
+    cache_key = hashlib.sha256()
+    with open(requirements_path, "rb") as requirements:
+        cache_key.update(requirements.read())
+    if should_use_docker(dockerize_pip):
+        parts = ["docker", kwargs.get("runtime"), kwargs.get("docker_image")]
+        docker_file = kwargs.get("docker_file")
+        if docker_file and os.path.isfile(docker_file):
+            with open(docker_file, "rb") as dockerfile:
+                parts.append(hashlib.sha256(dockerfile.read()).hexdigest())
+    elif python_path:
+        parts = [
+            "python",
+            os.path.realpath(python_path),
+            _get_python_version(python_path),
+            sys.platform,
+        ]
+    else:
+        parts = [
+            "python",
+            sys.executable,
+            sys.version,
+            sys.platform,
+            getattr(sys, "frozen", False),
+        ]
+    parts.append(bool(kwargs.get("python_dontwritebytecode")))
+    cache_key.update(json.dumps([str(part) for part in parts]).encode())
+    return cache_key.hexdigest()
+
+
+def _install_dependencies(
+    target, requirements_path, dockerize_pip=False, python_path=None, **kwargs
+):
+    """Install the dependencies of a requirements file with ``pip``.
+
+    Args:
+        target (str): Directory to install the dependencies into.
+        requirements_path (str): Path to the requirements file.
+        dockerize_pip (Union[bool, str]): Whether to use docker or under what
+            conditions docker will be used to run ``pip``.
+        python_path (Optional[str]): Explicit python interpreter to be used.
+        kwargs (Any): Advanced options for subprocess and docker.
+
+    Raises:
+        PipError: ``pip`` returned a non-zero exit code.
+
+    """
+    if should_use_docker(dockerize_pip):
+        # the requirements file must be in the directory mounted by docker
+        tmp_req = os.path.join(target, "requirements.txt")
+        if os.path.abspath(requirements_path) != os.path.abspath(tmp_req):
+            copyfile(requirements_path, tmp_req)
+        dockerized_pip(target, **kwargs)
+        return
+
+    tmp_script = Path(target) / "__runway_run_pip_install.py"
+    pip_cmd = [
+        python_path or sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--target",
+        target,
+        "--requirement",
+        requirements_path,
+        "--no-color",
+    ]
+
+    subprocess_args = {}
+    if kwargs.get("python_dontwritebytecode"):
+        subprocess_args["env"] = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+
+    # Pyinstaller build or explicit python path
+    if getattr(sys, "frozen", False) and not python_path:
+        script_contents = os.linesep.join(
+            [
+                "import runpy",
+                "from runway.util import argv",
+                "with argv(*{}):".format(json.dumps(pip_cmd[2:])),
+                '   runpy.run_module("pip", run_name="__main__")\n',
+            ]
+        )
+        # TODO remove python 2 logic when dropping python 2
+        tmp_script.write_text(
+            script_contents
+            if sys.version_info.major > 2
+            else script_contents.decode("UTF-8")
+        )
+        cmd = [sys.executable, "run-python", str(tmp_script)]
+    else:
+        if not _pip_has_no_color_option(pip_cmd[0]):
+            pip_cmd.remove("--no-color")
+        cmd = pip_cmd
+
+    LOGGER.info(
+        "The following output from pip may include incompatibility errors. "
+        "These can generally be ignored (pip will erroneously warn "
+        "about conflicts between the packages in your Lambda zip and "
+        "your host system)."
+    )
+
+    try:
+        if getattr(_FUNCTION_STATE, "capture_output", False):
+            # log the output so it has the prefix of the function
+            _check_call_logged(cmd, **subprocess_args)
+        else:
+            subprocess.check_call(cmd, **subprocess_args)
+    except subprocess.CalledProcessError:
+        raise PipError
+    finally:
+        if tmp_script.is_file():
+            tmp_script.unlink()
+
+
+def _check_call_logged(cmd, **kwargs):
+    """Run a command, logging each line of its output.
+
+    Args:
+        cmd (List[str]): Command to run.
+        kwargs (Any): Passed to :class:`subprocess.Popen`.
+
+    Raises:
+        subprocess.CalledProcessError: Non-zero exit code returned.
+
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs
+    )
+    for line in iter(proc.stdout.readline, b""):
+        LOGGER.info(line.decode("UTF-8", "replace").rstrip())
+    proc.stdout.close()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _install_cached_dependencies(
+    cache_root, cache_key, dest_path, requirements_path, **kwargs
+):
+    """Copy dependencies from the cache, installing them first if needed.
+
+    Like ``pip install --target``, top level files and directories that
+    already exist in the destination are not replaced.
+
+    Args:
+        cache_root (str): Directory containing cached dependencies.
+        cache_key (str): Key of the dependencies.
+        dest_path (str): Directory to copy the dependencies into.
+        requirements_path (str): Path to the requirements file.
+        kwargs (Any): Options passed to :func:`_install_dependencies`.
+
+    """
+    cache_dir = os.path.join(cache_root, cache_key)
+    if os.path.isdir(cache_dir):
+        LOGGER.info("using cached dependencies: %s", cache_dir)
+        os.utime(cache_dir, None)  # mark as recently used
+    else:
+        try:
+            os.makedirs(cache_root)
+        except OSError:
+            if not os.path.isdir(cache_root):
+                raise
+        staging_dir = tempfile.mkdtemp(prefix="staging-", dir=cache_root)
+        try:
+            _install_dependencies(staging_dir, requirements_path, **kwargs)
+            req_copy = os.path.join(staging_dir, "requirements.txt")
+            if os.path.isfile(req_copy):
+                os.remove(req_copy)
+            try:
+                os.rename(staging_dir, cache_dir)
+                LOGGER.debug("cached dependencies: %s", cache_dir)
+            except OSError:
+                # another thread or process cached the same dependencies
+                if not os.path.isdir(cache_dir):
+                    raise
+                LOGGER.debug("using dependencies cached concurrently: %s", cache_dir)
+        finally:
+            if os.path.isdir(staging_dir):
+                shutil.rmtree(staging_dir)
+    for name in os.listdir(cache_dir):
+        src = os.path.join(cache_dir, name)
+        dest = os.path.join(dest_path, name)
+        if os.path.lexists(dest):
+            LOGGER.debug("not replacing %s with cached dependency", name)
+        elif os.path.isdir(src) and not os.path.islink(src):
+            shutil.copytree(src, dest, symlinks=True)
+        elif os.path.islink(src):
+            os.symlink(os.readlink(src), dest)
+        else:
+            shutil.copy2(src, dest)
+    _prune_dependency_cache(cache_root, keep=cache_key)
+
+
+def _prune_dependency_cache(cache_root, keep=None):
+    """Remove the least recently used dependencies from the cache.
+
+    Only the :data:`DEPENDENCY_CACHE_MAX_ENTRIES` most recently used are kept.
+
+    Args:
+        cache_root (str): Directory containing cached dependencies.
+        keep (Optional[str]): Cache key that is never removed.
+
+    """
+    entries = [
+        os.path.join(cache_root, name)
+        for name in os.listdir(cache_root)
+        if len(name) == 64 and name != keep  # skip staging directories
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    limit = DEPENDENCY_CACHE_MAX_ENTRIES
+    if keep:
+        limit -= 1  # the kept entry counts towards the limit
+    for entry in entries[max(limit, 0) :]:
+        LOGGER.debug("removing dependencies from cache: %s", entry)
+        shutil.rmtree(entry, ignore_errors=True)
+
+
 def _zip_package(
     package_root,
     includes,
@@ -527,7 +846,12 @@ def _zip_package(
     use_pipenv=False,
     **kwargs
 ):
-    """Create zip file in memory with package dependencies.
+    """Create zip file with package dependencies.
+
+    Dependencies are cached in ``~/.runway_cache/lambda_dependencies`` and
+    are only installed again when the requirements, python interpreter, or
+    docker image change. Only the :data:`DEPENDENCY_CACHE_MAX_ENTRIES` most
+    recently used are kept.
 
     Args:
         package_root (str): Base directory to copy files from.
@@ -550,8 +874,8 @@ def _zip_package(
             code to determine what is supported.
 
     Returns:
-        Tuple[str, str]: Content of the ZIP file as a byte string and
-        calculated hash of all the files
+        Tuple[SpooledTemporaryFile, str]: ZIP file and calculated hash of all
+        the files.
 
     """
     kwargs.setdefault("pipenv_timeout", 300)
@@ -575,63 +899,30 @@ def _zip_package(
             pipenv_timeout=kwargs["pipenv_timeout"],
         )
 
-        if should_use_docker(dockerize_pip):
-            dockerized_pip(tmpdir, **kwargs)
+        cache_key = None
+        if kwargs.get("cache_dependencies", True):
+            cache_key = _dependency_cache_key(
+                tmp_req, dockerize_pip=dockerize_pip, python_path=python_path, **kwargs
+            )
+        if cache_key:
+            _install_cached_dependencies(
+                os.path.join(temp_root, "lambda_dependencies"),
+                cache_key,
+                tmpdir,
+                tmp_req,
+                dockerize_pip=dockerize_pip,
+                python_path=python_path,
+                **kwargs
+            )
         else:
-            tmp_script = Path(tmpdir) / "__runway_run_pip_install.py"
-            pip_cmd = [
-                python_path or sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "--target",
+            _install_dependencies(
                 tmpdir,
-                "--requirement",
                 tmp_req,
-                "--no-color",
-            ]
-
-            subprocess_args = {}
-            if kwargs.get("python_dontwritebytecode"):
-                subprocess_args["env"] = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
-
-            # Pyinstaller build or explicit python path
-            if getattr(sys, "frozen", False) and not python_path:
-                script_contents = os.linesep.join(
-                    [
-                        "import runpy",
-                        "from runway.util import argv",
-                        "with argv(*{}):".format(json.dumps(pip_cmd[2:])),
-                        '   runpy.run_module("pip", run_name="__main__")\n',
-                    ]
-                )
-                # TODO remove python 2 logic when dropping python 2
-                tmp_script.write_text(
-                    script_contents
-                    if sys.version_info.major > 2
-                    else script_contents.decode("UTF-8")
-                )
-                cmd = [sys.executable, "run-python", str(tmp_script)]
-            else:
-                if not _pip_has_no_color_option(pip_cmd[0]):
-                    pip_cmd.remove("--no-color")
-                cmd = pip_cmd
-
-            LOGGER.info(
-                "The following output from pip may include incompatibility errors. "
-                "These can generally be ignored (pip will erroneously warn "
-                "about conflicts between the packages in your Lambda zip and "
-                "your host system)."
+                dockerize_pip=dockerize_pip,
+                python_path=python_path,
+                **kwargs
             )
 
-            try:
-                subprocess.check_call(cmd, **subprocess_args)
-            except subprocess.CalledProcessError:
-                raise PipError
-            finally:
-                if tmp_script.is_file():
-                    tmp_script.unlink()
-
         if kwargs.get("python_exclude_bin_dir") and os.path.isdir(
             os.path.join(tmpdir, "bin")
         ):
@@ -686,7 +977,9 @@ def _upload_code(s3_conn, bucket, prefix, name, contents, content_hash, payload_
             the uploaded file
         name (str): desired name of the Lambda function. Will be used to
             construct a key name for the uploaded file.
-        contents (str): byte string with the content of the file upload.
+        contents (Union[bytes, IO[bytes]]): Content of the file to upload.
+            File objects are streamed to S3 using a multipart upload when
+            they are large.
         content_hash (str): md5 hash of the contents to be uploaded.
         payload_acl (str): The canned S3 object ACL to be applied to the
             uploaded payload
@@ -707,12 +1000,13 @@ def _upload_code(s3_conn, bucket, prefix, name, contents, content_hash, payload_
         LOGGER.info("object already exists; not uploading: %s", key)
     else:
         LOGGER.info("uploading object: %s", key)
-        s3_conn.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=contents,
-            ContentType="application/zip",
-            ACL=payload_acl,
+        if isinstance(contents, bytes):
+            contents = BytesIO(contents)
+        s3_conn.upload_fileobj(
+            contents,
+            bucket,
+            key,
+            ExtraArgs={"ContentType": "application/zip", "ACL": payload_acl},
         )
 
     return Code(S3Bucket=bucket, S3Key=key)
@@ -826,9 +1120,12 @@ def _upload_function(
             root, includes, excludes, follow_symlinks
         )
 
-    return _upload_code(
-        s3_conn, bucket, prefix, name, zip_contents, content_hash, payload_acl
-    )
+    try:
+        return _upload_code(
+            s3_conn, bucket, prefix, name, zip_contents, content_hash, payload_acl
+        )
+    finally:
+        zip_contents.close()
 
 
 def select_bucket_region(
@@ -898,11 +1195,24 @@ def upload_lambda_functions(context, provider, **kwargs):
             ``False``)
         payload_acl (Optional[str]): The canned S3 object ACL to be applied
             to the uploaded payload. (*default: private*)
+        concurrency (Optional[int]): Number of functions to package and
+            upload at the same time. When greater than ``1``, the output of
+            ``pip`` is logged with the name of the function it belongs to.
+            (*default:* ``1``)
         functions (Dict[str, Any]): Configurations of desired payloads to
             build. Keys correspond to function names, used to derive key
             names for the payload. Each value should itself be a dictionary,
             with the following data:
 
+            **cache_dependencies (Optional[bool])**
+                Cache the dependencies installed by ``pip`` in
+                ``~/.runway_cache/lambda_dependencies``. They are only
+                installed again when the requirements, python interpreter,
+                or Docker image change. The 25 most recently used sets of
+                dependencies are kept. Disable this if the requirements
+                are not pinned to specific versions and should be updated
+                on every run. (*default: true*)
+
             **docker_file (Optional[str])**
                 Path to a local DockerFile that will be built and used for
                 ``dockerize_pip``. Must provide exactly one of ``docker_file``,
@@ -1060,23 +1370,48 @@ def upload_lambda_functions(context, provider, **kwargs):
     ensure_s3_bucket(s3_client, bucket_name, bucket_region)
 
     prefix = kwargs.get("prefix", "")
+    sys_path = (
+        os.path.dirname(context.config_path)
+        if os.path.isfile(context.config_path)
+        else context.config_path
+    )
+    functions = list(kwargs["functions"].items())
+    concurrency = min(int(kwargs.get("concurrency", 1)), len(functions)) or 1
+
+    def _process(function):
+        """Package and upload a function."""
+        name, options = function
+        _FUNCTION_STATE.name = name
+        _FUNCTION_STATE.capture_output = concurrency > 1
+        try:
+            return _upload_function(
+                s3_client,
+                bucket_name,
+                prefix,
+                name,
+                options,
+                follow_symlinks,
+                payload_acl,
+                sys_path,
+            )
+        finally:
+            _FUNCTION_STATE.name = None
+            _FUNCTION_STATE.capture_output = False
 
+    if concurrency > 1:
+        LOGGER.info("processing %s functions in parallel...", len(functions))
+        pool = ThreadPool(concurrency)
+        try:
+            codes = pool.map(_process, functions)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        codes = [_process(function) for function in functions]
+
+    # results are in the order the functions were defined
     results = {}
-    for name, options in kwargs["functions"].items():
-        sys_path = (
-            os.path.dirname(context.config_path)
-            if os.path.isfile(context.config_path)
-            else context.config_path
-        )
-        results[name] = _upload_function(
-            s3_client,
-            bucket_name,
-            prefix,
-            name,
-            options,
-            follow_symlinks,
-            payload_acl,
-            sys_path,
-        )
+    for (name, _options), code in zip(functions, codes):
+        results[name] = code
 
     return results
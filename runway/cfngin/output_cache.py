@@ -0,0 +1,103 @@
+"""CloudFormation stack output caching."""
+import logging
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+
+class OutputCache(object):
+    """Thread-safe cache of CloudFormation stack outputs.
+
+    Outputs are keyed on ``(account, region, stack_name)`` where the account
+    is identified by the access key of the credentials used to describe the
+    stack. Each stack is only described once, even if it is requested by
+    multiple threads at the same time.
+
+    Entries are removed with :meth:`invalidate` when a stack is changed.
+
+    """
+
+    def __init__(self):
+        """Instantiate class."""
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._outputs = {}
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def stats(self):
+        """Number of times outputs were reused or retrieved.
+
+        Returns:
+            Dict[str, int]
+
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def get(self, access_key, region, stack_name, fetch):
+        """Get the outputs of a stack.
+
+        Args:
+            access_key (Optional[str]): Access key of the credentials used to
+                describe the stack.
+            region (Optional[str]): Region of the stack.
+            stack_name (str): Name of the stack.
+            fetch (Callable[[str], Dict[str, str]]): Called with the name of
+                the stack to retrieve its outputs if they are not cached.
+                Exceptions raised by it are not cached.
+
+        Returns:
+            Dict[str, str]: Outputs of the stack.
+
+        """
+        key = (access_key, region, stack_name)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._outputs:
+                    self._stats["hits"] += 1
+                    return dict(self._outputs[key])
+                self._stats["misses"] += 1
+            outputs = fetch(stack_name)
+            with self._lock:
+                self._outputs[key] = outputs
+        return dict(outputs)
+
+    def invalidate(self, stack_name=None, region=None):
+        """Remove outputs from the cache.
+
+        Args:
+            stack_name (Optional[str]): Only remove the outputs of stacks with
+                this name, regardless of account.
+            region (Optional[str]): Only remove the outputs of stacks in this
+                region.
+
+        If neither argument is provided, all outputs are removed.
+
+        """
+        with self._lock:
+            for key in list(self._outputs):
+                if (stack_name and key[2] != stack_name) or (
+                    region and key[1] != region
+                ):
+                    continue
+                del self._outputs[key]
+
+
+OUTPUT_CACHE = OutputCache()
+
+
+def get_access_key(session):
+    """Get the access key of the credentials used by a boto3 session.
+
+    Args:
+        session (boto3.Session): Session to get the access key from.
+
+    Returns:
+        Optional[str]
+
+    """
+    credentials = session.get_credentials()
+    return credentials.access_key if credentials else None
@@ -24,6 +24,14 @@ from .util import merge_map, stack_template_key_name
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of seconds changes to the persistent graph are collected before they
+# are uploaded together.
+PERSISTENT_GRAPH_WRITE_DELAY = 2
+
+# Maximum number of seconds a step waits for its watch function to be ready
+# before running.
+WATCHER_READY_TIMEOUT = 30
+
 
 def json_serial(obj):
     """Serialize json.
@@ -74,7 +82,8 @@ class Step(object):
             this step
         status (:class:`runway.cfngin.status.Status`): The status of step.
         watch_func (Optional[Callable]): Function that will be called to
-            "tail" the step action.
+            "tail" the step action. It is passed a ``ready`` keyword argument
+            that it sets once it is watching the stack.
 
     """
 
@@ -108,10 +117,15 @@ class Step(object):
         stop_watcher = threading.Event()
         watcher = None
         if self.watch_func:
+            watcher_ready = threading.Event()
             watcher = threading.Thread(
-                target=self.watch_func, args=(self.stack, stop_watcher)
+                target=self.watch_func,
+                args=(self.stack, stop_watcher),
+                kwargs={"ready": watcher_ready},
             )
             watcher.start()
+            # ensure changes made by this step are seen by the watcher
+            watcher_ready.wait(WATCHER_READY_TIMEOUT)
 
         try:
             while not self.done:
@@ -598,6 +612,91 @@ class Graph(object):
         return self.dumps()
 
 
+class PersistentGraphWriter(object):
+    """Upload changes made to the persistent graph from a background thread.
+
+    Changes made within ``delay`` seconds of each other are uploaded together
+    and pending changes are uploaded when the writer is closed.
+
+    Attributes:
+        context (:class:`runway.cfngin.context.Context`): Context object.
+        delay (float): Number of seconds to collect changes before uploading.
+        error (Optional[Exception]): Error raised while uploading the
+            persistent graph. No further uploads are attempted once set.
+        lock (threading.Lock): Held while the persistent graph is being
+            changed or uploaded.
+        lock_code (str): Code used to lock the persistent graph.
+
+    """
+
+    def __init__(self, context, lock_code, delay=PERSISTENT_GRAPH_WRITE_DELAY):
+        """Instantiate class.
+
+        Args:
+            context (:class:`runway.cfngin.context.Context`): Context object.
+            lock_code (str): Code used to lock the persistent graph.
+            delay (float): Number of seconds to collect changes before
+                uploading.
+
+        """
+        self.context = context
+        self.delay = delay
+        self.error = None
+        self.lock = threading.Lock()
+        self.lock_code = lock_code
+        self._changed = threading.Event()
+        self._pending = False
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        """Start the background thread."""
+        self._thread.start()
+
+    def close(self):
+        """Upload pending changes and stop the background thread."""
+        self._closed.set()
+        self._changed.set()
+        self._thread.join()
+
+    def update(self, func, *args, **kwargs):
+        """Change the persistent graph and schedule it to be uploaded.
+
+        Args:
+            func (Callable): Method of the persistent graph to call.
+
+        """
+        with self.lock:
+            func(*args, **kwargs)
+            self._pending = True
+        self._changed.set()
+
+    def _run(self):
+        """Upload the persistent graph after it has been changed."""
+        while True:
+            self._changed.wait()
+            self._closed.wait(self.delay)
+            self._changed.clear()
+            self._write()
+            if self._closed.is_set() and not self._changed.is_set():
+                return
+
+    def _write(self):
+        """Upload the persistent graph if it has pending changes."""
+        if self.error:
+            return
+        try:
+            with self.lock:
+                if not self._pending:
+                    return
+                self._pending = False
+                self.context.put_persistent_graph(self.lock_code)
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.debug("failed to update the persistent graph", exc_info=True)
+            self.error = err
+
+
 class Plan(object):
     """A convenience class for working on a Graph.
 
@@ -734,11 +833,23 @@ class Plan(object):
     def walk(self, walker):
         """Walk each step in the underlying graph, in topological order.
 
+        Changes to the persistent graph are uploaded by a
+        :class:`PersistentGraphWriter` and any that are pending are uploaded
+        once the walk completes or fails. If an upload fails, the walk is
+        canceled; steps that have not started are skipped.
+
         Args:
             walker (func): a walker function to be passed to
                 :class:`runway.cfngin.dag.DAG` to walk the graph.
 
+        Raises:
+            Exception: Error raised while uploading the persistent graph.
+
         """
+        writer = None
+        if self.context and self.context.persistent_graph:
+            writer = PersistentGraphWriter(self.context, self.lock_code)
+            writer.start()
 
         def walk_func(step):
             """Execute a :class:`Step` wile walking the graph.
@@ -760,9 +871,15 @@ class Plan(object):
                     step.set_status(FailedStatus("dependency has failed"))
                     return step.ok
 
+            # steps are not run once the persistent graph can't be updated
+            # so the changes they make are not lost
+            if writer and writer.error:
+                step.set_status(SkippedStatus("canceled execution"))
+                return step.ok
+
             result = step.run()
 
-            if not self.context or not self.context.persistent_graph:
+            if not writer or writer.error:
                 return result
 
             if step.completed or (
@@ -770,21 +887,29 @@ class Plan(object):
                 and step.status.reason == ("does not exist in cloudformation")
             ):
                 if step.fn.__name__ == "_destroy_stack":
-                    self.context.persistent_graph.pop(step)
+                    writer.update(self.context.persistent_graph.pop, step)
                     LOGGER.debug(
                         "removed step '%s' from the persistent graph", step.name
                     )
                 elif step.fn.__name__ == "_launch_stack":
-                    self.context.persistent_graph.add_step_if_not_exists(
-                        step, add_dependencies=True, add_dependants=True
+                    writer.update(
+                        self.context.persistent_graph.add_step_if_not_exists,
+                        step,
+                        add_dependencies=True,
+                        add_dependants=True,
                     )
                     LOGGER.debug("added step '%s' to the persistent graph", step.name)
-                else:
-                    return result
-                self.context.put_persistent_graph(self.lock_code)
             return result
 
-        return self.graph.walk(walker, walk_func)
+        if not writer:
+            return self.graph.walk(walker, walk_func)
+        try:
+            result = self.graph.walk(walker, walk_func)
+        finally:
+            writer.close()
+        if writer.error:
+            raise writer.error  # pylint: disable=raising-bad-type
+        return result
 
     @property
     def lock_code(self):
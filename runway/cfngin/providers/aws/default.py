@@ -2,11 +2,14 @@
 # pylint: disable=too-many-lines,too-many-public-methods
 import json
 import logging
+import os
 import sys
 import time
-from threading import Lock  # thread safe, memoize, provider builder.
+from collections import deque
+from threading import Condition, Lock, Thread  # thread safe, memoize, provider builder.
 
 import botocore.exceptions
+import six
 import yaml
 from botocore.config import Config
 from six.moves import urllib
@@ -16,6 +19,7 @@ from runway.util import DOC_SITE, JsonEncoder
 from ... import exceptions
 from ...actions.diff import DictValue, diff_parameters
 from ...actions.diff import format_params_diff as format_diff
+from ...output_cache import OUTPUT_CACHE, get_access_key
 from ...session_cache import get_session
 from ...ui import ui
 from ...util import parse_cloudformation_template
@@ -48,6 +52,17 @@ MAX_ATTEMPTS = 10
 MAX_TAIL_RETRIES = 15
 TAIL_RETRY_SLEEP = 1
 GET_EVENTS_SLEEP = 1
+TAIL_SLEEP = 5
+
+# Maximum number of event IDs remembered per stack while tailing. Pagination
+# stops at the first event that has been seen so only the most recent events
+# need to be remembered.
+MAX_SEEN_EVENTS = 1000
+
+# Time between calls to DescribeStacks made by a StackPoller. A single call is
+# made for all stacks in a region so this can be much lower than the
+# STACK_POLL_TIME used by actions without impacting API rate limits.
+STACK_STATUS_POLL_TIME = int(os.environ.get("CFNGIN_STACK_STATUS_POLL_TIME", 5))
 DEFAULT_CAPABILITIES = ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"]
 
 
@@ -514,12 +529,329 @@ def generate_stack_policy_args(stack_policy=None):
     return args
 
 
+class SeenEvents(object):
+    """Bounded collection of the IDs of stack events that have been seen.
+
+    Once full, the oldest IDs are forgotten as new IDs are added.
+
+    """
+
+    def __init__(self, maxlen=MAX_SEEN_EVENTS):
+        """Instantiate class.
+
+        Args:
+            maxlen (int): Maximum number of event IDs to remember.
+
+        """
+        self.maxlen = maxlen
+        self._ids = set()
+        self._order = deque()
+
+    def add(self, event_id):
+        """Add an event ID."""
+        if event_id in self._ids:
+            return
+        self._ids.add(event_id)
+        self._order.append(event_id)
+        if len(self._order) > self.maxlen:
+            self._ids.discard(self._order.popleft())
+
+    def __contains__(self, event_id):
+        """Whether an event ID has been seen."""
+        return event_id in self._ids
+
+    def __len__(self):
+        """Number of event IDs remembered."""
+        return len(self._order)
+
+
+class StackEventTailer(object):
+    """Tail the events of many stacks from a single thread.
+
+    Stacks are registered using :meth:`watch`. While any stack is registered,
+    a background thread fetches the new events of each stack once every
+    ``interval`` and passes them to the log function of the stack.
+
+    """
+
+    def __init__(self, provider, interval=None):
+        """Instantiate class.
+
+        Args:
+            provider (Provider): Provider used to get stack events.
+            interval (Optional[int]): Seconds between fetching events.
+
+        """
+        self.provider = provider
+        self.interval = TAIL_SLEEP if interval is None else interval
+        self._lock = Lock()
+        self._stacks = {}  # stack name -> state of the tailed stack
+        self._thread = None
+
+    def watch(  # pylint: disable=too-many-arguments
+        self,
+        stack_name,
+        cancel,
+        log_func,
+        action=None,
+        retries=MAX_TAIL_RETRIES,
+        ready=None,
+    ):
+        """Tail the events of a stack until canceled.
+
+        Events that exist when this is called are marked as seen before
+        ``ready`` is set so only events created after it is set are logged.
+        If the stack does not exist yet, it is retried until it does and all
+        of its events are logged.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            cancel (threading.Event): Stops tailing the stack when set.
+            log_func (Callable[[Dict[str, Any]], None]): Function called for
+                each new event.
+            action (Optional[str]): Name of the action being run.
+            retries (int): Number of times to check if a stack that does not
+                exist has been created before giving up.
+            ready (Optional[threading.Event]): Set once existing events have
+                been marked as seen.
+
+        Raises:
+            botocore.exceptions.ClientError: The stack still does not exist
+                after ``retries`` attempts.
+
+        """
+        seen = SeenEvents()
+        attempts = 0
+        try:
+            while True:
+                attempts += 1
+                try:
+                    if attempts == 1:
+                        self.provider.prime_seen_events(stack_name, seen)
+                    else:  # stack was created after tailing started
+                        for event in self.provider.get_new_events(stack_name, seen):
+                            log_func(event)
+                    break
+                except botocore.exceptions.ClientError as err:
+                    if "does not exist" not in str(err):
+                        raise
+                    LOGGER.debug(
+                        "%s:unable to tail stack; it does not exist", stack_name
+                    )
+                    if action == "destroy":
+                        LOGGER.debug(
+                            "%s:stack was deleted before it could be tailed",
+                            stack_name,
+                        )
+                        return
+                    if attempts >= retries:
+                        raise
+                    if ready:
+                        ready.set()  # nothing to mark as seen
+                    if cancel.wait(TAIL_RETRY_SLEEP):
+                        return
+        finally:
+            if ready:
+                ready.set()
+
+        state = {"log_func": log_func, "seen": seen}
+        with self._lock:
+            self._stacks[stack_name] = state
+            if not self._thread:
+                self._thread = Thread(target=self._run, name="StackEventTailer")
+                self._thread.daemon = True
+                self._thread.start()
+        try:
+            cancel.wait()
+        finally:
+            with self._lock:
+                if self._stacks.get(stack_name) is state:
+                    del self._stacks[stack_name]
+
+    def _run(self):
+        """Fetch new events while stacks are registered."""
+        while True:
+            with self._lock:
+                if not self._stacks:
+                    self._thread = None
+                    return
+                stacks = list(self._stacks.items())
+            for stack_name, state in stacks:
+                try:
+                    self._tail_once(stack_name, state)
+                except botocore.exceptions.ClientError as err:
+                    # stack might be in the process of launching or deleted
+                    LOGGER.debug("%s:unable to tail stack: %s", stack_name, err)
+            time.sleep(self.interval)
+
+    def _tail_once(self, stack_name, state):
+        """Log new events of a stack."""
+        for event in self.provider.get_new_events(stack_name, state["seen"]):
+            state["log_func"](event)
+
+
+class StackPoller(object):
+    """Poll the status of all stacks in a region with a single API call.
+
+    Steps that are waiting on a stack register it with the poller using
+    :meth:`wait`. While any stack is registered, a background thread lists all
+    stacks in the region once every ``interval`` using a paginated
+    ``describe_stacks`` call and wakes the waiting steps whose stack has
+    changed status. The thread exits once no stacks are registered and is
+    started again when needed.
+
+    """
+
+    def __init__(self, cloudformation, interval=None):
+        """Instantiate class.
+
+        Args:
+            cloudformation (botocore.client.CloudFormation): CloudFormation
+                client used to describe stacks.
+            interval (Optional[int]): Seconds between calls to
+                ``describe_stacks``.
+
+        """
+        self.cloudformation = cloudformation
+        self.interval = STACK_STATUS_POLL_TIME if interval is None else interval
+        self._condition = Condition()
+        self._fresh = {}  # stack name -> stack returned by the latest wait
+        self._polled_at = 0.0  # start time of the latest successful poll
+        self._reported = {}  # stack name -> status last returned by get_stack
+        self._stacks = {}  # stack name -> stack from the latest poll
+        self._thread = None
+        self._waiting = {}  # stack name -> number of waiting threads
+
+    def get_stack(self, stack_name):
+        """Get the stack data observed by the last call to :meth:`wait`.
+
+        The result is only returned once so subsequent calls need to
+        :meth:`wait` again to receive fresh data.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+
+        Returns:
+            Optional[Dict[str, Any]]: Stack data or ``None`` if there is no
+            fresh data for the stack.
+
+        Raises:
+            StackDoesNotExist: The latest poll did not find the stack.
+
+        """
+        with self._condition:
+            if stack_name not in self._fresh:
+                return None
+            stack = self._fresh.pop(stack_name)
+            self._reported[stack_name] = self._get_status(stack)
+        if not stack:
+            raise exceptions.StackDoesNotExist(stack_name)
+        return stack
+
+    def wait(self, stack_name, cancel, timeout):
+        """Wait for the status of a stack to change.
+
+        Returns once a poll started after this method was called observes a
+        status that differs from the one last returned by :meth:`get_stack`,
+        execution is canceled, or ``timeout`` elapses.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            cancel (threading.Event): Cancel handler.
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            bool: Whether execution was canceled while waiting.
+
+        """
+        since = time.time()
+        deadline = since + timeout
+        with self._condition:
+            self._fresh.pop(stack_name, None)
+            self._waiting[stack_name] = self._waiting.get(stack_name, 0) + 1
+            self._start()
+            self._condition.notify_all()
+            try:
+                while not cancel.is_set():
+                    if self._polled_at >= since:
+                        stack = self._stacks.get(stack_name)
+                        if self._get_status(stack) != self._reported.get(
+                            stack_name, ""
+                        ):
+                            self._fresh[stack_name] = stack
+                            return False
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        if self._polled_at >= since:
+                            self._fresh[stack_name] = self._stacks.get(stack_name)
+                        return False
+                    # wake up at least once per second to check for cancel
+                    self._condition.wait(min(remaining, 1))
+                return True
+            finally:
+                self._waiting[stack_name] -= 1
+                if not self._waiting[stack_name]:
+                    del self._waiting[stack_name]
+
+    @staticmethod
+    def _get_status(stack):
+        """Get the status of a stack or ``None`` if it does not exist."""
+        return stack["StackStatus"] if stack else None
+
+    def _poll(self):
+        """List all stacks in the region.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stack data keyed by stack name.
+
+        """
+        stacks = {}
+        paginator = self.cloudformation.get_paginator("describe_stacks")
+        for page in paginator.paginate():
+            for stack in page["Stacks"]:
+                stacks[stack["StackName"]] = stack
+        return stacks
+
+    def _run(self):
+        """Poll for stack status while threads are waiting."""
+        while True:
+            with self._condition:
+                if not self._waiting:
+                    self._thread = None
+                    return
+            started = time.time()
+            try:
+                stacks = self._poll()
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("failed to poll stack status: %s", err)
+                stacks = None
+            with self._condition:
+                if stacks is not None:
+                    self._stacks = stacks
+                    self._polled_at = started
+                self._condition.notify_all()
+            time.sleep(self.interval)
+
+    def _start(self):
+        """Start the polling thread if it is not already running.
+
+        Must be called while holding the condition lock.
+
+        """
+        if self._thread:
+            return
+        self._thread = Thread(target=self._run, name="StackPoller")
+        self._thread.daemon = True
+        self._thread.start()
+
+
 class ProviderBuilder(object):  # pylint: disable=too-few-public-methods
     """Implements a Memorized ProviderBuilder for the AWS provider."""
 
     def __init__(self, region=None, **kwargs):
         """Instantiate class."""
         self.region = region
+        kwargs.setdefault("poll_stacks", True)
         self.kwargs = kwargs
         self.providers = {}
         self.lock = Lock()
@@ -604,11 +936,17 @@ class Provider(BaseProvider):
         replacements_only=False,
         recreate_failed=False,
         service_role=None,
+        poll_stacks=False,
     ):
         """Instantiate class."""
+        self._access_key = None
         self._outputs = {}
+        self._templates = {}
+        self._session = session
         self.region = region
         self.cloudformation = get_cloudformation_client(session)
+        self.stack_poller = StackPoller(self.cloudformation) if poll_stacks else None
+        self.stack_tailer = StackEventTailer(self) if poll_stacks else None
         self.interactive = interactive
         # replacements only is only used in interactive mode
         self.replacements_only = interactive and replacements_only
@@ -616,7 +954,16 @@ class Provider(BaseProvider):
         self.service_role = service_role
 
     def get_stack(self, stack_name, *args, **kwargs):  # pylint: disable=unused-argument
-        """Get stack."""
+        """Get stack.
+
+        If the stack was just observed by :meth:`poll_stack`, the result of
+        the shared poll is returned instead of calling the API again.
+
+        """
+        if self.stack_poller:
+            stack = self.stack_poller.get_stack(stack_name)
+            if stack:
+                return stack
         try:
             return self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][
                 0
@@ -626,6 +973,25 @@ class Provider(BaseProvider):
                 raise
             raise exceptions.StackDoesNotExist(stack_name)
 
+    def poll_stack(self, stack_name, cancel, timeout):
+        """Wait for the status of a stack to change.
+
+        When stack polling is enabled, this returns as soon as the shared
+        :class:`StackPoller` for the region observes a change in status.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            cancel (threading.Event): Cancel handler.
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            bool: Whether execution was canceled while waiting.
+
+        """
+        if not self.stack_poller or not timeout:
+            return cancel.wait(timeout)
+        return self.stack_poller.wait(stack_name, cancel, timeout)
+
     def get_stack_status(  # pylint: disable=unused-argument
         self, stack, *args, **kwargs
     ):
@@ -666,8 +1032,23 @@ class Provider(BaseProvider):
         """Whether the status of the stack indicates if 'review in progress'."""
         return self.get_stack_status(stack) == self.REVIEW_STATUS
 
-    def tail_stack(self, stack, cancel, action=None, log_func=None, retries=None):
-        """Tail the events of a stack."""
+    def tail_stack(  # pylint: disable=too-many-arguments
+        self, stack, cancel, action=None, log_func=None, retries=None, ready=None
+    ):
+        """Tail the events of a stack.
+
+        Args:
+            stack (:class:`runway.cfngin.stack.Stack`): Stack to tail.
+            cancel (threading.Event): Stops tailing the stack when set.
+            action (Optional[str]): Name of the action being run.
+            log_func (Optional[Callable[[Dict[str, Any]], None]]): Function
+                called for each new event.
+            retries (Optional[int]): Number of times to retry tailing a stack
+                that does not exist.
+            ready (Optional[threading.Event]): Set once tailing has started
+                and only new events will be logged.
+
+        """
 
         def _log_func(event):
             template = "[%s] %s %s %s"
@@ -686,6 +1067,19 @@ class Provider(BaseProvider):
 
         LOGGER.debug("%s:tailing stack...", stack.fqn)
 
+        if self.stack_tailer:
+            self.stack_tailer.watch(
+                stack.fqn,
+                cancel,
+                log_func,
+                action=action,
+                retries=retries,
+                ready=ready,
+            )
+            return
+
+        if ready:
+            ready.set()
         attempts = 0
         while True:
             attempts += 1
@@ -730,14 +1124,66 @@ class Provider(BaseProvider):
                 )
             else:
                 events = self.cloudformation.describe_stack_events(StackName=stack_name)
-            event_list.append(events["StackEvents"])
+            event_list.extend(events["StackEvents"])
             next_token = events.get("NextToken", None)
             if next_token is None:
                 break
             time.sleep(GET_EVENTS_SLEEP)
         if chronological:
-            return reversed(sum(event_list, []))
-        return sum(event_list, [])
+            return reversed(event_list)
+        return event_list
+
+    def get_new_events(self, stack_name, seen):
+        """Get the events that have not been seen in chronological order.
+
+        Events are returned by the API newest first so batches are only
+        retrieved until an event that has been seen is found. If no events
+        have been seen, only the first batch is retrieved.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            seen (SeenEvents): IDs of events that have been seen. New events
+                are added to it.
+
+        Returns:
+            List[Dict[str, Any]]: New events in chronological order.
+
+        """
+        next_token = None
+        event_list = []
+        while True:
+            if next_token is not None:
+                events = self.cloudformation.describe_stack_events(
+                    StackName=stack_name, NextToken=next_token
+                )
+            else:
+                events = self.cloudformation.describe_stack_events(StackName=stack_name)
+            found_seen = False
+            for event in events["StackEvents"]:
+                if event["EventId"] in seen:
+                    found_seen = True
+                    break
+                event_list.append(event)
+            next_token = events.get("NextToken", None)
+            if found_seen or next_token is None or not seen:
+                break
+            time.sleep(GET_EVENTS_SLEEP)
+        event_list.reverse()
+        for event in event_list:
+            seen.add(event["EventId"])
+        return event_list
+
+    def prime_seen_events(self, stack_name, seen):
+        """Mark the most recent batch of events of a stack as seen.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            seen (SeenEvents): IDs of events that have been seen.
+
+        """
+        events = self.cloudformation.describe_stack_events(StackName=stack_name)
+        for event in reversed(events["StackEvents"]):
+            seen.add(event["EventId"])
 
     def get_rollback_status_reason(self, stack_name):
         """Process events and returns latest roll back reason."""
@@ -768,26 +1214,25 @@ class Provider(BaseProvider):
         stack_name,
         cancel,
         log_func=_tail_print,
-        sleep_time=5,
+        sleep_time=TAIL_SLEEP,
         include_initial=True,
     ):
         """Show and then tail the event log."""
         # First dump the full list of events in chronological order and keep
-        # track of the events we've seen already
-        seen = set()
-        initial_events = self.get_events(stack_name)
-        for event in initial_events:
-            if include_initial:
+        # track of the events we've seen already. If they aren't being shown,
+        # only the latest events are needed to know where to start tailing.
+        seen = SeenEvents()
+        if include_initial:
+            for event in self.get_events(stack_name):
                 log_func(event)
-            seen.add(event["EventId"])
+                seen.add(event["EventId"])
+        else:
+            self.prime_seen_events(stack_name, seen)
 
         # Now keep looping through and dump the new events
         while True:
-            events = self.get_events(stack_name)
-            for event in events:
-                if event["EventId"] not in seen:
-                    log_func(event)
-                    seen.add(event["EventId"])
+            for event in self.get_new_events(stack_name, seen):
+                log_func(event)
             if cancel.wait(sleep_time):
                 return
 
@@ -1341,11 +1786,34 @@ class Provider(BaseProvider):
         return stack["Tags"]
 
     def get_outputs(self, stack_name, *args, **kwargs):
-        """Get stack outputs."""
-        if not self._outputs.get(stack_name):
-            stack = self.get_stack(stack_name)
-            self._outputs[stack_name] = get_output_dict(stack)
-        return self._outputs[stack_name]
+        """Get stack outputs.
+
+        Outputs are retrieved from the shared
+        :data:`runway.cfngin.output_cache.OUTPUT_CACHE` so each stack is only
+        described once per account and region. Outputs inferred by
+        :meth:`get_stack_changes` take precedence.
+
+        """
+        if stack_name in self._outputs:
+            return self._outputs[stack_name]
+        if not self._access_key:
+            self._access_key = get_access_key(self._session)
+        return OUTPUT_CACHE.get(
+            self._access_key,
+            self.cloudformation.meta.region_name,
+            stack_name,
+            lambda name: get_output_dict(self.get_stack(name)),
+        )
+
+    def invalidate_outputs(self, stack_name):
+        """Remove the cached outputs of a stack after it has been changed.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+
+        """
+        self._outputs.pop(stack_name, None)
+        OUTPUT_CACHE.invalidate(stack_name, region=self.cloudformation.meta.region_name)
 
     @staticmethod
     def get_output_dict(stack):
@@ -1358,24 +1826,116 @@ class Provider(BaseProvider):
         Returns:
             Tuple[str, Dict[str, Any]]
 
+        """
+        parameters = self.params_as_dict(stack.get("Parameters", []))
+        return json.dumps(self.get_stack_template(stack), cls=JsonEncoder), parameters
+
+    def get_stack_template(self, stack):
+        """Get the template of the stack currently in AWS.
+
+        Templates are cached using the ID of the stack and the time it was
+        last updated so each version of a template is only retrieved once.
+
+        Args:
+            stack (Dict[str, Any]): Stack returned by :meth:`get_stack`.
+
+        Returns:
+            Dict[str, Any]: Parsed template.
+
         """
         stack_name = stack["StackId"]
+        key = (stack_name, stack.get("LastUpdatedTime", stack.get("CreationTime")))
+
+        if key not in self._templates:
+            try:
+                template = self.cloudformation.get_template(StackName=stack_name)[
+                    "TemplateBody"
+                ]
+            except botocore.exceptions.ClientError as err:
+                if "does not exist" not in str(err):
+                    raise
+                raise exceptions.StackDoesNotExist(stack_name)
+
+            if isinstance(template, str):  # handle yaml templates
+                template = parse_cloudformation_template(template)
+            self._templates[key] = template
+        return self._templates[key]
+
+    def is_stack_unchanged(self, stack_name, template, parameters, tags):
+        """Determine if a stack already matches a template without a ChangeSet.
+
+        The template, parameters, and tags are compared to those of the stack
+        currently in AWS. A stack is only considered unchanged if this can be
+        determined locally so stacks that use a transform, nested stacks,
+        ``NoEcho`` parameters, SSM parameter types, or dynamic references are
+        always considered changed.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            template (str): Template body to compare.
+            parameters (List[Dict[str, Any]]): A list of dictionaries that
+                defines the parameter list to be applied to the Cloudformation
+                stack.
+            tags (List[Dict[str, Any]]): A list of dictionaries that defines
+                the tags that should be applied to the Cloudformation stack.
 
+        Returns:
+            bool
+
+        """
         try:
-            template = self.cloudformation.get_template(StackName=stack_name)[
-                "TemplateBody"
-            ]
-        except botocore.exceptions.ClientError as err:
-            if "does not exist" not in str(err):
-                raise
-            raise exceptions.StackDoesNotExist(stack_name)
+            stack = self.get_stack(stack_name)
+            if not self.is_stack_completed(stack) or self.is_stack_destroyed(stack):
+                return False
+            old_template = self.get_stack_template(stack)
+        except exceptions.StackDoesNotExist:
+            return False
 
-        parameters = self.params_as_dict(stack.get("Parameters", []))
+        new_template = parse_cloudformation_template(template)
+        new_template_json = json.dumps(new_template, cls=JsonEncoder, sort_keys=True)
+        if (
+            "Transform" in new_template
+            or any(
+                resource.get("Type") == "AWS::CloudFormation::Stack"
+                for resource in new_template.get("Resources", {}).values()
+            )
+            or any(
+                str(definition.get("Type", "")).startswith("AWS::SSM::Parameter::")
+                for definition in new_template.get("Parameters", {}).values()
+            )
+            or "{{resolve:" in new_template_json
+        ):
+            # the result depends on more than the template (e.g. values
+            # resolved by CloudFormation that could have changed)
+            return False
+        if (
+            json.dumps(old_template, cls=JsonEncoder, sort_keys=True)
+            != new_template_json
+        ):
+            return False
 
-        if isinstance(template, str):  # handle yaml templates
-            template = parse_cloudformation_template(template)
+        old_params = self.params_as_dict(stack.get("Parameters", []))
+        if "****" in old_params.values():  # NoEcho values are masked
+            return False
+        new_params = {
+            x["ParameterKey"]: old_params.get(x["ParameterKey"])
+            if x.get("UsePreviousValue")
+            else x["ParameterValue"]
+            for x in parameters
+        }
+        for key, definition in new_template.get("Parameters", {}).items():
+            if key not in new_params and "Default" in definition:
+                # CloudFormation returns the values of parameters as strings
+                new_params[key] = (
+                    definition["Default"]
+                    if isinstance(definition["Default"], six.string_types)
+                    else str(definition["Default"])
+                )
+        if diff_parameters(old_params, new_params):
+            return False
 
-        return json.dumps(template, cls=JsonEncoder), parameters
+        old_tags = {x["Key"]: x["Value"] for x in stack.get("Tags", [])}
+        return old_tags == {x["Key"]: x["Value"] for x in tags}
 
     def get_stack_changes(self, stack, template, parameters, tags):
         """Get the changes from a ChangeSet.
@@ -1457,7 +2017,7 @@ class Provider(BaseProvider):
         self.cloudformation.delete_change_set(ChangeSetName=change_set_id)
 
         # ensure current stack outputs are loaded
-        self.get_outputs(stack.fqn)
+        self._outputs[stack.fqn] = self.get_outputs(stack.fqn)
 
         # infer which outputs may have changed
         refs_to_invalidate = []
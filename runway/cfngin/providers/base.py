@@ -22,6 +22,15 @@ class BaseProvider(object):
         """Abstract method."""
         not_implemented("get_stack")
 
+    def poll_stack(self, stack_name, cancel, timeout):
+        """Wait for the status of a stack to change.
+
+        Returns:
+            bool: Whether execution was canceled while waiting.
+
+        """
+        return cancel.wait(timeout)
+
     def create_stack(self, *args, **kwargs):
         """Abstract method."""
         not_implemented("create_stack")
@@ -42,6 +51,9 @@ class BaseProvider(object):
         """Abstract method."""
         not_implemented("get_outputs")
 
+    def invalidate_outputs(self, stack_name):
+        """Remove the cached outputs of a stack after it has been changed."""
+
     def get_output(self, stack, output):
         """Abstract method."""
         return self.get_outputs(stack)[output]
@@ -1,7 +1,9 @@
 """CFNgin session caching."""
 import logging
 import os
+import threading
 import warnings
+from collections import OrderedDict
 
 import boto3
 
@@ -20,12 +22,217 @@ DEPRECATION_MSG = (
 # inherently threadsafe thanks to the GIL:
 # https://docs.python.org/3/glossary.html#term-global-interpreter-lock
 CREDENTIAL_CACHE = {}
+# Environment variables that change the credentials of a session that was not
+# given a profile or keys.
+CREDENTIAL_ENV_VARS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+)
+#: Maximum number of sessions kept by a :class:`SessionPool`.
+SESSION_POOL_MAX_SIZE = 64
+
+
+class PooledSession(boto3.Session):
+    """boto3 session that reuses the clients it creates.
+
+    Clients are only reused when they are created using the default
+    configuration of the session (e.g. no ``config`` or ``endpoint_url``).
+
+    """
+
+    def __init__(self, pool, *args, **kwargs):
+        """Instantiate class.
+
+        Args:
+            pool (SessionPool): Pool the session belongs to. Used to record
+                statistics.
+
+        """
+        super(PooledSession, self).__init__(*args, **kwargs)
+        self._clients = {}
+        self._client_lock = threading.Lock()
+        self._pool = pool
+
+    def client(  # pylint: disable=arguments-differ
+        self, service_name, region_name=None, **kwargs
+    ):
+        """Create or reuse a low-level service client by name."""
+        if kwargs:
+            self._pool.record("client", hit=False)
+            return super(PooledSession, self).client(
+                service_name, region_name=region_name, **kwargs
+            )
+        key = (service_name, region_name)
+        with self._client_lock:
+            if key in self._clients:
+                self._pool.record("client", hit=True)
+                return self._clients[key]
+            self._pool.record("client", hit=False)
+            client = super(PooledSession, self).client(
+                service_name, region_name=region_name
+            )
+            self._clients[key] = client
+        return client
+
+
+class SessionPool(object):
+    """Thread-safe pool of boto3 sessions.
+
+    boto3 sessions are not thread-safe so they are pooled per process and
+    thread. Each session reuses the clients it creates and all sessions share
+    a botocore data loader so service models are only loaded once.
+
+    Sessions are keyed on the credentials used to create them so new sessions
+    are created if credentials change. :meth:`invalidate` can be used to
+    release sessions that are no longer needed. Sessions of threads that
+    have exited are released when a session is created and the least
+    recently used sessions are released once there are more than
+    ``max_size``.
+
+    """
+
+    def __init__(self, max_size=SESSION_POOL_MAX_SIZE):
+        """Instantiate class.
+
+        Args:
+            max_size (int): Maximum number of sessions to keep.
+
+        """
+        self._loader = None
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self._sessions = OrderedDict()
+        self._stats = {
+            "client_hits": 0,
+            "client_misses": 0,
+            "session_hits": 0,
+            "session_misses": 0,
+        }
+
+    @property
+    def stats(self):
+        """Number of times a session or client was reused or created.
+
+        Logged at the end of each CFNgin action.
+
+        Returns:
+            Dict[str, int]
+
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def get(self, region=None, profile=None, credentials=None):
+        """Get or create a boto3 session.
+
+        Args:
+            region (Optional[str]): The region for the session.
+            profile (Optional[str]): The profile for the session.
+            credentials (Optional[Dict[str, str]]): Access key, secret key,
+                and session token for the session.
+
+        Returns:
+            PooledSession
+
+        """
+        credentials = credentials or {}
+        key = (
+            os.getpid(),
+            threading.current_thread().ident,
+            region,
+            profile,
+            credentials.get("access_key"),
+            credentials.get("secret_key"),
+            credentials.get("session_token"),
+            tuple(os.environ.get(var) for var in CREDENTIAL_ENV_VARS),
+        )
+        with self._lock:
+            if key in self._sessions:
+                self._stats["session_hits"] += 1
+                # move to the end so it is the most recently used
+                session = self._sessions.pop(key)
+                self._sessions[key] = session
+                return session
+            self._stats["session_misses"] += 1
+            self._prune()
+            botocore_session = Session()
+            if self._loader:
+                botocore_session.register_component("data_loader", self._loader)
+            else:
+                self._loader = botocore_session.get_component("data_loader")
+            session = PooledSession(
+                self,
+                aws_access_key_id=credentials.get("access_key"),
+                aws_secret_access_key=credentials.get("secret_key"),
+                aws_session_token=credentials.get("session_token"),
+                botocore_session=botocore_session,
+                region_name=region,
+                profile_name=profile,
+            )
+            self._sessions[key] = session
+        return session
+
+    def _prune(self):
+        """Release sessions of exited threads and the least recently used.
+
+        Must be called while holding the lock. Leaves room for one new
+        session.
+
+        """
+        pid = os.getpid()
+        alive = set(thread.ident for thread in threading.enumerate())
+        for key in list(self._sessions):
+            if key[0] != pid or key[1] not in alive:
+                del self._sessions[key]
+        while self._sessions and len(self._sessions) >= self.max_size:
+            self._sessions.popitem(last=False)
+
+    def invalidate(self, access_key=None, profile=None):
+        """Remove sessions from the pool.
+
+        Args:
+            access_key (Optional[str]): Only remove sessions using this
+                access key.
+            profile (Optional[str]): Only remove sessions using this profile.
+
+        If neither argument is provided, all sessions are removed.
+
+        """
+        with self._lock:
+            if not (access_key or profile):
+                self._sessions.clear()
+                return
+            for key in list(self._sessions):
+                if (access_key and key[4] == access_key) or (
+                    profile and key[3] == profile
+                ):
+                    del self._sessions[key]
+
+    def record(self, kind, hit):
+        """Record a cache hit or miss.
+
+        Args:
+            kind (str): Type of object (``client`` or ``session``).
+            hit (bool): Whether the object was reused.
+
+        """
+        with self._lock:
+            self._stats["%s_%s" % (kind, "hits" if hit else "misses")] += 1
+
+
+SESSION_POOL = SessionPool()
 
 
 def get_session(
     region=None, profile=None, access_key=None, secret_key=None, session_token=None
 ):
-    """Create a thread-safe boto3 session.
+    """Get a thread-safe boto3 session.
+
+    Sessions are reused from :data:`SESSION_POOL` when one exists for the
+    current thread with the same credentials.
 
     Args:
         region (Optional[str]): The region for the session.
@@ -56,13 +263,14 @@ def get_session(
         # TODO uncomment log message after we update all internal use
         # LOGGER.warning(DEPRECATION_MSG)
 
-    session = boto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        aws_session_token=session_token,
-        botocore_session=Session(),
-        region_name=region,
-        profile_name=profile,
+    session = SESSION_POOL.get(
+        region=region,
+        profile=profile,
+        credentials={
+            "access_key": access_key,
+            "secret_key": secret_key,
+            "session_token": session_token,
+        },
     )
     cred_provider = session._session.get_component("credential_provider")
     provider = cred_provider.get_provider("assume-role")
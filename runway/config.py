@@ -20,7 +20,7 @@ from six import string_types
 
 from ._logging import PrefixAdaptor
 from .util import MutableMap, cached_property
-from .variables import Variable
+from .variables import Variable, clear_lookup_cache, prefetch_lookups
 
 if sys.version_info.major > 2:
     from pathlib import Path  # pylint: disable=E
@@ -133,11 +133,14 @@ class ConfigComponent(MutableMap):
             logger.verbose("resolving variables for pre-processing...")
         else:
             logger.verbose("resolving variables...")
-        for attr in (
-            self.PRE_PROCESS_VARIABLES if pre_process else self.SUPPORTS_VARIABLES
-        ):
-            logger.debug("resolving %s...", attr)
-            getattr(self, "_" + attr).resolve(context, variables=variables)
+        attrs = self.PRE_PROCESS_VARIABLES if pre_process else self.SUPPORTS_VARIABLES
+        prefetch_lookups([getattr(self, "_" + attr) for attr in attrs], context)
+        try:
+            for attr in attrs:
+                logger.debug("resolving %s...", attr)
+                getattr(self, "_" + attr).resolve(context, variables=variables)
+        finally:
+            clear_lookup_cache(context)
 
     def __getitem__(self, key):
         # type: (str) -> Any
@@ -261,6 +264,35 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                   count: ${var count.${env DEPLOY_ENVIRONMENT}}
             - frontend.tf
 
+    Modules can also list the names of the modules in the same deployment
+    that they depend on with ``depends_on``. If any module in a deployment
+    uses ``depends_on``, each module is processed as soon as the modules it
+    depends on have completed. Modules that do not depend on each other are
+    processed in parallel if the ``CI``
+    :ref:`environment variable is set<non-interactive-mode>`. Deployments
+    support ``depends_on`` in the same way. The order is reversed for
+    ``destroy``.
+
+    Example:
+      In this example, ``servicea.cfn`` and ``serviceb.cfn`` will be deployed
+      in parallel after ``backend.tf``. ``frontend.tf`` will be deployed after
+      ``serviceb.cfn``, even if ``servicea.cfn`` is still being deployed.
+
+      .. code-block:: yaml
+
+        deployments:
+          - modules:
+            - backend.tf
+            - path: servicea.cfn
+              depends_on:
+                - backend.tf
+            - path: serviceb.cfn
+              depends_on:
+                - backend.tf
+            - path: frontend.tf
+              depends_on:
+                - serviceb.cfn
+
     """
 
     SUPPORTS_VARIABLES = [
@@ -284,6 +316,7 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
         options=None,  # type: Optional[Dict[str, Any]]
         tags=None,  # type: Optional[Dict[str, str]]
         child_modules=None,  # type: Optional[List[Union[str, Dict[str, Any]]]]
+        depends_on=None,  # type: Optional[List[str]]
     ):
         # type: (...) -> None
         """.. Runway module definition.
@@ -331,6 +364,12 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                 (``--tag <tag>...``)
             child_modules (Optional[List[Union[str, Dict[str, Any]]]]):
                 Child modules that can be executed in parallel
+            depends_on (Optional[List[str]]): Names of other modules in the
+                deployment that must be processed before this module. If any
+                module in a deployment defines ``depends_on``, modules that
+                do not depend on each other are processed in parallel when
+                the ``CI`` :ref:`environment variable is
+                set<non-interactive-mode>`.
 
         .. rubric:: Lookup Resolution
 
@@ -353,6 +392,8 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
         +---------------------+-----------------------------------------------+
         |  ``tags``           | None                                          |
         +---------------------+-----------------------------------------------+
+        |  ``depends_on``     | None                                          |
+        +---------------------+-----------------------------------------------+
 
         References:
             - `AWS CDK`_
@@ -384,6 +425,7 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
         self._options = Variable(name + ".options", options or {}, "runway")
         self.tags = tags or {}
         self.child_modules = child_modules or []
+        self.depends_on = depends_on or []  # type: List[str]
 
     @property
     def class_path(self):
@@ -444,8 +486,9 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
             if isinstance(mod, str):
                 results.append(cls(name=mod, path=mod))
                 continue
+            depends_on = mod.pop("depends_on", [])
             if mod.get("parallel"):
-                name = "parallel_parent"
+                name = mod.pop("name", "parallel_parent")
                 child_modules = ModuleDefinition.from_list(mod.pop("parallel"))
                 path = "[" + ", ".join([x.path for x in child_modules]) + "]"
                 if mod:
@@ -469,6 +512,7 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                     parameters=mod.pop("parameters", {}),
                     tags=mod.pop("tags", {}),
                     child_modules=child_modules,
+                    depends_on=depends_on,
                 )
             )
             if mod:
@@ -621,6 +665,13 @@ class DeploymentDefinition(ConfigComponent):
                 be used to apply the same role to all environment.
                 ``post_deploy_env_revert: true`` can also be provided to
                 revert credentials after processing.
+            depends_on (Optional[List[str]]): Names of other deployments
+                that must be processed before this deployment. If any
+                deployment defines ``depends_on``, deployments that do not
+                depend on each other are processed in parallel when the
+                ``CI`` :ref:`environment variable is
+                set<non-interactive-mode>`. The order is reversed for
+                ``destroy``.
             environments (Optional[Dict[str, Dict[str, Any]]]): Optional
                 mapping of environment names to a booleon value used to
                 explicitly enable or disable in an environment. This
@@ -697,6 +748,8 @@ class DeploymentDefinition(ConfigComponent):
         |                     | ``AWS_DEFAULT_REGION`` will not have been set |
         |                     | by Runway yet), `var lookup`_                 |
         +---------------------+-----------------------------------------------+
+        |  ``depends_on``     | None                                          |
+        +---------------------+-----------------------------------------------+
         |  ``environments``   | `env lookup`_, `var lookup`_                  |
         +---------------------+-----------------------------------------------+
         |  ``env_vars``       | `env lookup`_ (``AWS_REGION``,                |
@@ -733,6 +786,7 @@ class DeploymentDefinition(ConfigComponent):
         """
         self._reverse = False
         self.name = deployment.pop("name")  # type: str
+        self.depends_on = deployment.pop("depends_on", [])  # type: List[str]
         self._account_alias = Variable(
             self.name + ".account_alias",
             deployment.pop("account_alias", deployment.pop("account-alias", {})),
@@ -33,6 +33,8 @@ class Context(object):
         self.command = kwargs.pop("command", None)
         self.env = kwargs.pop("deploy_environment", DeployEnvironment())
         self.debug = self.env.debug
+        # data retrieved by lookup handlers while variables are being resolved
+        self.lookup_cache = {}
         # TODO remove after IaC tools support AWS SSO
         self.__inject_profile_credentials()
 
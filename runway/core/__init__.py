@@ -43,6 +43,13 @@ class Runway(object):
         self.tests = config.tests
         self.ignore_git_branch = config.ignore_git_branch
         self.variables = config.variables
+        self.worker_pool = components.WorkerPool(
+            max_workers=max(
+                context.env.max_concurrent_modules, context.env.max_concurrent_regions
+            ),
+            buffer_logs=context.env.vars.get("RUNWAY_PARALLEL_OUTPUT", "grouped")
+            != "stream",
+        )
         self.__assert_config_version()
         self.ctx.env.log_name()
 
@@ -226,10 +233,11 @@ class Runway(object):
 
         """
         self.ctx.command = action
-        components.Deployment.run_list(
-            action=action,
-            context=self.ctx,
-            deployments=deployments,
-            future=self.future,
-            variables=self.variables,
-        )
+        with self.worker_pool:
+            components.Deployment.run_list(
+                action=action,
+                context=self.ctx,
+                deployments=deployments,
+                future=self.future,
+                variables=self.variables,
+            )
@@ -0,0 +1,164 @@
+"""Run deployments or modules in the order defined by their dependencies."""
+import logging
+import sys
+from typing import Any, List, Optional  # noqa pylint: disable=W
+
+from ..._logging import new_log_unit, run_log_unit
+from ...cfngin.dag import DAG, DAGValidationError
+from ._worker_pool import get_executor, get_parallel_output_note
+
+if sys.version_info.major > 2:
+    import concurrent.futures
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+
+def has_dependencies(definitions):
+    # type: (List[Any]) -> bool
+    """Determine if any definition in a list uses ``depends_on``.
+
+    Args:
+        definitions: Deployment or module definitions.
+
+    """
+    return any(
+        isinstance(getattr(definition, "depends_on", None), list)
+        and definition.depends_on
+        for definition in definitions
+    )
+
+
+def build_graph(definitions, reverse=False):
+    # type: (List[Any], bool) -> DAG
+    """Build a graph from the ``depends_on`` of deployment or module definitions.
+
+    Dependencies that are not in the list of definitions (e.g. excluded by
+    tags or not selected) are ignored.
+
+    Args:
+        definitions: Deployment or module definitions.
+        reverse: Reverse the direction of the dependencies (e.g. for destroy).
+
+    Raises:
+        SystemExit: Duplicate names or a dependency cycle were found.
+
+    """
+    dag = DAG()
+    for definition in definitions:
+        try:
+            dag.add_node(definition.name)
+        except KeyError:
+            LOGGER.error(
+                '"%s" is defined more than once; names must be unique to use '
+                "depends_on",
+                definition.name,
+            )
+            sys.exit(1)
+    for definition in definitions:
+        for dependency in definition.depends_on or []:
+            if dependency not in dag.graph:
+                LOGGER.debug(
+                    '%s: ignoring dependency "%s" that is not being processed',
+                    definition.name,
+                    dependency,
+                )
+                continue
+            try:
+                dag.add_edge(definition.name, dependency)
+            except DAGValidationError as err:
+                LOGGER.error(
+                    'invalid dependency of "%s" on "%s": %s',
+                    definition.name,
+                    dependency,
+                    err,
+                )
+                sys.exit(1)
+    return dag.transpose() if reverse else dag
+
+
+def run_graph(
+    dag,  # type: DAG
+    items,  # type: List[Any]
+    action,  # type: str
+    use_concurrent=False,  # type: bool
+    max_workers=None,  # type: Optional[int]
+    label="item",  # type: str
+    log_progress=False,  # type: bool
+):
+    # type: (...) -> None
+    """Run an action on deployments or modules once their dependencies complete.
+
+    When run concurrently, each item is run in a separate process as soon as
+    the items it depends on have completed. Otherwise, items are run one at a
+    time in the order they are listed while still respecting dependencies.
+
+    Args:
+        dag: Graph built by :func:`build_graph`.
+        items: Deployment or module objects with a ``name`` and ``logger``
+            that are subscriptable by action name.
+        action: Name of the action to run.
+        use_concurrent: Run independent items at the same time.
+        max_workers: Maximum number of items to run at the same time.
+        label: Type of the items used in log messages.
+        log_progress: Log when each item starts and completes.
+
+    """
+    pending = [item.name for item in items]
+    by_name = {item.name: item for item in items}
+    completed = set()
+
+    def _ready():
+        """Names of pending items whose dependencies have completed."""
+        return [
+            name
+            for name in pending
+            if all(dep in completed for dep in dag.downstream(name))
+        ]
+
+    def _started(name):
+        pending.remove(name)
+        if log_progress:
+            by_name[name].logger.notice("processing %s (in progress)", label)
+
+    def _completed(name):
+        completed.add(name)
+        if log_progress:
+            by_name[name].logger.success("processing %s (complete)", label)
+
+    if not use_concurrent:
+        while pending:
+            name = _ready()[0]
+            _started(name)
+            by_name[name][action]()
+            _completed(name)
+        return
+
+    LOGGER.info(
+        "processing %ss in parallel as their dependencies complete... (%s)",
+        label,
+        get_parallel_output_note(),
+    )
+    running = {}
+    failed = []
+    with get_executor(max_workers) as executor:
+        while (pending and not failed) or running:
+            if not failed:
+                for name in _ready():
+                    if max_workers and len(running) >= max_workers:
+                        break
+                    _started(name)
+                    future = executor.submit(
+                        run_log_unit, new_log_unit(), by_name[name][action]
+                    )
+                    running[future] = name
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                name = running.pop(future)
+                if future.exception() is None:
+                    _completed(name)
+                else:
+                    failed.append(future)
+    for future in failed:
+        future.result()  # raise exceptions / exit as needed
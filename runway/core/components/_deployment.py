@@ -1,9 +1,11 @@
 """Runway deployment object."""
+import functools
 import logging
 import sys
 from typing import (  # noqa pylint: disable=W
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -17,10 +19,9 @@ from ...cfngin.exceptions import UnresolvedVariable
 from ...config import FutureDefinition, VariablesDefinition
 from ...util import cached_property, merge_dicts, merge_nested_environment_dicts
 from ..providers import aws
+from ._dependency_graph import build_graph, has_dependencies, run_graph
 from ._module import Module
-
-if sys.version_info.major > 2:
-    import concurrent.futures
+from ._worker_pool import get_parallel_output_note, run_in_workers
 
 if TYPE_CHECKING:
     from ...config import DeploymentDefinition  # pylint: disable=W
@@ -305,17 +306,12 @@ class Deployment(object):
 
         """
         self.logger.info(
-            "processing regions in parallel... (output will be interwoven)"
+            "processing regions in parallel... (%s)", get_parallel_output_note()
         )
-        executor = concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.ctx.env.max_concurrent_regions
+        run_in_workers(
+            [(self.run, action, region) for region in self.regions],
+            max_workers=self.ctx.env.max_concurrent_regions,
         )
-        futures = [
-            executor.submit(self.run, *[action, region]) for region in self.regions
-        ]
-        concurrent.futures.wait(futures)
-        for job in futures:
-            job.result()  # raise exceptions / exit as needed
 
     def __sync(self, action):
         # type: (str) -> None
@@ -351,6 +347,8 @@ class Deployment(object):
                 resolution.
 
         """
+        if has_dependencies(deployments):
+            return cls.__run_graph(action, context, deployments, future, variables)
         for definition in deployments:
             definition.resolve(context, variables=variables, pre_process=True)
             deployment = cls(
@@ -373,6 +371,51 @@ class Deployment(object):
             )[action]()
             deployment.logger.success("processing deployment (complete)")
 
+    @classmethod
+    def __run_graph(
+        cls,
+        action,  # type: str
+        context,  # type: Context
+        deployments,  # type: List[DeploymentDefinition]
+        future,  # type: FutureDefinition
+        variables,  # type: VariablesDefinition
+    ):
+        # type: (...) -> None
+        """Run a list of deployments in the order of their dependencies.
+
+        Deployments that do not depend on each other are run in parallel if
+        concurrent execution is enabled. The pre-process variables of each
+        deployment are resolved right before it is run so they can use
+        lookups of the deployments it depends on.
+
+        Args:
+            action (str): Name of action to run.
+            context (Context): Runway context.
+            deployments (List[DeploymentDefinition]): List of deployments to run.
+            future (FutureDefinition): Future definition.
+            variables (VariablesDefinition): Runway variables for lookup
+                resolution.
+
+        """
+        objects = []
+        for definition in deployments:
+            node = _DeploymentNode(context.copy(), definition, future, variables)
+            if not definition.modules:
+                node.logger.warning("skipped; no modules found in definition")
+                continue
+            objects.append(node)
+        run_graph(
+            build_graph([obj.definition for obj in objects], action == "destroy"),
+            objects,
+            action,
+            use_concurrent=action != "plan"
+            and len(objects) > 1
+            and context.use_concurrent,
+            max_workers=context.env.max_concurrent_modules,
+            label="deployment",
+            log_progress=True,
+        )
+
     def __getitem__(self, key):
         """Make the object subscriptable.
 
@@ -384,3 +427,60 @@ class Deployment(object):
 
         """
         return getattr(self, key)
+
+
+class _DeploymentNode(object):
+    """Deployment in a graph that is resolved when it is run."""
+
+    def __init__(
+        self,
+        context,  # type: Context
+        definition,  # type: DeploymentDefinition
+        future,  # type: FutureDefinition
+        variables,  # type: VariablesDefinition
+    ):
+        # type: (...) -> None
+        """Instantiate class.
+
+        Args:
+            context (Context): Runway context object.
+            definition (DeploymentDefinition): A single deployment definition.
+            future (FutureDefinition): Future functionality configuration.
+            variables (VariablesDefinition): Runway variables.
+
+        """
+        self.ctx = context
+        self.definition = definition
+        self.future = future
+        self.variables = variables
+        self.name = definition.name
+        self.logger = PrefixAdaptor(self.name, LOGGER)
+
+    def run(self, action):
+        # type: (str) -> None
+        """Resolve the pre-process variables of the deployment and run it.
+
+        Args:
+            action (str): Name of action to run.
+
+        """
+        self.definition.resolve(self.ctx, variables=self.variables, pre_process=True)
+        Deployment(
+            context=self.ctx,
+            definition=self.definition,
+            future=self.future,
+            variables=self.variables,
+        )[action]()
+
+    def __getitem__(self, key):
+        # type: (str) -> Callable[[], None]
+        """Get a callable that runs an action of the deployment.
+
+        Args:
+            key (str): Name of the action.
+
+        Returns:
+            Callable[[], None]
+
+        """
+        return functools.partial(self.run, key)
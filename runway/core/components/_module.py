@@ -15,6 +15,7 @@ import six
 import yaml
 
 from ..._logging import PrefixAdaptor
+from ...cfngin.output_cache import OUTPUT_CACHE
 from ...config import FutureDefinition, VariablesDefinition
 from ...path import Path as ModulePath
 from ...runway_module_type import RunwayModuleType
@@ -25,9 +26,10 @@ from ...util import (
     merge_nested_environment_dicts,
 )
 from ..providers import aws
+from ._dependency_graph import build_graph, has_dependencies, run_graph
+from ._worker_pool import get_parallel_output_note, run_in_workers
 
 if sys.version_info.major > 2:
-    import concurrent.futures
     from pathlib import Path  # pylint: disable=E
 else:
     from pathlib2 import Path  # pylint: disable=E
@@ -224,7 +226,11 @@ class Module(object):
                 context=self.ctx, path=self.path.module_root, options=self.payload
             )
             if hasattr(inst, action):
-                inst[action]()
+                try:
+                    inst[action]()
+                finally:
+                    # any module type can change CloudFormation stacks
+                    OUTPUT_CACHE.invalidate()
             else:
                 self.logger.error('"%s" is missing method "%s"', inst, action)
                 sys.exit(1)
@@ -241,20 +247,18 @@ class Module(object):
 
         """
         self.logger.info(
-            "processing modules in parallel... (output will be interwoven)"
+            "processing modules in parallel... (%s)", get_parallel_output_note()
         )
         # Can't use threading or ThreadPoolExecutor here because
         # we need to be able to do things like `cd` which is not
         # thread safe.
-        executor = concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.ctx.env.max_concurrent_modules
-        )
-        futures = [
-            executor.submit(child.run, *[action]) for child in self.child_modules
-        ]
-        concurrent.futures.wait(futures)
-        for job in futures:
-            job.result()  # raise exceptions / exit as needed
+        try:
+            run_in_workers(
+                [(child.run, action) for child in self.child_modules],
+                max_workers=self.ctx.env.max_concurrent_modules,
+            )
+        finally:
+            OUTPUT_CACHE.invalidate()  # changes made by child processes
 
     def __sync(self, action):
         # type: (str) -> None
@@ -326,6 +330,31 @@ class Module(object):
                 configuration.
 
         """
+        if has_dependencies(modules):
+            objects = [
+                cls(
+                    context=context,
+                    definition=module,
+                    deployment=deployment,
+                    future=future,
+                    variables=variables,
+                )
+                for module in modules
+            ]
+            use_concurrent = (
+                action != "plan" and len(objects) > 1 and context.use_concurrent
+            )
+            run_graph(
+                build_graph(modules, action == "destroy"),
+                objects,
+                action,
+                use_concurrent=use_concurrent,
+                max_workers=context.env.max_concurrent_modules,
+                label="module",
+            )
+            if use_concurrent:
+                OUTPUT_CACHE.invalidate()  # changes made by child processes
+            return
         for module in modules:
             cls(
                 context=context,
@@ -0,0 +1,291 @@
+"""Pool of worker processes shared by deployments and modules."""
+import importlib
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple  # noqa pylint: disable=W
+
+from ..._logging import (
+    LogMultiplexer,
+    configure_worker_logging,
+    get_worker_log_queue,
+    new_log_unit,
+    run_log_unit,
+)
+
+if sys.version_info.major > 2:
+    import concurrent.futures
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+#: Modules imported once by each worker process when it is started.
+PRELOAD_MODULES = [
+    "botocore.session",
+    "boto3",
+    "awscli.clidriver",
+    "troposphere",
+    "runway.cfngin.cfngin",
+    "runway.module.cloudformation",
+]
+
+# log records of functions run by the workers of this process are grouped
+_GROUPED_OUTPUT = False
+# the current process is a worker process of a pool
+_IN_WORKER = False
+
+
+def preload_modules():
+    # type: () -> None
+    """Import modules that would otherwise be imported by each task."""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            LOGGER.debug("unable to preload module: %s", name)
+
+
+def initialize_worker(log_queue=None, grouped=False):
+    # type: (Any, bool) -> None
+    """Initialize a worker process when it is started.
+
+    Args:
+        log_queue: Queue that log records are sent to.
+        grouped: The log records sent to the queue are grouped by unit of work.
+
+    """
+    global _GROUPED_OUTPUT, _IN_WORKER  # pylint: disable=global-statement
+    _IN_WORKER = True
+    if log_queue is not None:
+        configure_worker_logging(log_queue)
+        _GROUPED_OUTPUT = grouped
+    preload_modules()
+
+
+def is_output_grouped():
+    # type: () -> bool
+    """Determine if the output of functions run in worker processes is grouped.
+
+    Output is grouped when it is sent to a :class:`WorkerPool` that buffers
+    the log records of each function until it completes.
+
+    """
+    pool = WorkerPool.get_active()
+    if pool:
+        return pool.buffer_logs
+    return _GROUPED_OUTPUT and get_worker_log_queue() is not None
+
+
+def get_parallel_output_note():
+    # type: () -> str
+    """Get a note describing how the output of parallel processing is displayed."""
+    if _IN_WORKER and not WorkerPool.get_active():
+        return "run one at a time within this worker process"
+    if is_output_grouped():
+        return "output of each will be displayed once it completes"
+    return "output will be interwoven"
+
+
+class WorkerPool(object):
+    """Long-lived pool of worker processes shared by the whole run.
+
+    While the pool is active (used as a context manager), parallel regions,
+    child modules and deployments processed in the process that activated it
+    are dispatched to the same worker processes instead of a new pool being
+    created for each of them. Worker processes are started when first needed
+    and reused until the pool is shut down.
+
+    Nested parallel processing done inside of a worker process can't use the
+    pool of its parent process so it is run one at a time within the worker
+    process to keep the number of processes within ``max_workers``.
+
+    Log records of the worker processes are sent to the process that owns
+    the pool and, unless ``buffer_logs`` is ``False``, the records of each
+    function run in a worker process are logged together once it completes.
+
+    """
+
+    _active = None  # type: Optional[WorkerPool]
+
+    def __init__(self, max_workers=None, buffer_logs=True):
+        # type: (Optional[int], bool) -> None
+        """Instantiate class.
+
+        Args:
+            max_workers: Maximum number of worker processes for the whole run.
+            buffer_logs: Log the records of each function run in a worker
+                process together once it completes instead of as they are
+                received.
+
+        """
+        self.buffer_logs = buffer_logs
+        self.max_workers = max_workers
+        self._executor = None
+        self._log_multiplexer = None  # type: Optional[LogMultiplexer]
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @classmethod
+    def get_active(cls):
+        # type: () -> Optional[WorkerPool]
+        """Get the pool that is active in the current process."""
+        pool = cls._active
+        if pool and pool._pid == os.getpid():  # pylint: disable=protected-access
+            return pool
+        return None  # inherited by a worker process from its parent
+
+    @property
+    def executor(self):
+        # type: () -> concurrent.futures.ProcessPoolExecutor
+        """Executor used to run tasks in the worker processes."""
+        with self._lock:
+            if not self._executor:
+                LOGGER.debug(
+                    "starting worker pool with up to %s processes", self.max_workers
+                )
+                self._log_multiplexer = LogMultiplexer(
+                    multiprocessing.get_context(), buffered=self.buffer_logs
+                )
+                self._log_multiplexer.start()
+                self._executor = create_executor(
+                    self.max_workers,
+                    log_queue=self._log_multiplexer.queue,
+                    grouped=self.buffer_logs,
+                )
+            return self._executor
+
+    def shutdown(self):
+        # type: () -> None
+        """Wait for running tasks to finish and stop the worker processes."""
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._log_multiplexer:
+                self._log_multiplexer.stop()
+                self._log_multiplexer = None
+
+    def __enter__(self):
+        # type: () -> WorkerPool
+        """Activate the pool for the current process."""
+        WorkerPool._active = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (Any, Any, Any) -> None
+        """Deactivate and shut down the pool."""
+        if WorkerPool._active is self:
+            WorkerPool._active = None
+        self.shutdown()
+
+
+class SerialExecutor(object):
+    """Executor that runs each function as soon as it is submitted.
+
+    Used in place of a process pool inside of a worker process.
+
+    """
+
+    def submit(self, func, *args, **kwargs):
+        # type: (Any, Any, Any) -> concurrent.futures.Future
+        """Run a function and return a completed future of its result."""
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+        return future
+
+    def shutdown(self, wait=True):
+        # type: (bool) -> None
+        """Nothing to shut down."""
+
+
+def create_executor(max_workers=None, log_queue=None, grouped=False):
+    # type: (Optional[int], Any, bool) -> concurrent.futures.ProcessPoolExecutor
+    """Create a process pool executor whose workers preload modules.
+
+    Args:
+        max_workers: Maximum number of worker processes.
+        log_queue: Queue that the log records of the worker processes are
+            sent to. If not provided, the queue of the current process is
+            used if it is a worker process.
+        grouped: The log records sent to ``log_queue`` are grouped by unit
+            of work.
+
+    """
+    if log_queue is None:
+        log_queue = get_worker_log_queue()
+        grouped = _GROUPED_OUTPUT
+    if sys.version_info < (3, 7):
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(),
+        initializer=initialize_worker,
+        initargs=(log_queue, grouped),
+    )
+
+
+@contextmanager
+def get_executor(max_workers=None):
+    # type: (Optional[int]) -> Iterator[concurrent.futures.ProcessPoolExecutor]
+    """Get the executor of the active pool or a temporary one.
+
+    Inside of a worker process, a :class:`SerialExecutor` is used instead of
+    a temporary pool so nested parallel processing does not start more
+    processes than the pool of the parent process allows.
+
+    Args:
+        max_workers: Maximum number of worker processes of a temporary
+            executor.
+
+    """
+    pool = WorkerPool.get_active()
+    if pool:
+        yield pool.executor
+        return
+    if _IN_WORKER:
+        yield SerialExecutor()
+        return
+    executor = create_executor(max_workers)
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True)
+
+
+def run_in_workers(calls, max_workers=None):
+    # type: (List[Tuple[Any, ...]], Optional[int]) -> List[Any]
+    """Run functions in worker processes and wait for all of them to finish.
+
+    The log records of each function are grouped as a unit of work.
+
+    Args:
+        calls: Functions to run, each followed by its positional arguments.
+        max_workers: Maximum number of the functions to run at the same time.
+
+    Returns:
+        Return value of each function.
+
+    Raises:
+        Exception: The first exception raised by one of the functions, once
+            all of them have finished.
+
+    """
+    pending = list(calls)
+    futures = []
+    with get_executor(max_workers) as executor:
+        running = set()
+        while pending or running:
+            while pending and (not max_workers or len(running) < max_workers):
+                func_args = pending.pop(0)
+                future = executor.submit(run_log_unit, new_log_unit(), *func_args)
+                futures.append(future)
+                running.add(future)
+            _done, running = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+    return [future.result() for future in futures]  # raise exceptions / exit
@@ -2,6 +2,8 @@
 import logging
 import sys
 
+from ....cfngin.session_cache import SESSION_POOL
+
 if sys.version_info >= (3, 6):  # cov: ignore
     from contextlib import AbstractContextManager  # pylint: disable=E
 else:  # cov: ignore
@@ -83,6 +85,9 @@ class AssumeRole(AbstractContextManager):
         if not self.role_arn:
             LOGGER.debug("no role was assumed; not reverting credentials")
             return
+        if self.credentials.get("AccessKeyId"):
+            # sessions using the assumed role are no longer needed
+            SESSION_POOL.invalidate(access_key=self.credentials["AccessKeyId"])
         for k in self.ctx.current_aws_creds.keys():
             old = "OLD_" + k
             if self.ctx.env_vars.get(old):
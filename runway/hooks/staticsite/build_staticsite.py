@@ -3,7 +3,9 @@
 # TODO move to runway.cfngin.hooks on next major release
 import logging
 import os
+import sys
 import tempfile
+import threading
 import zipfile
 
 import boto3
@@ -11,29 +13,112 @@ from boto3.s3.transfer import S3Transfer
 
 from ...cfngin.lookups.handlers.rxref import RxrefLookup
 from ...s3_util import does_s3_object_exist, download_and_extract_to_mkdtemp
-from ...util import change_dir, run_commands
+from ...util import run_commands
 from .util import get_hash_of_files
 
 LOGGER = logging.getLogger(__name__)
 
 
+#: Extensions of files that are already compressed and are stored in the
+#: archive without compressing them again.
+COMPRESSED_EXTENSIONS = (".br", ".gz", ".jpeg", ".jpg", ".png", ".woff2", ".zip")
+
+
+def _write_archive(fileobj, app_dir):
+    """Write a ZIP archive of a directory.
+
+    Args:
+        fileobj (BinaryIO): File object the archive is written to. Does not
+            need to be seekable.
+        app_dir (str): Directory to archive.
+
+    """
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as archive:
+        for dirname, _subdirs, files in os.walk(app_dir):
+            reldir = os.path.relpath(dirname, app_dir)
+            if reldir != os.curdir:
+                archive.write(dirname, reldir)
+            for filename in files:
+                archive.write(
+                    os.path.join(dirname, filename),
+                    os.path.normpath(os.path.join(reldir, filename)),
+                    compress_type=zipfile.ZIP_STORED
+                    if filename.lower().endswith(COMPRESSED_EXTENSIONS)
+                    else None,
+                )
+
+
+class _ArchiveStream(object):
+    """Read a ZIP archive while it is written by another thread."""
+
+    def __init__(self, app_dir):
+        """Instantiate class.
+
+        Args:
+            app_dir (str): Directory to archive.
+
+        """
+        read_fd, write_fd = os.pipe()
+        self._reader = os.fdopen(read_fd, "rb")
+        self._writer = os.fdopen(write_fd, "wb")
+        self._error = None
+        self._thread = threading.Thread(target=self._write, args=(app_dir,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _write(self, app_dir):
+        """Write the archive to the pipe."""
+        try:
+            with self._writer:
+                _write_archive(self._writer, app_dir)
+        except Exception as err:  # pylint: disable=broad-except
+            self._error = err
+
+    def read(self, size=-1):
+        """Read from the archive.
+
+        Raises the error that stopped the archive from being written instead
+        of returning a truncated archive.
+
+        """
+        data = self._reader.read(size)
+        if not data:
+            self._thread.join()
+            if self._error:
+                raise self._error
+        return data
+
+    def close(self):
+        """Stop reading the archive and wait for the writer to exit."""
+        self._reader.close()
+        self._thread.join()
+
+
 def zip_and_upload(app_dir, bucket, key, session=None):
-    """Zip built static site and upload to S3."""
-    s3_client = session.client("s3") if session else boto3.client("s3")
-    transfer = S3Transfer(s3_client)
+    """Zip built static site and upload to S3.
+
+    The archive is uploaded in parts while it is being written instead of
+    being written to disk first. Files that are already compressed are
+    stored without compressing them again.
 
-    filedes, temp_file = tempfile.mkstemp()
-    os.close(filedes)
+    """
+    s3_client = session.client("s3") if session else boto3.client("s3")
     LOGGER.info("archiving %s to s3://%s/%s", app_dir, bucket, key)
-    with zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as filehandle:
-        with change_dir(app_dir):
-            for dirname, _subdirs, files in os.walk("./"):
-                if dirname != "./":
-                    filehandle.write(dirname)
-                for filename in files:
-                    filehandle.write(os.path.join(dirname, filename))
-    transfer.upload_file(temp_file, bucket, key)
-    os.remove(temp_file)
+
+    if sys.version_info[0] < 3:
+        # zipfile can't write to a stream that isn't seekable in python 2
+        filedes, temp_file = tempfile.mkstemp()
+        os.close(filedes)
+        _write_archive(temp_file, app_dir)
+        S3Transfer(s3_client).upload_file(temp_file, bucket, key)
+        os.remove(temp_file)
+        return
+
+    stream = _ArchiveStream(app_dir)
+    try:
+        s3_client.upload_fileobj(stream, bucket, key)
+    finally:
+        stream.close()
 
 
 def build(context, provider, **kwargs):
@@ -0,0 +1,231 @@
+"""Sync a directory to an S3 bucket using a manifest of file hashes."""
+import fnmatch
+import json
+import logging
+import mimetypes
+import os
+
+from botocore.exceptions import ClientError
+
+from .util import hash_file, map_concurrently
+
+LOGGER = logging.getLogger(__name__)
+
+#: Name appended to the artifact key prefix of a site to get the key of the
+#: object that stores the hash of each synced file. The manifest is kept in
+#: the artifact bucket so it is never served by the website or deleted by
+#: other tools that sync to the website bucket.
+MANIFEST_FILENAME = "sync-manifest.json"
+#: Number of files that are hashed or uploaded at the same time.
+MAX_SYNC_WORKERS = 10
+#: Maximum number of keys that can be deleted by a single ``delete_objects``.
+MAX_DELETE_KEYS = 1000
+
+
+def is_excluded(key, exclude):
+    """Determine if a key matches one of the exclude patterns.
+
+    Args:
+        key (str): Object key.
+        exclude (List[str]): Unix shell-style patterns.
+
+    Returns:
+        bool
+
+    """
+    return any(fnmatch.fnmatch(key, pattern) for pattern in exclude)
+
+
+def get_local_files(directory, exclude=None):
+    """Get the files in a directory keyed on their object key.
+
+    Args:
+        directory (str): Directory to get the files of.
+        exclude (Optional[List[str]]): Patterns of keys to exclude.
+
+    Returns:
+        Dict[str, str]: Path of each file keyed on its object key.
+
+    """
+    exclude = exclude or []
+    files = {}
+    for root, _dirs, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            key = os.path.relpath(path, directory).replace(os.sep, "/")
+            if not is_excluded(key, exclude):
+                files[key] = path
+    return files
+
+
+def get_remote_objects(s3_client, bucket, exclude=None):
+    """Get the objects in a bucket.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): Name of the bucket.
+        exclude (Optional[List[str]]): Patterns of keys to exclude.
+
+    Returns:
+        Dict[str, str]: ``ETag`` of each object keyed on its key.
+
+    """
+    exclude = exclude or []
+    objects = {}
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket):
+        for obj in page.get("Contents", []):
+            if not is_excluded(obj["Key"], exclude):
+                objects[obj["Key"]] = obj.get("ETag", "").strip('"')
+    return objects
+
+
+def get_manifest(s3_client, bucket, key):
+    """Get the manifest of the last sync.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): Name of the bucket containing the manifest.
+        key (str): Key of the manifest.
+
+    Returns:
+        Dict[str, str]: Hash of each file keyed on its object key. Empty if
+        the bucket does not contain a valid manifest.
+
+    """
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+        manifest = json.loads(response["Body"].read().decode())
+    except ClientError as err:
+        if err.response["Error"]["Code"] not in ["NoSuchKey", "404"]:
+            raise
+        LOGGER.debug("sync manifest not found at s3://%s/%s", bucket, key)
+        return {}
+    except ValueError:
+        LOGGER.warning("ignoring invalid sync manifest s3://%s/%s", bucket, key)
+        return {}
+    return manifest.get("files", {}) if isinstance(manifest, dict) else {}
+
+
+def put_manifest(s3_client, bucket, key, files):
+    """Store the manifest of a sync.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): Name of the bucket to store the manifest in.
+        key (str): Key of the manifest.
+        files (Dict[str, str]): Hash of each file keyed on its object key.
+
+    """
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=json.dumps({"files": files}, sort_keys=True),
+        ContentType="application/json",
+    )
+
+
+def delete_keys(s3_client, bucket, keys):
+    """Delete objects from a bucket in batches.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): Name of the bucket.
+        keys (List[str]): Keys of the objects to delete.
+
+    """
+    for i in range(0, len(keys), MAX_DELETE_KEYS):
+        response = s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                "Objects": [{"Key": key} for key in keys[i : i + MAX_DELETE_KEYS]],
+                "Quiet": True,
+            },
+        )
+        errors = response.get("Errors", [])
+        if errors:
+            raise ValueError(
+                "failed to delete %s object(s) from bucket %s: %s"
+                % (
+                    len(errors),
+                    bucket,
+                    ", ".join(
+                        "%s (%s)" % (error["Key"], error.get("Message"))
+                        for error in errors
+                    ),
+                )
+            )
+
+
+def sync_directory(  # pylint: disable=too-many-arguments
+    s3_client, directory, bucket, manifest, exclude=None, max_workers=None
+):
+    """Sync a directory to a bucket.
+
+    Each file is hashed and compared to the hash recorded in the manifest of
+    the previous sync (or the ``ETag`` of the object). Only files that are
+    new or have changed are uploaded. Objects that no longer exist locally
+    are deleted.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        directory (str): Directory to sync.
+        bucket (str): Name of the bucket.
+        manifest (Tuple[str, str]): Bucket and key of the manifest. This
+            should not be in the bucket being synced.
+        exclude (Optional[List[str]]): Patterns of keys that are not synced or
+            deleted.
+        max_workers (Optional[int]): Maximum number of files to hash or upload
+            at the same time.
+
+    Returns:
+        List[str]: Sorted keys of the objects that were uploaded or deleted.
+
+    """
+    max_workers = max_workers or MAX_SYNC_WORKERS
+    local_files = get_local_files(directory, exclude)
+    remote_objects = get_remote_objects(s3_client, bucket, exclude)
+    manifest_bucket, manifest_key = manifest
+    previous = get_manifest(s3_client, manifest_bucket, manifest_key)
+
+    keys = sorted(local_files)
+    hashes = dict(
+        zip(
+            keys,
+            map_concurrently(
+                lambda key: hash_file(local_files[key]), keys, max_workers
+            ),
+        )
+    )
+    to_upload = [
+        key
+        for key in keys
+        if key not in remote_objects
+        or hashes[key] not in (previous.get(key), remote_objects[key])
+    ]
+    to_delete = sorted(set(remote_objects) - set(local_files))
+
+    def _upload(key):
+        """Upload a file."""
+        LOGGER.debug("uploading %s to s3://%s/%s", local_files[key], bucket, key)
+        content_type = mimetypes.guess_type(local_files[key])[0]
+        s3_client.upload_file(
+            local_files[key],
+            bucket,
+            key,
+            ExtraArgs={"ContentType": content_type} if content_type else None,
+        )
+
+    LOGGER.info(
+        "syncing %s changed file(s) and deleting %s file(s); %s file(s) unchanged",
+        len(to_upload),
+        len(to_delete),
+        len(keys) - len(to_upload),
+    )
+    map_concurrently(_upload, to_upload, max_workers)
+    if to_delete:
+        LOGGER.debug("deleting from s3://%s: %s", bucket, ", ".join(to_delete))
+        delete_keys(s3_client, bucket, to_delete)
+    if to_upload or to_delete or previous != hashes:
+        put_manifest(s3_client, manifest_bucket, manifest_key, hashes)
+    return sorted(to_upload + to_delete)
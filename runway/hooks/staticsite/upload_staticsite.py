@@ -1,6 +1,7 @@
 """CFNgin hook for syncing static website to S3 bucket."""
 # TODO move to runway.cfngin.hooks on next major release
 import hashlib
+import heapq
 import json
 import logging
 import os
@@ -8,12 +9,21 @@ import time
 from operator import itemgetter
 
 import yaml
+from six.moves.urllib.parse import quote
 
 from ...cfngin.lookups.handlers.output import OutputLookup
-from ...core.providers import aws
+from .s3_sync import MANIFEST_FILENAME, sync_directory
+from .util import map_concurrently
 
 LOGGER = logging.getLogger(__name__)
 
+#: Maximum number of paths in a single CloudFront invalidation.
+MAX_INVALIDATION_PATHS = 3000
+#: Maximum number of wildcard paths in a single CloudFront invalidation.
+MAX_INVALIDATION_WILDCARDS = 15
+#: Maximum length of the value of a standard SSM parameter.
+SSM_VALUE_MAX_LENGTH = 4096
+
 
 def get_archives_to_prune(archives, hook_data):
     """Return list of keys to delete.
@@ -28,6 +38,8 @@ def get_archives_to_prune(archives, hook_data):
     for i in ["current_archive_filename", "old_archive_filename"]:
         if hook_data.get(i):
             files_to_skip.append(hook_data[i])
+    if hook_data.get("artifact_key_prefix"):
+        files_to_skip.append(hook_data["artifact_key_prefix"] + MANIFEST_FILENAME)
 
     archives.sort(  # sort from oldest to newest
         key=itemgetter("LastModified"), reverse=False
@@ -52,7 +64,6 @@ def sync(context, provider, **kwargs):
         kwargs.get("bucket_output_lookup"), provider=provider, context=context
     )
     build_context = context.hook_data["staticsite"]
-    invalidate_cache = False
 
     extra_files = sync_extra_files(
         context,
@@ -61,35 +72,33 @@ def sync(context, provider, **kwargs):
         hash_tracking_parameter=build_context.get("hash_tracking_parameter"),
     )
 
-    if extra_files:
-        invalidate_cache = True
+    changed = list(extra_files)
 
     if build_context["deploy_is_current"]:
         LOGGER.info("skipped upload; latest version already deployed")
     else:
-        # Using the awscli for s3 syncing is incredibly suboptimal, but on
-        # balance it's probably the most stable/efficient option for syncing
-        # the files until https://github.com/boto/boto3/issues/358 is resolved
-        sync_args = [
-            "s3",
-            "sync",
+        synced = sync_directory(
+            session.client("s3"),
             build_context["app_directory"],
-            "s3://%s/" % bucket_name,
-            "--delete",
-        ]
-
-        for extra_file in [f["name"] for f in kwargs.get("extra_files", [])]:
-            sync_args.extend(["--exclude", extra_file])
-
-        aws.cli(sync_args)
+            bucket_name,
+            (
+                build_context["artifact_bucket_name"],
+                build_context["artifact_key_prefix"] + MANIFEST_FILENAME,
+            ),
+            exclude=[f["name"] for f in kwargs.get("extra_files", [])],
+        )
 
-        invalidate_cache = True
+        if not synced:
+            LOGGER.info("skipped upload; all files already deployed")
+        changed.extend(synced)
 
     if kwargs.get("cf_disabled", False):
         display_static_website_url(kwargs.get("website_url"), provider, context)
 
-    elif invalidate_cache:
+    elif changed:
         distribution = get_distribution_data(context, provider, **kwargs)
+        if "distribution_path" not in kwargs:
+            distribution["paths"] = get_invalidation_paths(changed)
         invalidate_distribution(session, **distribution)
 
     LOGGER.info("sync complete")
@@ -170,7 +179,124 @@ def get_distribution_data(context, provider, **kwargs):
     }
 
 
-def invalidate_distribution(session, identifier="", path="", domain="", **_):
+def get_invalidation_paths(
+    keys, max_paths=MAX_INVALIDATION_PATHS, max_wildcards=MAX_INVALIDATION_WILDCARDS
+):
+    """Get the paths to invalidate for changed objects.
+
+    Each key is invalidated individually. ``index.html`` files also
+    invalidate the path of their directory. If there are too many paths for
+    a single invalidation, directories are replaced with wildcards, starting
+    with the deepest directories that contain the most paths, until they fit.
+    Paths are grouped by directory once and directories are collapsed from
+    a heap so the number of paths does not need to be recounted after each.
+
+    Args:
+        keys (List[str]): Keys of the objects that changed.
+        max_paths (int): Maximum number of paths.
+        max_wildcards (int): Maximum number of wildcard paths.
+
+    Returns:
+        List[str]: Sorted, URL encoded paths to invalidate.
+
+    """
+    paths = set()
+    for key in keys:
+        paths.add("/" + quote(key))
+        if key == "index.html" or key.endswith("/index.html"):
+            paths.add("/" + quote(key[: -len("index.html")]))
+
+    if len(paths) <= max_paths:
+        return sorted(paths)
+
+    # group paths by directory once; collapsing a directory only updates
+    # the directory, its ancestors, and the heap instead of regrouping
+    entries = {"/": set()}  # paths that would be collapsed into each directory
+    children = {}
+    for path in paths:
+        directory = _get_invalidation_parent(path)
+        entries.setdefault(directory, set()).add(path)
+        while directory != "/":
+            parent = _get_invalidation_parent(directory[:-1])
+            if directory in children.setdefault(parent, set()):
+                break
+            children[parent].add(directory)
+            entries.setdefault(parent, set())
+            directory = parent
+
+    totals = {}  # number of paths and wildcards within each directory
+    for directory in sorted(entries, key=lambda d: d.count("/"), reverse=True):
+        totals[directory] = [
+            len(entries[directory])
+            + sum(totals[child][0] for child in children.get(directory, ())),
+            0,
+        ]
+
+    heap = []
+
+    def _push(directory):
+        """Add a directory to the heap of directories that can be collapsed."""
+        size = len(entries[directory])
+        if directory != "/" and size:
+            heapq.heappush(heap, (-(size > 1), -directory.count("/"), -size, directory))
+
+    for directory in entries:
+        _push(directory)
+
+    collapsed = set()
+    while totals["/"][0] > max_paths or totals["/"][1] > max_wildcards:
+        while heap and (
+            heap[0][3] in collapsed or -heap[0][2] != len(entries[heap[0][3]])
+        ):
+            heapq.heappop(heap)
+        if not heap:
+            return ["/*"]
+        prefix = heapq.heappop(heap)[3]
+        removed = totals[prefix]
+        stack = [prefix]
+        while stack:
+            directory = stack.pop()
+            collapsed.add(directory)
+            stack.extend(
+                child for child in children.get(directory, ()) if child not in collapsed
+            )
+        parent = _get_invalidation_parent(prefix[:-1])
+        entries[parent].add(prefix + "*")
+        _push(parent)
+        change = [1 - removed[0], 1 - removed[1]]
+        directory = prefix
+        while directory != "/":
+            directory = _get_invalidation_parent(directory[:-1])
+            totals[directory][0] += change[0]
+            totals[directory][1] += change[1]
+    return sorted(
+        path
+        for directory, directory_paths in entries.items()
+        if directory not in collapsed
+        for path in directory_paths
+    )
+
+
+def _get_invalidation_parent(path):
+    """Get the directory a path would be collapsed into.
+
+    Args:
+        path (str): Path being invalidated.
+
+    Returns:
+        str: Path of the directory ending with ``/``.
+
+    """
+    if path.endswith("/*"):
+        path = path[:-2]
+    elif path.endswith("/"):
+        return path
+    return path[: path.rindex("/") + 1]
+
+
+def invalidate_distribution(
+    session, identifier="", path="", domain="", paths=None, **_
+):
     """Invalidate the current distribution.
 
     Args:
@@ -178,14 +304,23 @@ def invalidate_distribution(session, identifier="", path="", domain="", **_):
         identifier (string): The distribution id.
         path (string): The distribution path.
         domain (string): The distribution domain.
+        paths (Optional[List[str]]): Paths to invalidate. Takes precedence
+            over ``path``.
 
     """
-    LOGGER.info("invalidating CloudFront distribution: %s (%s)", identifier, domain)
+    items = paths or [path]
+    LOGGER.info(
+        "invalidating %s path(s) of CloudFront distribution: %s (%s)",
+        len(items),
+        identifier,
+        domain,
+    )
+    LOGGER.debug("invalidating paths: %s", ", ".join(items))
     cf_client = session.client("cloudfront")
     cf_client.create_invalidation(
         DistributionId=identifier,
         InvalidationBatch={
-            "Paths": {"Quantity": 1, "Items": [path]},
+            "Paths": {"Quantity": len(items), "Items": items},
             "CallerReference": str(time.time()),
         },
     )
@@ -379,9 +514,70 @@ def set_ssm_value(session, name, value, description=""):
     )
 
 
+def get_extra_file_hashes(value):
+    """Parse the hash of each extra file from the value of an SSM parameter.
+
+    Args:
+        value (Optional[str]): Value of the SSM parameter.
+
+    Returns:
+        Optional[Dict[str, str]]: Hash of each extra file keyed on its name.
+        ``None`` if the value is not a JSON object (e.g. it is a hash of all
+        extra files).
+
+    """
+    try:
+        hashes = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    return hashes if isinstance(hashes, dict) else None
+
+
+def upload_extra_file(s3_client, bucket, extra_file):
+    """Upload an extra file to S3.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): The static site bucket name.
+        extra_file (Dict[str, str]): The extra file configuration with
+            serialized content.
+
+    Returns:
+        bool: Whether anything was uploaded.
+
+    """
+    filename = extra_file["name"]
+    content_type = extra_file["content_type"]
+    content = extra_file["content"]
+    source = extra_file.get("file")
+
+    if content:
+        LOGGER.info("uploading extra file: %s", filename)
+
+        s3_client.put_object(
+            Bucket=bucket, Key=filename, Body=content, ContentType=content_type
+        )
+
+    if source:
+        LOGGER.info("uploading extra file: %s as %s ", source, filename)
+
+        extra_args = None
+
+        if content_type:
+            extra_args = {"ContentType": content_type}
+
+        s3_client.upload_file(source, bucket, filename, ExtraArgs=extra_args)
+
+    return bool(content or source)
+
+
 def sync_extra_files(context, bucket, extra_files, **kwargs):
     """Sync static website extra files to S3 bucket.
 
+    When a hash tracking parameter is provided, the hash of each extra file
+    is stored in it as a JSON object and only extra files with a different
+    hash are uploaded.
+
     Args:
         context (:class:`runway.cfngin.context.Context`): The context
             instance.
@@ -389,6 +585,9 @@ def sync_extra_files(context, bucket, extra_files, **kwargs):
         extra_files (List[Dict[str, str]]): List of files and file content
             that should be uploaded.
 
+    Returns:
+        List[str]: Names of the extra files that were uploaded.
+
     """
     LOGGER.debug("extra_files to sync: %s", json.dumps(extra_files))
 
@@ -397,63 +596,75 @@ def sync_extra_files(context, bucket, extra_files, **kwargs):
 
     session = context.get_session()
     s3_client = session.client("s3")
-    uploaded = []
 
     hash_param = kwargs.get("hash_tracking_parameter")
-    hash_new = None
+    hashes_new = None
+    to_upload = extra_files
 
     # serialize content based on content type
     for extra_file in extra_files:
-        filename = extra_file.get("name")
         extra_file["content_type"] = get_content_type(extra_file)
         extra_file["content"] = get_content(extra_file)
 
-    # calculate a hash of the extra_files
+    # calculate a hash of each extra file
     if hash_param:
         hash_param = "%sextra" % hash_param
 
         hash_old = get_ssm_value(session, hash_param)
+        hashes_old = get_extra_file_hashes(hash_old)
 
-        # calculate hash of content
-        hash_new = calculate_hash_of_extra_files(extra_files)
-
-        if hash_new == hash_old:
+        if hashes_old is None and hash_old == calculate_hash_of_extra_files(
+            extra_files
+        ):
             LOGGER.info(
                 "skipped upload of extra files; latest version already deployed"
             )
             return []
 
-    for extra_file in extra_files:
-        filename = extra_file["name"]
-        content_type = extra_file["content_type"]
-        content = extra_file["content"]
-        source = extra_file.get("file")
-
-        if content:
-            LOGGER.info("uploading extra file: %s", filename)
-
-            s3_client.put_object(
-                Bucket=bucket, Key=filename, Body=content, ContentType=content_type
+        hashes_new = dict(
+            zip(
+                [extra_file["name"] for extra_file in extra_files],
+                map_concurrently(
+                    lambda extra_file: calculate_hash_of_extra_files([extra_file]),
+                    extra_files,
+                ),
             )
+        )
+        to_upload = [
+            extra_file
+            for extra_file in extra_files
+            if (hashes_old or {}).get(extra_file["name"])
+            != hashes_new[extra_file["name"]]
+        ]
 
-            uploaded.append(filename)
-
-        if source:
-            LOGGER.info("uploading extra file: %s as %s ", source, filename)
-
-            extra_args = None
-
-            if content_type:
-                extra_args = {"ContentType": content_type}
-
-            s3_client.upload_file(source, bucket, filename, ExtraArgs=extra_args)
-
-            uploaded.append(filename)
+        if not to_upload:
+            LOGGER.info(
+                "skipped upload of extra files; latest version already deployed"
+            )
+            return []
 
-    if hash_new:
+    uploaded = [
+        extra_file["name"]
+        for extra_file, result in zip(
+            to_upload,
+            map_concurrently(
+                lambda extra_file: upload_extra_file(s3_client, bucket, extra_file),
+                to_upload,
+            ),
+        )
+        if result
+    ]
+
+    if hashes_new:
+        hash_value = json.dumps(hashes_new, sort_keys=True)
+        if len(hash_value) > SSM_VALUE_MAX_LENGTH:
+            # too many extra files to track individually
+            hash_value = calculate_hash_of_extra_files(extra_files)
         LOGGER.info(
-            "updating extra files SSM parameter %s with hash %s", hash_param, hash_new
+            "updating extra files SSM parameter %s with hash %s",
+            hash_param,
+            hash_value,
         )
-        set_ssm_value(session, hash_param, hash_new)
+        set_ssm_value(session, hash_param, hash_value)
 
     return uploaded
@@ -1,7 +1,11 @@
 """Utility functions for website build/upload."""
 import hashlib
+import json
 import logging
 import os
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
 
 import zgitignore
 
@@ -9,41 +13,209 @@ from ...util import change_dir
 
 LOGGER = logging.getLogger(__name__)
 
+#: Number of files that are hashed at the same time.
+MAX_HASH_WORKERS = 4
+#: Files modified this recently are not cached since a change in the same
+#: timestamp granularity would not be detected.
+HASH_CACHE_MIN_AGE = 2
+READ_SIZE = 1024 * 1024
 
-def calculate_hash_of_files(files, root):
+
+def map_concurrently(func, items, max_workers=10):
+    """Apply a function to items using a pool of threads.
+
+    Args:
+        func (Callable[[Any], Any]): Function to apply.
+        items (List[Any]): Items to apply the function to.
+        max_workers (int): Maximum number of threads.
+
+    Returns:
+        List[Any]: Results in the order of the items.
+
+    """
+    if len(items) < 2 or max_workers < 2:
+        return [func(item) for item in items]
+    pool = ThreadPool(min(len(items), max_workers))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_hash_cache_path(root, cache_dir=None):
+    """Get the path of the file hash cache of a directory.
+
+    Args:
+        root (str): Directory containing the files being hashed.
+        cache_dir (Optional[str]): Directory containing the caches of all
+            directories. Defaults to ``~/.runway_cache/file_hashes``.
+
+    Returns:
+        str
+
+    """
+    cache_dir = cache_dir or os.path.join(
+        os.path.expanduser("~"), ".runway_cache", "file_hashes"
+    )
+    root_hash = hashlib.sha256(os.path.realpath(root).encode()).hexdigest()
+    return os.path.join(cache_dir, root_hash + ".json")
+
+
+def _load_hash_cache(cache_path):
+    """Load a file hash cache.
+
+    Args:
+        cache_path (str): Path of the cache.
+
+    Returns:
+        Dict[str, List[Any]]: ``[size, mtime_ns, inode, md5]`` of each file
+        keyed on its name.
+
+    """
+    try:
+        with open(cache_path, "r") as stream:
+            cache = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_hash_cache(cache_path, cache):
+    """Save a file hash cache.
+
+    Args:
+        cache_path (str): Path of the cache.
+        cache (Dict[str, List[Any]]): ``[size, mtime_ns, inode, md5]`` of each
+            file keyed on its name.
+
+    """
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        # write to a temporary file first so a partial cache is never read
+        handle, temp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(handle, "w") as temp:
+            json.dump(cache, temp)
+        os.rename(temp_path, cache_path)
+    except (IOError, OSError):
+        LOGGER.debug("unable to save file hash cache %s", cache_path, exc_info=True)
+
+
+def _get_file_signature(path):
+    """Get the size, modification time, and inode of a file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        List[int]
+
+    """
+    stat = os.stat(path)
+    # st_mtime_ns is not available in python 2
+    mtime_ns = getattr(stat, "st_mtime_ns", None) or int(stat.st_mtime * 1e9)
+    return [stat.st_size, mtime_ns, stat.st_ino]
+
+
+def hash_file(path):
+    """Calculate the md5 hash of a file.
+
+    The hash matches the ``ETag`` of an S3 object that was not uploaded in
+    parts.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        str: Hex digest of the contents of the file.
+
+    """
+    file_hash = hashlib.md5()
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(READ_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def calculate_hash_of_files(files, root, cache_path=None, max_workers=MAX_HASH_WORKERS):
     """Return a hash of all of the given files at the given root.
 
-    Adapted from stacker.hooks.aws_lambda; used according to its license:
-    https://github.com/cloudtools/stacker/blob/1.4.0/LICENSE
+    The hash is calculated from the name and md5 hash of each file. When
+    ``cache_path`` is provided, the hash of each file is stored in it along
+    with the size, modification time, and inode of the file so files that
+    have not changed since the last run are not read again.
 
     Args:
         files (list[str]): file names to include in the hash calculation,
             relative to ``root``.
         root (str): base directory to analyze files in.
+        cache_path (Optional[str]): Path of the file hash cache.
+        max_workers (int): Maximum number of files to hash at the same time.
 
     Returns:
         str: A hash of the hashes of the given files.
 
     """
+    cache = _load_hash_cache(cache_path) if cache_path else {}
+    signatures = {}
+    hashes = {}
+    for fname in files:
+        signatures[fname] = _get_file_signature(os.path.join(root, fname))
+        cached = cache.get(fname)
+        if isinstance(cached, list) and cached[:3] == signatures[fname]:
+            hashes[fname] = cached[3]
+    to_hash = sorted(set(files) - set(hashes))
+    LOGGER.debug(
+        "hashing %s file(s); %s file(s) unchanged since last hashed",
+        len(to_hash),
+        len(hashes),
+    )
+    hashes.update(
+        zip(
+            to_hash,
+            map_concurrently(
+                lambda fname: hash_file(os.path.join(root, fname)),
+                to_hash,
+                max_workers,
+            ),
+        )
+    )
+
     file_hash = hashlib.md5()
     for fname in sorted(files):
-        fileobj = os.path.join(root, fname)
-        file_hash.update((fname + "\0").encode())
-        with open(fileobj, "rb") as filedes:
-            for chunk in iter(
-                lambda: filedes.read(4096),  # noqa pylint: disable=cell-var-from-loop
-                "",
-            ):
-                if not chunk:
-                    break
-                file_hash.update(chunk)
-            file_hash.update("\0".encode())
+        file_hash.update((fname + "\0" + hashes[fname] + "\0").encode())
 
+    if cache_path:
+        min_mtime_ns = (time.time() - HASH_CACHE_MIN_AGE) * 1e9
+        new_cache = {
+            fname: signatures[fname] + [hashes[fname]]
+            for fname in files
+            if signatures[fname][1] < min_mtime_ns
+        }
+        if new_cache != cache:
+            _save_hash_cache(cache_path, new_cache)
     return file_hash.hexdigest()
 
 
-def get_hash_of_files(root_path, directories=None):
-    """Generate md5 hash of files."""
+def get_hash_of_files(
+    root_path, directories=None, cache_dir=None, max_workers=MAX_HASH_WORKERS
+):
+    """Generate md5 hash of files.
+
+    Args:
+        root_path (str): Base directory of the files.
+        directories (Optional[List[Dict[str, Any]]]): Directories to include,
+            relative to ``root_path``, with optional ``exclusions``.
+        cache_dir (Optional[str]): Directory of the file hash cache. See
+            :func:`get_hash_cache_path`.
+        max_workers (int): Maximum number of files to hash at the same time.
+
+    Returns:
+        str: A hash of the hashes of the files.
+
+    """
     if not directories:
         directories = [{"path": "./"}]
 
@@ -64,7 +236,12 @@ def get_hash_of_files(root_path, directories=None):
                                 filepath[2:] if filepath.startswith("./") else filepath
                             )
 
-    return calculate_hash_of_files(files_to_hash, root_path)
+    return calculate_hash_of_files(
+        files_to_hash,
+        root_path,
+        cache_path=get_hash_cache_path(root_path, cache_dir),
+        max_workers=max_workers,
+    )
 
 
 def get_ignorer(path, additional_exclusions=None):
@@ -93,6 +93,7 @@ from typing import (  # noqa: F401 pylint: disable=W
     TYPE_CHECKING,
     Any,
     Dict,
+    List,
     Optional,
     Tuple,
     Union,
@@ -184,6 +185,23 @@ class LookupHandler(object):
             return value.data
         return value
 
+    @classmethod
+    def prefetch(cls, values, context, **kwargs):
+        # type: (List[str], 'Context', Any) -> None
+        """Retrieve data for many lookups before they are handled.
+
+        Handlers that can retrieve data in batches can implement this to
+        populate ``context.lookup_cache`` which is used by :meth:`handle`.
+        The cache is cleared once the variables have been resolved. Errors
+        should not be raised so they can be reported when the lookup is
+        handled.
+
+        Args:
+            values: Parameter(s) given to each lookup.
+            context: The current context object.
+
+        """
+
     @classmethod
     def handle(cls, value, context, **kwargs):
         # type: (str, 'Context', Any) -> Any
@@ -50,6 +50,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Union  # pylint: disable=
 from botocore.exceptions import ClientError
 
 from runway.cfngin.exceptions import OutputDoesNotExist, StackDoesNotExist
+from runway.cfngin.output_cache import OUTPUT_CACHE
 
 from .base import LookupHandler
 
@@ -94,24 +95,39 @@ class CfnLookup(LookupHandler):
         return False
 
     @staticmethod
-    def get_stack_output(client, query):
+    def get_stack_output(client, query, access_key=None):
         """Get CloudFormation Stack output.
 
+        Outputs are retrieved from the shared
+        :data:`runway.cfngin.output_cache.OUTPUT_CACHE` so each Stack is only
+        described once.
+
         Args:
             client: Boto3 CloudFormation client.
             query (OutputQuery): What to get.
+            access_key (Optional[str]): Access key of the credentials used
+                by the client.
 
         Returns:
             str: Value of the requested output.
 
         """
-        LOGGER.debug("describing stack: %s", query.stack_name)
-        stack = client.describe_stacks(StackName=query.stack_name)["Stacks"][0]
-        outputs = {
-            output["OutputKey"]: output["OutputValue"]
-            for output in stack.get("Outputs", [])
-        }
-        LOGGER.debug("%s stack outputs: %s", stack["StackName"], json.dumps(outputs))
+
+        def _fetch(stack_name):
+            LOGGER.debug("describing stack: %s", stack_name)
+            stack = client.describe_stacks(StackName=stack_name)["Stacks"][0]
+            outputs = {
+                output["OutputKey"]: output["OutputValue"]
+                for output in stack.get("Outputs", [])
+            }
+            LOGGER.debug(
+                "%s stack outputs: %s", stack["StackName"], json.dumps(outputs)
+            )
+            return outputs
+
+        outputs = OUTPUT_CACHE.get(
+            access_key, client.meta.region_name, query.stack_name, _fetch
+        )
         return outputs[query.output_name]
 
     @classmethod
@@ -156,7 +172,11 @@ class CfnLookup(LookupHandler):
                 cfn_client = context.get_session(region=args.get("region")).client(
                     "cloudformation"
                 )
-                result = cls.get_stack_output(cfn_client, query)
+                result = cls.get_stack_output(
+                    cfn_client,
+                    query,
+                    (context.boto3_credentials or {}).get("aws_access_key_id"),
+                )
         except (ClientError, KeyError, StackDoesNotExist) as err:
             # StackDoesNotExist is only raised by provider
             if "default" in args:
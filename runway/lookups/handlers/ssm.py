@@ -8,6 +8,12 @@ Parameters of type ``SecureString`` are automatically decrypted.
 
 Parameters of type ``StringList`` are returned as a list.
 
+When variables are resolved, the parameters of all ``ssm`` Lookups being
+resolved together are retrieved in batches of 10 per region before the
+individual Lookups are handled. The retrieved values are only used while
+those variables are being resolved; a Lookup handled at any other time
+retrieves its parameter again.
+
 
 .. rubric:: Arguments
 
@@ -31,7 +37,16 @@ This Lookup supports all :ref:`Common Lookup Arguments`.
 """
 # pylint: disable=arguments-differ
 import logging
-from typing import TYPE_CHECKING, Any, Union  # pylint: disable=unused-import
+from multiprocessing.pool import ThreadPool
+from typing import (  # noqa: F401 pylint: disable=unused-import
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 # using absolute for runway imports so stacker shim doesn't break when used from CFNgin
 from runway.lookups.handlers.base import LookupHandler
@@ -46,11 +61,93 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "ssm"
+# max number of names that can be passed to ssm.get_parameters
+GET_PARAMETERS_MAX_NAMES = 10
+MAX_PREFETCH_WORKERS = 10
 
 
 class SsmLookup(LookupHandler):
     """SSM Parameter Store Lookup."""
 
+    @staticmethod
+    def _cache_key(context, client, name):
+        # type: (Union['CFNginContext', 'RunwayContext'], Any, str) -> Tuple[Any, ...]
+        """Key used to store a parameter in the lookup cache of the context."""
+        credentials = context.boto3_credentials or {}
+        return (
+            credentials.get("aws_access_key_id"),
+            client.meta.region_name,
+            name,
+        )
+
+    @classmethod
+    def prefetch(cls, values, context, **_):
+        # type: (List[str], Union['CFNginContext', 'RunwayContext'], Any) -> None
+        """Retrieve the parameters of many Lookups in batches.
+
+        Parameters are retrieved using ``ssm.get_parameters`` in batches of
+        10 per region with regions and batches being retrieved concurrently.
+        Results are stored in the lookup cache of the context. Parameters
+        that were not found or could not be retrieved are removed from the
+        cache so they are retrieved individually when handled.
+
+        Args:
+            values: The values passed to each Lookup.
+            context: The current context object.
+
+        """
+        names_by_region = {}  # type: Dict[Optional[str], List[str]]
+        for value in values:
+            query, args = cls.parse(value)
+            names = names_by_region.setdefault(args.get("region"), [])
+            # names with selectors or ARNs are returned under a different name
+            if ":" not in query and query not in names:
+                names.append(query)
+
+        jobs = []
+        for region, names in names_by_region.items():
+            if not names:
+                continue
+            client = context.get_session(region=region).client("ssm")
+            for index in range(0, len(names), GET_PARAMETERS_MAX_NAMES):
+                jobs.append((client, names[index : index + GET_PARAMETERS_MAX_NAMES]))
+        if not jobs:
+            return
+
+        def _get_parameters(job):
+            """Retrieve a batch of parameters."""
+            client, names = job
+            try:
+                return (
+                    client,
+                    names,
+                    client.get_parameters(Names=names, WithDecryption=True)[
+                        "Parameters"
+                    ],
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("failed to prefetch SSM parameters %s: %s", names, err)
+                return client, names, []
+
+        cache = context.lookup_cache.setdefault(TYPE_NAME, {})
+        if len(jobs) == 1:
+            results = [_get_parameters(jobs[0])]
+        else:
+            pool = ThreadPool(min(len(jobs), MAX_PREFETCH_WORKERS))
+            try:
+                results = pool.map(_get_parameters, jobs)
+            finally:
+                pool.close()
+                pool.join()
+        count = 0
+        for client, names, parameters in results:
+            for name in names:  # don't use stale values of missing parameters
+                cache.pop(cls._cache_key(context, client, name), None)
+            for parameter in parameters:
+                cache[cls._cache_key(context, client, parameter["Name"])] = parameter
+                count += 1
+        LOGGER.debug("prefetched %s SSM parameter(s)", count)
+
     @classmethod
     def handle(cls, value, context, **_):
         # type: (str, Union['CFNginContext', 'RunwayContext'], Any) -> Any
@@ -71,9 +168,12 @@ class SsmLookup(LookupHandler):
         client = session.client("ssm")
 
         try:
-            response = client.get_parameter(Name=query, WithDecryption=True)[
-                "Parameter"
-            ]
+            response = (
+                context.lookup_cache.get(TYPE_NAME, {}).get(
+                    cls._cache_key(context, client, query)
+                )
+                or client.get_parameter(Name=query, WithDecryption=True)["Parameter"]
+            )
             return cls.format_results(
                 response["Value"].split(",")
                 if response["Type"] == "StringList"
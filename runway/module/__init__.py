@@ -1,9 +1,14 @@
 """Runway module module."""
+import hashlib
+import json
 import logging
 import os
 import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+from typing import List  # noqa pylint: disable=W
 
 import six
 
@@ -17,6 +22,27 @@ else:
 LOGGER = logging.getLogger(__name__)
 NPM_BIN = "npm.cmd" if platform.system().lower() == "windows" else "npm"
 NPX_BIN = "npx.cmd" if platform.system().lower() == "windows" else "npx"
+#: Directory where ``node_modules`` installed by ``npm ci`` are cached.
+NODE_MODULES_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".runway_cache", "node_modules"
+)
+#: File in ``node_modules`` containing the cache key it was installed for.
+NODE_MODULES_CACHE_MARKER = ".runway-cache-key"
+#: Maximum number of ``node_modules`` kept in the cache.
+NODE_MODULES_CACHE_MAX_ENTRIES = 10
+#: Scripts of ``package.json`` run by ``npm ci`` that prevent caching.
+NPM_CI_LIFECYCLE_SCRIPTS = [
+    "preinstall",
+    "install",
+    "postinstall",
+    "prepublish",
+    "preprepare",
+    "prepare",
+    "postprepare",
+]
+
+_NPM_CI_SUPPORTED = []  # type: List[bool]
+_NODE_VERSION = []  # type: List[str]
 
 
 def format_npm_command_for_logging(command):
@@ -52,22 +78,190 @@ def run_module_command(cmd_list, env_vars, exit_on_error=True, logger=LOGGER):
         subprocess.check_call(cmd_list, env=env_vars)
 
 
+def npm_ci_supported():
+    """Return true if the installed version of npm supports npm ci.
+
+    The result is cached for the life of the process.
+
+    """
+    if not _NPM_CI_SUPPORTED:
+        with open(os.devnull, "w") as fnull:
+            _NPM_CI_SUPPORTED.append(
+                subprocess.call(
+                    [NPM_BIN, "ci", "-h"], stdout=fnull, stderr=subprocess.STDOUT
+                )
+                == 0
+            )
+    return _NPM_CI_SUPPORTED[0]
+
+
 def use_npm_ci(path):
     """Return true if npm ci should be used in lieu of npm install."""
     # https://docs.npmjs.com/cli/ci#description
-    with open(os.devnull, "w") as fnull:
-        if (
-            (
-                os.path.isfile(os.path.join(path, "package-lock.json"))
-                or os.path.isfile(os.path.join(path, "npm-shrinkwrap.json"))
-            )
-            and subprocess.call(
-                [NPM_BIN, "ci", "-h"], stdout=fnull, stderr=subprocess.STDOUT
+    return (
+        os.path.isfile(os.path.join(path, "package-lock.json"))
+        or os.path.isfile(os.path.join(path, "npm-shrinkwrap.json"))
+    ) and npm_ci_supported()
+
+
+def get_node_version():
+    """Return the version of node, cached for the life of the process."""
+    if not _NODE_VERSION:
+        try:
+            _NODE_VERSION.append(
+                subprocess.check_output(["node", "--version"]).decode().strip()
             )
-            == 0
-        ):
-            return True
-    return False
+        except (OSError, subprocess.CalledProcessError):
+            _NODE_VERSION.append("")
+    return _NODE_VERSION[0]
+
+
+def get_node_modules_cache_key(path):
+    """Get the key of the ``node_modules`` installed by npm ci for a module.
+
+    The key is a hash of ``package.json``, the lock file, the version of
+    node, and the platform.
+
+    Args:
+        path (str): Path to the module.
+
+    Returns:
+        str
+
+    """
+    hasher = hashlib.sha256()
+    for name in ["package.json", "package-lock.json", "npm-shrinkwrap.json"]:
+        file_path = os.path.join(path, name)
+        if os.path.isfile(file_path):
+            with open(file_path, "rb") as stream:
+                hasher.update(name.encode() + b"\0" + stream.read() + b"\0")
+    hasher.update(
+        "\0".join([get_node_version(), sys.platform, platform.machine()]).encode()
+    )
+    return hasher.hexdigest()
+
+
+def has_lifecycle_scripts(path):
+    """Determine if ``package.json`` defines scripts run by npm ci.
+
+    These scripts can modify ``node_modules`` or files outside of it (e.g.
+    building or patching dependencies) so ``node_modules`` installed for
+    them can't be restored from the cache.
+
+    Args:
+        path (str): Path to the module.
+
+    Returns:
+        bool
+
+    """
+    try:
+        with open(os.path.join(path, "package.json")) as stream:
+            scripts = json.load(stream).get("scripts") or {}
+    except (IOError, OSError):
+        return False
+    except (AttributeError, ValueError):
+        return True  # can't tell so don't cache
+    return any(script in scripts for script in NPM_CI_LIFECYCLE_SCRIPTS)
+
+
+def prune_node_modules_cache(keep=None):
+    """Remove the least recently used ``node_modules`` from the cache.
+
+    Args:
+        keep (Optional[str]): Cache key that is never removed.
+
+    """
+    entries = [
+        os.path.join(NODE_MODULES_CACHE_DIR, name)
+        for name in os.listdir(NODE_MODULES_CACHE_DIR)
+        if len(name) == 64 and name != keep  # skip temporary directories
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    limit = NODE_MODULES_CACHE_MAX_ENTRIES
+    if keep:
+        limit -= 1  # the kept entry counts towards the limit
+    for entry in entries[max(limit, 0) :]:
+        LOGGER.debug("removing node_modules from cache: %s", entry)
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def run_npm_ci(path, cmd, logger=LOGGER):
+    """Run npm ci unless an identical ``node_modules`` was already installed.
+
+    ``node_modules`` installed by npm ci are cached in
+    ``~/.runway_cache/node_modules`` keyed on
+    :func:`get_node_modules_cache_key`. If the ``node_modules`` of the module
+    was installed for the same key, npm ci is skipped. If it is cached,
+    a copy is restored from the cache. Only the
+    :data:`NODE_MODULES_CACHE_MAX_ENTRIES` most recently used are kept.
+
+    The cache is not used if ``package.json`` defines scripts that npm ci
+    would run (see :func:`has_lifecycle_scripts`).
+
+    Args:
+        path (str): Path to the module.
+        cmd (List[str]): npm ci command.
+        logger (logging.Logger): Logger to use.
+
+    """
+    if has_lifecycle_scripts(path):
+        logger.debug("node_modules not cached; package.json has install scripts")
+        logger.info("running npm ci...")
+        subprocess.check_call(cmd)
+        return
+
+    node_modules = os.path.join(path, "node_modules")
+    marker = os.path.join(node_modules, NODE_MODULES_CACHE_MARKER)
+    key = get_node_modules_cache_key(path)
+    cached = os.path.join(NODE_MODULES_CACHE_DIR, key)
+
+    if os.path.isfile(marker):
+        with open(marker) as stream:
+            if stream.read() == key:
+                logger.info("skipped npm ci; node_modules is up to date")
+                return
+
+    if os.path.isdir(cached):
+        logger.info("restoring node_modules from cache...")
+        try:
+            os.utime(cached, None)  # mark as recently used
+            if os.path.isdir(node_modules):
+                shutil.rmtree(node_modules)
+            shutil.copytree(cached, node_modules, symlinks=True)
+        except (IOError, OSError, shutil.Error):
+            logger.warning("unable to restore node_modules from cache", exc_info=True)
+            cached = None
+    else:
+        cached = None
+
+    if not cached:
+        logger.info("running npm ci...")
+        subprocess.check_call(cmd)
+        if not os.path.isdir(node_modules):
+            return
+        try:
+            if not os.path.isdir(NODE_MODULES_CACHE_DIR):
+                os.makedirs(NODE_MODULES_CACHE_DIR)
+            tmp_dir = tempfile.mkdtemp(dir=NODE_MODULES_CACHE_DIR)
+            try:
+                shutil.copytree(
+                    node_modules, os.path.join(tmp_dir, "node_modules"), symlinks=True,
+                )
+                # another process may have cached the same key
+                if not os.path.isdir(os.path.join(NODE_MODULES_CACHE_DIR, key)):
+                    os.rename(
+                        os.path.join(tmp_dir, "node_modules"),
+                        os.path.join(NODE_MODULES_CACHE_DIR, key),
+                    )
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            prune_node_modules_cache(keep=key)
+        except (IOError, OSError, shutil.Error):
+            logger.debug("unable to cache node_modules", exc_info=True)
+
+    with open(marker, "w") as stream:
+        stream.write(key)
 
 
 def run_npm_install(path, options, context, logger=LOGGER):
@@ -80,11 +274,11 @@ def run_npm_install(path, options, context, logger=LOGGER):
         logger.info("skipped npm ci/npm install")
         return
     if context.env_vars.get("CI") and use_npm_ci(path):
-        logger.info("running npm ci...")
         cmd[1] = "ci"
-    else:
-        logger.info("running npm install...")
-        cmd[1] = "install"
+        run_npm_ci(path, cmd, logger=logger)
+        return
+    logger.info("running npm install...")
+    cmd[1] = "install"
     subprocess.check_call(cmd)
 
 
@@ -209,11 +403,11 @@ class RunwayModuleNpm(RunwayModule):  # pylint: disable=abstract-method
             self.logger.info("skipped npm ci/npm install")
             return
         if self.context.is_noninteractive and use_npm_ci(str(self.path)):
-            self.logger.info("running npm ci...")
             cmd[1] = "ci"
-        else:
-            self.logger.info("running npm install...")
-            cmd[1] = "install"
+            run_npm_ci(str(self.path), cmd, logger=self.logger)
+            return
+        self.logger.info("running npm install...")
+        cmd[1] = "install"
         subprocess.check_call(cmd)
 
     def package_json_missing(self):
@@ -1,8 +1,11 @@
 """CDK module."""
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from multiprocessing.pool import ThreadPool
 
 from .._logging import PrefixAdaptor
 from ..util import change_dir, run_commands, which
@@ -16,13 +19,28 @@ from . import (
 
 LOGGER = logging.getLogger(__name__)
 
+#: Maximum number of ``cdk diff`` processes to run at the same time.
+MAX_CONCURRENT_DIFFS = 8
 
-def get_cdk_stacks(module_path, env_vars, context_opts):
-    """Return list of CDK stacks."""
+
+def get_cdk_stacks(module_path, env_vars, context_opts, output_dir=None):
+    """Return list of CDK stacks.
+
+    Args:
+        module_path (str): Path to the module.
+        env_vars (Dict[str, str]): Environment variables.
+        context_opts (List[str]): CDK context options.
+        output_dir (Optional[str]): Directory to write the cloud assembly
+            synthesized while listing the stacks to.
+
+    """
     LOGGER.debug("listing stacks in the CDK app prior to diff...")
+    command_opts = ["list"] + context_opts
+    if output_dir:
+        command_opts.extend(["--output", output_dir])
     result = subprocess.check_output(
         generate_node_command(
-            command="cdk", command_opts=["list"] + context_opts, path=module_path
+            command="cdk", command_opts=command_opts, path=module_path
         ),
         env=env_vars,
     )
@@ -33,6 +51,55 @@ def get_cdk_stacks(module_path, env_vars, context_opts):
     return result
 
 
+def _write_output(stream, data):
+    """Write the captured output of a subprocess to a stream."""
+    if isinstance(data, bytes):  # python3 returns encoded bytes
+        data = data.decode("utf-8", "replace")
+    if data:
+        stream.write(data)
+        stream.flush()
+
+
+def run_cdk_diffs(
+    stacks, cdk_opts, module_path, env_vars, max_workers=MAX_CONCURRENT_DIFFS
+):
+    """Run ``cdk diff`` for each stack at the same time.
+
+    The output of each diff (stdout and stderr combined, as ``cdk`` writes
+    the diff itself to stderr) is captured and written to stderr in the
+    order of the stacks as soon as the diffs of all stacks before it have
+    been written.
+
+    Args:
+        stacks (List[str]): Names of the stacks to diff.
+        cdk_opts (List[str]): CDK command and options to run for each stack.
+        module_path (str): Path to the module.
+        env_vars (Dict[str, str]): Environment variables.
+        max_workers (int): Maximum number of diffs to run at the same time.
+
+    """
+    if not stacks:
+        return
+
+    def _diff(stack):
+        """Run ``cdk diff`` for a single stack and capture its output."""
+        proc = subprocess.Popen(
+            generate_node_command("cdk", cdk_opts + [stack], module_path),
+            env=env_vars,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        return proc.communicate()[0]
+
+    pool = ThreadPool(min(max_workers, len(stacks)))
+    try:
+        for output in pool.imap(_diff, stacks):
+            _write_output(sys.stderr, output)
+    finally:
+        pool.close()
+        pool.join()
+
+
 class CloudDevelopmentKit(RunwayModule):
     """CDK Runway Module."""
 
@@ -92,15 +159,22 @@ class CloudDevelopmentKit(RunwayModule):
                     cdk_opts.extend(cdk_context_opts)
                     if command == "diff":
                         self.logger.info("plan (in progress)")
-                        for i in get_cdk_stacks(
-                            self.path, self.context.env.vars, cdk_context_opts
-                        ):
-                            subprocess.call(
-                                generate_node_command(
-                                    "cdk", cdk_opts + [i], self.path  # 'diff <stack>'
+                        # synthesize once & diff each stack against the assembly
+                        cdk_out = tempfile.mkdtemp(prefix="runway-cdk-")
+                        try:
+                            run_cdk_diffs(
+                                get_cdk_stacks(
+                                    self.path,
+                                    self.context.env.vars,
+                                    cdk_context_opts,
+                                    output_dir=cdk_out,
                                 ),
-                                env=self.context.env.vars,
+                                cdk_opts + ["--app", cdk_out],  # 'diff <stack>'
+                                self.path,
+                                self.context.env.vars,
                             )
+                        finally:
+                            shutil.rmtree(cdk_out, ignore_errors=True)
                         self.logger.info("plan (complete)")
                     else:
                         # Make sure we're targeting all stacks
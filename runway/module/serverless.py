@@ -2,6 +2,7 @@
 from __future__ import print_function
 
 import argparse
+import copy
 import logging
 import os
 import re
@@ -16,7 +17,7 @@ import yaml
 from runway.hooks.staticsite.util import get_hash_of_files
 
 from .._logging import PrefixAdaptor
-from ..s3_util import does_s3_object_exist, download, ensure_bucket_exists, upload
+from ..s3_util import download, ensure_bucket_exists, get_existing_s3_keys, upload
 from ..util import YamlDumper, cached_property, merge_dicts
 from . import ModuleOptions, RunwayModuleNpm, generate_node_command, run_module_command
 
@@ -69,9 +70,58 @@ def get_src_hash(sls_config, path):
     return hashes
 
 
+def set_package_artifacts(sls_config, artifacts, path):
+    """Use existing packages as the artifacts of a Serverless config.
+
+    Serverless does not build a package for a function (or the service) that
+    has an artifact.
+
+    Args:
+        sls_config (Dict[str, Any]): Resolved Serverless config.
+        artifacts (Dict[str, str]): Path of existing packages keyed on the
+            name of the function (or service) from :func:`get_src_hash`.
+        path (str): Module path.
+
+    Returns:
+        Dict[str, Any]: Serverless config with the artifacts.
+
+    """
+    result = copy.deepcopy(sls_config)
+    for key, artifact in artifacts.items():
+        if key in result.get("functions", {}):
+            config = result["functions"][key]
+        else:
+            config = result
+        config.setdefault("package", {})["artifact"] = os.path.relpath(artifact, path)
+    return result
+
+
+def set_config_opt(sls_opts, config_file):
+    """Set the Serverless config file of a list of options.
+
+    Args:
+        sls_opts (List[str]): List of options for Serverless CLI.
+        config_file (str): Name of the config file.
+
+    Returns:
+        List[str]: Options using the config file.
+
+    """
+    result = list(sls_opts)
+    for flag in ["--config", "-c"]:
+        while flag in result:
+            index = result.index(flag)
+            del result[index : index + 2]
+    return result + ["--config", config_file]
+
+
 def deploy_package(sls_opts, bucketname, context, path, logger=LOGGER):
     """Run sls package command.
 
+    The hash of the source of each package is checked in S3 before
+    packaging. Existing packages are downloaded and used as artifacts so
+    that Serverless only builds the packages that do not exist yet.
+
     Args:
         sls_opts (List[str]): List of options for Serverless CLI.
         bucketname (str): S3 Bucket name.
@@ -82,51 +132,83 @@ def deploy_package(sls_opts, bucketname, context, path, logger=LOGGER):
 
     """
     package_dir = tempfile.mkdtemp()
+    artifact_dir = tempfile.mkdtemp()
     logger.debug("package directory: %s", package_dir)
 
     ensure_bucket_exists(bucketname, context.env.aws_region)
     sls_config = run_sls_print(sls_opts, context.env.vars, path)
     hashes = get_src_hash(sls_config, path)
-
-    sls_opts[0] = "package"
-    sls_opts.extend(["--package", package_dir])
-    sls_package_cmd = generate_node_command(
-        command="sls", command_opts=sls_opts, path=path
-    )
-
-    logger.info("package %s (in progress)", os.path.basename(path))
-    run_module_command(
-        cmd_list=sls_package_cmd, env_vars=context.env.vars, logger=logger
+    existing = get_existing_s3_keys(
+        bucketname, [src_hash + ".zip" for src_hash in hashes.values()]
     )
-    logger.info("package %s (complete)", os.path.basename(path))
 
-    for key in hashes.keys():
+    artifacts = {}
+    for key in sorted(hashes):
         hash_zip = hashes[key] + ".zip"
-        func_zip = os.path.basename(key) + ".zip"
-        if does_s3_object_exist(bucketname, hash_zip):
+        if hash_zip in existing:
             logger.info("found existing package for %s", key)
-            download(bucketname, hash_zip, os.path.join(package_dir, func_zip))
+            artifacts[key] = download(
+                bucketname,
+                hash_zip,
+                os.path.join(artifact_dir, os.path.basename(key) + ".zip"),
+            )
         else:
             logger.info("no existing package found for %s", key)
-            zip_name = os.path.join(package_dir, func_zip)
-            upload(bucketname, hash_zip, zip_name)
-
-    sls_opts[0] = "deploy"
-    # --package must be provided to "deploy" as a relative path to support
-    # serverless@<1.70.0. the fix to support absolute path was implimented
-    # somewhere between 1.60.0 and 1.70.0.
-    sls_opts[-1] = os.path.relpath(package_dir)
-    sls_deploy_cmd = generate_node_command(
-        command="sls", command_opts=sls_opts, path=path
-    )
 
-    logger.info("deploy (in progress)")
-    run_module_command(
-        cmd_list=sls_deploy_cmd, env_vars=context.env.vars, logger=logger
-    )
-    logger.info("deploy (complete)")
+    tmp_file = None
+    try:
+        if artifacts:
+            # Serverless requires the config to be in the service directory.
+            # It is only readable by the current user since the resolved
+            # config can contain secrets & the name is unique to prevent
+            # collisions when run in parallel.
+            tmp_fd, tmp_file = tempfile.mkstemp(dir=path, suffix=".tmp.serverless.yml")
+            with os.fdopen(tmp_fd, "w") as stream:
+                yaml.safe_dump(
+                    set_package_artifacts(sls_config, artifacts, path), stream
+                )
+            logger.debug("created temporary Serverless config: %s", tmp_file)
+            sls_opts = set_config_opt(sls_opts, os.path.basename(tmp_file))
 
-    shutil.rmtree(package_dir)
+        sls_opts[0] = "package"
+        sls_opts.extend(["--package", package_dir])
+        sls_package_cmd = generate_node_command(
+            command="sls", command_opts=sls_opts, path=path
+        )
+
+        logger.info("package %s (in progress)", os.path.basename(path))
+        run_module_command(
+            cmd_list=sls_package_cmd, env_vars=context.env.vars, logger=logger
+        )
+        logger.info("package %s (complete)", os.path.basename(path))
+
+        for key in sorted(hashes):
+            func_zip = os.path.join(package_dir, os.path.basename(key) + ".zip")
+            if key in artifacts:
+                shutil.copyfile(artifacts[key], func_zip)
+            else:
+                upload(bucketname, hashes[key] + ".zip", func_zip)
+
+        sls_opts[0] = "deploy"
+        # --package must be provided to "deploy" as a relative path to support
+        # serverless@<1.70.0. the fix to support absolute path was implimented
+        # somewhere between 1.60.0 and 1.70.0.
+        sls_opts[-1] = os.path.relpath(package_dir)
+        sls_deploy_cmd = generate_node_command(
+            command="sls", command_opts=sls_opts, path=path
+        )
+
+        logger.info("deploy (in progress)")
+        run_module_command(
+            cmd_list=sls_deploy_cmd, env_vars=context.env.vars, logger=logger
+        )
+        logger.info("deploy (complete)")
+    finally:
+        if tmp_file:
+            os.remove(tmp_file)
+            logger.debug("removed temporary Serverless config")
+        shutil.rmtree(package_dir)
+        shutil.rmtree(artifact_dir)
 
 
 class Serverless(RunwayModuleNpm):
@@ -1,9 +1,12 @@
 """Terraform module."""
+import hashlib
 import json
 import logging
+import os
 import re
 import subprocess
 import sys
+from contextlib import contextmanager
 
 import hcl
 import six
@@ -20,8 +23,18 @@ if sys.version_info[0] > 2:  # TODO remove after droping python 2
 else:
     from pathlib2 import Path  # pylint: disable=E
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
 LOGGER = logging.getLogger(__name__)
 
+#: Environment variables that change the result of ``terraform init``.
+INIT_ENV_VARS = ["TF_CLI_ARGS", "TF_CLI_ARGS_init", "TF_WORKSPACE"]
+#: File in the ``.terraform`` directory that records the last successful init.
+INIT_STATE_FILE = "runway-init.json"
+
 
 def gen_workspace_tfvars_files(environment, region):
     """Generate possible Terraform workspace tfvars filenames."""
@@ -54,6 +67,28 @@ def update_env_vars_with_tf_var_values(os_env_vars, tf_vars):
     return os_env_vars
 
 
+@contextmanager
+def plugin_cache_lock(cache_dir):
+    """Prevent more than one process from writing to a plugin cache at once.
+
+    Terraform does not support concurrent writes to its plugin cache. The
+    lock is only used where ``fcntl`` is available.
+
+    Args:
+        cache_dir (Optional[Path]): Terraform plugin cache directory.
+
+    """
+    if not fcntl or not cache_dir:
+        yield
+        return
+    with open(str(cache_dir / ".runway.lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 class Terraform(RunwayModule):
     """Terraform Runway Module."""
 
@@ -135,6 +170,52 @@ class Terraform(RunwayModule):
                 break  # stop looking if one is found
         return result
 
+    @property
+    def init_args(self):
+        """Arguments for ``terraform init``.
+
+        Returns:
+            List[str]
+
+        """
+        return (
+            ["-reconfigure"]
+            + self.options.backend_config.init_args
+            + self.options.args["init"]
+        )
+
+    @property
+    def init_state_file(self):
+        """File that records the last successful ``terraform init``.
+
+        Returns:
+            Path
+
+        """
+        return self.path / ".terraform" / INIT_STATE_FILE
+
+    @cached_property
+    def plugin_cache_dir(self):
+        """Directory where Terraform caches the providers it downloads.
+
+        If ``TF_PLUGIN_CACHE_DIR`` is not set, it is set to
+        ``~/.runway_cache/terraform_plugins`` so that providers are shared by
+        all modules and only downloaded once per version.
+
+        Returns:
+            Optional[Path]: ``None`` if ``TF_PLUGIN_CACHE_DIR`` is set to an
+            empty value to disable the plugin cache.
+
+        """
+        if "TF_PLUGIN_CACHE_DIR" in self.context.env.vars:
+            value = self.context.env.vars["TF_PLUGIN_CACHE_DIR"]
+            return Path(value) if value else None
+        cache_dir = (
+            Path(os.path.expanduser("~")) / ".runway_cache" / "terraform_plugins"
+        )
+        self.context.env.vars["TF_PLUGIN_CACHE_DIR"] = str(cache_dir)
+        return cache_dir
+
     @property
     def skip(self):
         """Determine if the module should be skipped.
@@ -183,6 +264,24 @@ class Terraform(RunwayModule):
         )
         sys.exit(1)
 
+    @cached_property
+    def tf_version(self):
+        """Version of Terraform reported by ``terraform version``.
+
+        An empty string is returned if the version could not be determined.
+
+        """
+        try:
+            output = subprocess.check_output(
+                [self.tf_bin, "version"], env=self.context.env.vars
+            ).decode()
+        except (OSError, subprocess.CalledProcessError):
+            self.logger.debug("unable to get the version of Terraform", exc_info=True)
+            return ""
+        # only the first line is used since the rest can change between runs
+        # (e.g. provider versions or a notice that an update is available)
+        return output.strip().split("\n")[0]
+
     def cleanup_dot_terraform(self):
         """Remove .terraform excluding the plugins directly.
 
@@ -209,6 +308,99 @@ class Terraform(RunwayModule):
             self.logger.debug("removing: %s", child)
             send2trash(str(child))  # TODO remove str when dropping python 2
 
+    def get_local_module_dirs(self):
+        """Get the directories of local modules installed by ``terraform init``.
+
+        These are read from the manifest of modules written to the
+        ``.terraform`` directory by ``terraform init``.
+
+        Returns:
+            List[Path]: Sorted directories of modules with a local source
+            (e.g. ``./modules/example``), excluding the root module.
+
+        """
+        try:
+            manifest = json.loads(
+                (self.path / ".terraform" / "modules" / "modules.json").read_text()
+            )
+        except (IOError, OSError, ValueError):
+            return []
+        if not isinstance(manifest, dict):
+            return []
+        result = set()
+        for module in manifest.get("Modules") or []:
+            if not isinstance(module, dict) or not module.get("Dir"):
+                continue
+            if module.get("Source", "").startswith(("./", "../", ".\\", "..\\")):
+                directory = self.path / module["Dir"]
+                if directory.resolve() != self.path.resolve():
+                    result.add(directory)
+        return sorted(result)
+
+    def get_init_fingerprint(self):
+        """Get a hash of everything that changes the result of ``terraform init``.
+
+        This includes the ``init`` command, Terraform version, backend config
+        file, Terraform files of the module and its local modules, dependency
+        lock file, and environment variables that are read by Terraform.
+
+        Returns:
+            str
+
+        """
+        paths = sorted(self.path.glob("*.tf")) + sorted(self.path.glob("*.tf.json"))
+        paths.append(self.path / ".terraform.lock.hcl")
+        if self.options.backend_config.config_file:
+            paths.append(self.options.backend_config.config_file)
+        modules = {}
+        for directory in self.get_local_module_dirs():
+            modules[os.path.relpath(str(directory), str(self.path))] = {
+                path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+                for path in sorted(directory.glob("*.tf"))
+                + sorted(directory.glob("*.tf.json"))
+                if path.is_file()
+            }
+        data = {
+            "command": self.gen_command("init", self.init_args),
+            "env_vars": {
+                name: self.context.env.vars.get(name) for name in INIT_ENV_VARS
+            },
+            "environment": self.context.env.name,
+            "files": {
+                path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+                for path in paths
+                if path.is_file()
+            },
+            "modules": modules,
+            "region": self.context.env.aws_region,
+            "version": self.tf_version,
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def init_is_current(self):
+        """Determine if the last successful ``terraform init`` is still valid.
+
+        Returns:
+            bool: Nothing that changes the result of ``terraform init`` has
+            changed since it was last run successfully.
+
+        """
+        try:
+            state = json.loads(self.init_state_file.read_text())
+        except (IOError, OSError, ValueError):
+            return False
+        if not isinstance(state, dict):
+            return False
+        return state.get("fingerprint") == self.get_init_fingerprint()
+
+    def save_init_state(self):
+        """Record a successful ``terraform init``."""
+        if not self.init_state_file.parent.is_dir():
+            return
+        self.init_state_file.write_text(
+            six.u(json.dumps({"fingerprint": self.get_init_fingerprint()}))
+        )
+
     def gen_command(self, command, args_list=None):
         """Generate Terraform command."""
         if isinstance(command, (list, tuple)):
@@ -351,19 +543,17 @@ class Terraform(RunwayModule):
         https://www.terraform.io/docs/commands/init.html
 
         """
-        cmd = self.gen_command(
-            "init",
-            ["-reconfigure"]
-            + self.options.backend_config.init_args
-            + self.options.args["init"],
-        )
+        cmd = self.gen_command("init", self.init_args)
+        if self.plugin_cache_dir and not self.plugin_cache_dir.is_dir():
+            self.plugin_cache_dir.mkdir(parents=True)
         try:
-            run_module_command(
-                cmd,
-                env_vars=self.context.env.vars,
-                exit_on_error=False,
-                logger=self.logger,
-            )
+            with plugin_cache_lock(self.plugin_cache_dir):
+                run_module_command(
+                    cmd,
+                    env_vars=self.context.env.vars,
+                    exit_on_error=False,
+                    logger=self.logger,
+                )
         except subprocess.CalledProcessError as shelloutexc:
             # cleaner output by not letting the exception raise
             sys.exit(shelloutexc.returncode)
@@ -460,10 +650,15 @@ class Terraform(RunwayModule):
             self.handle_backend()
             if self.skip:
                 return
-            self.cleanup_dot_terraform()
             self.handle_parameters()
             self.logger.info("init (in progress)")
-            self.terraform_init()
+            if self.init_is_current():
+                self.logger.verbose(
+                    "skipped init; nothing has changed since the last init"
+                )
+            else:
+                self.cleanup_dot_terraform()
+                self.terraform_init()
             if self.current_workspace != self.required_workspace:
                 if re.compile("^[*\\s]\\s%s$" % self.required_workspace, re.M).search(
                     self.terraform_workspace_list()
@@ -473,6 +668,7 @@ class Terraform(RunwayModule):
                     self.terraform_workspace_new(self.required_workspace)
                 self.logger.verbose("re-running init after workspace change...")
                 self.terraform_init()
+            self.save_init_state()
             self.logger.info("init (complete)")
             self.terraform_get()
             self.logger.info("%s (in progress)", action)
@@ -3,6 +3,7 @@ import logging
 import os
 import tempfile
 import zipfile
+from multiprocessing.pool import ThreadPool
 
 import boto3
 from boto3.s3.transfer import S3Transfer
@@ -115,6 +116,48 @@ def does_s3_object_exist(bucket, key, session=None, region="us-east-1"):
     return True
 
 
+def get_existing_s3_keys(
+    bucket, keys, session=None, region="us-east-1", max_workers=10
+):
+    """Determine which objects exist on s3, checking them in parallel.
+
+    Args:
+        bucket (str): Name of the bucket.
+        keys (List[str]): Keys of the objects to check.
+        session (Optional[boto3.Session]): Boto3 session.
+        region (str): AWS region.
+        max_workers (int): Maximum number of objects to check at the same time.
+
+    Returns:
+        Set[str]: Keys of the objects that exist.
+
+    """
+    s3_client = _get_client(session, region)
+
+    def _exists(key):
+        """Determine if an object exists."""
+        try:
+            s3_client.head_object(Bucket=bucket, Key=key)
+            LOGGER.debug("s3 object exists: %s/%s", bucket, key)
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "404":
+                LOGGER.debug("s3 object does not exist: %s/%s", bucket, key)
+                return False
+            raise
+        return True
+
+    keys = list(keys)
+    if not keys:
+        return set()
+    pool = ThreadPool(min(max_workers, len(keys)))
+    try:
+        results = pool.map(_exists, keys)
+    finally:
+        pool.close()
+        pool.join()
+    return {key for key, exists in zip(keys, results) if exists}
+
+
 def upload(bucket, key, filename, session=None):
     """Upload file to S3 bucket."""
     s3_client = _get_client(session)
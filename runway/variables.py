@@ -49,8 +49,58 @@ def resolve_variables(variables, context, provider):
             of the base provider.
 
     """
+    prefetch_lookups(variables, context, provider=provider)
+    try:
+        for variable in variables:
+            variable.resolve(context=context, provider=provider)
+    finally:
+        clear_lookup_cache(context)
+
+
+def prefetch_lookups(variables, context, **kwargs):
+    # type: (Iterable['Variable'], Any, Any) -> None
+    """Retrieve data for the lookups of many variables in batches.
+
+    Lookups are grouped by handler and passed to the ``prefetch`` method of
+    the handler. Only lookups whose data does not contain other lookups can
+    be prefetched. The data is stored in the lookup cache of the context
+    which should be cleared with :func:`clear_lookup_cache` once the
+    variables have been resolved.
+
+    Args:
+        variables: Variables that are about to be resolved.
+        context: The current context object.
+
+    """
+    grouped = {}  # type: Dict[Any, List[str]]
     for variable in variables:
-        variable.resolve(context=context, provider=provider)
+        for lookup in variable.lookups:
+            prefetch = getattr(lookup.handler, "prefetch", None)
+            if prefetch and lookup.lookup_data.resolved:
+                grouped.setdefault(prefetch, []).append(lookup.lookup_data.value)
+    for prefetch, values in grouped.items():
+        try:
+            prefetch(values, context, **kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            # errors are raised when the lookups are resolved
+            LOGGER.debug("failed to prefetch lookups: %s", err)
+
+
+def clear_lookup_cache(context):
+    # type: (Any) -> None
+    """Clear the data retrieved by :func:`prefetch_lookups`.
+
+    Data is only cached while variables are being resolved so that a lookup
+    resolved later (e.g. after a hook has changed the data) retrieves it
+    again.
+
+    Args:
+        context: The current context object.
+
+    """
+    lookup_cache = getattr(context, "lookup_cache", None)
+    if isinstance(lookup_cache, dict):
+        lookup_cache.clear()
 
 
 class Variable(object):
@@ -82,6 +132,12 @@ class Variable(object):
         """
         return self._value.dependencies
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Lookups contained in the variable, including nested lookups."""
+        return self._value.lookups
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -146,6 +202,12 @@ class VariableValue(object):
         """Stack names that this variable depends on."""
         return set()
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Lookups contained in the variable value."""
+        return []
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -312,6 +374,15 @@ class VariableValueList(VariableValue, list):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Lookups contained in the variable value."""
+        result = []
+        for item in self:
+            result.extend(item.lookups)
+        return result
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -387,6 +458,15 @@ class VariableValueDict(VariableValue, dict):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Lookups contained in the variable value."""
+        result = []
+        for item in self.values():
+            result.extend(item.lookups)
+        return result
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -465,6 +545,15 @@ class VariableValueConcatenation(VariableValue, list):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Lookups contained in the variable value."""
+        result = []
+        for item in self:
+            result.extend(item.lookups)
+        return result
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -606,6 +695,12 @@ class VariableValueLookup(VariableValue):
             return self.handler.dependencies(self.lookup_data)
         return set()
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """This lookup and any lookups nested in its data."""
+        return [self] + self.lookup_data.lookups
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -63,6 +63,8 @@ def sanitize_environment():
         "DEBUG",
         "DEPLOY_ENVIRONMENT",
         "CFNGIN_STACK_POLL_TIME",
+        "CFNGIN_STACK_STATUS_POLL_TIME",
+        "CFNGIN_TEMPLATE_CACHE_DIR",
         "RUNWAY_MAX_CONCURRENT_MODULES",
         "RUNWAY_MAX_CONCURRENT_REGIONS",
     ]
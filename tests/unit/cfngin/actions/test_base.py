@@ -330,3 +330,74 @@ class TestBaseAction(unittest.TestCase):
                     MOCK_VERSION,
                 ),
             )
+
+    def test_s3_stack_push(self):
+        """Test s3_stack_push lists existing templates once."""
+        context = mock_context("mynamespace")
+        existing = MockBlueprint(name="existing", context=context)
+        new = MockBlueprint(name="new", context=context)
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(self.provider, region=self.region),
+        )
+        existing_key = "stack_templates/mynamespace-existing/existing-%s.json" % (
+            MOCK_VERSION
+        )
+        new_key = "stack_templates/mynamespace-new/new-%s.json" % MOCK_VERSION
+
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": existing_key}]},
+            {"Bucket": "stacker-mynamespace", "Prefix": "stack_templates/mynamespace"},
+        )
+        stubber.add_response(
+            "put_object",
+            {},
+            {
+                "Bucket": "stacker-mynamespace",
+                "Key": new_key,
+                "Body": ANY,
+                "ServerSideEncryption": "AES256",
+                "ACL": "bucket-owner-full-control",
+            },
+        )
+
+        with stubber, patch.object(MockBlueprint, "rendered", "{}"):
+            assert action.s3_stack_push(existing).endswith(existing_key)
+            assert action.s3_stack_push(new).endswith(new_key)
+            assert action.s3_stack_push(new).endswith(new_key)
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_list_denied(self):
+        """Test s3_stack_push checks each template if they can't be listed."""
+        context = mock_context("mynamespace")
+        blueprint = MockBlueprint(name="myblueprint", context=context)
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(self.provider, region=self.region),
+        )
+
+        stubber = Stubber(action.s3_conn)
+        stubber.add_client_error("list_objects_v2", service_error_code="AccessDenied")
+        stubber.add_response("head_object", {})
+        stubber.add_response("head_object", {})
+
+        with stubber:
+            action.s3_stack_push(blueprint)
+            action.s3_stack_push(blueprint)
+        stubber.assert_no_pending_responses()
+
+    @patch("runway.cfngin.actions.base.LOGGER")
+    def test_execute_logs_session_pool_stats(self, mock_logger):
+        """Test execute logs the statistics of the session pool."""
+        action = BaseAction(
+            context=mock_context("mynamespace"),
+            provider_builder=MockProviderBuilder(self.provider, region=self.region),
+        )
+        with patch.object(action, "run", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                action.execute()
+        mock_logger.debug.assert_called_once_with(
+            "boto3 session pool statistics: %s", ANY
+        )
@@ -81,6 +81,7 @@ class TestDestroyAction(unittest.TestCase):
         # it being successfully deleted)
         provider = MagicMock()
         provider.get_stack.side_effect = StackDoesNotExist("mock")
+        provider.poll_stack.return_value = False
         self.action.provider_builder = MockProviderBuilder(provider)
         status = self.action._destroy_stack(MockStack("vpc"), status=PENDING)
         # if we haven't processed the step (ie. has never been SUBMITTED,
@@ -94,6 +95,7 @@ class TestDestroyAction(unittest.TestCase):
     def test_destroy_stack_step_statuses(self):
         """Test destroy stack step statuses."""
         mock_provider = MagicMock()
+        mock_provider.poll_stack.return_value = False
         stacks_dict = self.context.get_stacks_dict()
 
         def get_stack(stack_name):
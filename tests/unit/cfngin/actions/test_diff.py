@@ -15,7 +15,7 @@ from runway.cfngin.actions.diff import (
     diff_parameters,
 )
 from runway.cfngin.providers.aws.default import Provider
-from runway.cfngin.status import SkippedStatus
+from runway.cfngin.status import COMPLETE, SkippedStatus
 
 from ..factories import MockProviderBuilder, MockThreadingEvent
 
@@ -94,6 +94,9 @@ class TestAction(object):
             )
         )
         monkeypatch.setattr(provider, "get_stack_changes", mock_get_stack_changes)
+        monkeypatch.setattr(
+            provider, "is_stack_unchanged", MagicMock(return_value=False)
+        )
         stack = MagicMock()
         stack.region = cfngin_context.region
         stack.name = "test-stack"
@@ -110,6 +113,39 @@ class TestAction(object):
         mock_get_stack_changes.assert_called_once()
         assert result == expected
 
+    def test_diff_stack_unchanged(self, caplog, cfngin_context, monkeypatch):
+        """Test _diff_stack does not create a ChangeSet for unchanged stacks."""
+        caplog.set_level(logging.INFO)
+        cfngin_context.add_stubber("cloudformation")
+        provider = Provider(cfngin_context.get_session())
+        mock_get_stack_changes = MagicMock()
+        mock_is_stack_unchanged = MagicMock(return_value=True)
+        monkeypatch.setattr(provider, "get_stack_changes", mock_get_stack_changes)
+        monkeypatch.setattr(provider, "is_stack_unchanged", mock_is_stack_unchanged)
+        monkeypatch.setattr(provider, "get_outputs", MagicMock(return_value={}))
+        stack = MagicMock()
+        stack.region = cfngin_context.region
+        stack.name = "test-stack"
+        stack.fqn = "test-stack"
+        stack.blueprint.rendered = "{}"
+        stack.locked = False
+        stack.status = None
+        stack.tags = {"key": "val"}
+
+        action = Action(
+            context=cfngin_context,
+            provider_builder=MockProviderBuilder(provider),
+            cancel=MockThreadingEvent(),
+        )
+        monkeypatch.setattr(action, "build_parameters", MagicMock(return_value=[]))
+        assert action._diff_stack(stack) == COMPLETE
+        mock_is_stack_unchanged.assert_called_once_with(
+            "test-stack", "{}", [], [{"Key": "key", "Value": "val"}]
+        )
+        mock_get_stack_changes.assert_not_called()
+        stack.set_outputs.assert_called_once_with({})
+        assert "test-stack:no changes" in caplog.messages
+
 
 class TestDictValueFormat(unittest.TestCase):
     """Tests for runway.cfngin.actions.diff.DictValue."""
@@ -1,6 +1,9 @@
 """Tests for runway.cfngin.blueprints.base."""
 # pylint: disable=abstract-method,no-self-use,protected-access,unused-argument
+import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 from mock import MagicMock, patch
@@ -10,6 +13,7 @@ from runway.cfngin.blueprints.base import (
     Blueprint,
     CFNParameter,
     build_parameter,
+    get_source_hash,
     parse_user_data,
     resolve_variable,
     validate_allowed_values,
@@ -125,6 +129,96 @@ class TestBaseBlueprint(unittest.TestCase):
         )
 
 
+class TestTemplateCache(unittest.TestCase):
+    """Tests for caching rendered templates of a Blueprint."""
+
+    def setUp(self):
+        """Run before tests."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.env = patch.dict(os.environ, {"CFNGIN_TEMPLATE_CACHE_DIR": self.cache_dir})
+        self.env.start()
+
+    def tearDown(self):
+        """Run after tests."""
+        self.env.stop()
+        shutil.rmtree(self.cache_dir)
+
+    @staticmethod
+    def build_blueprint(calls, value="foo"):
+        """Build a blueprint with resolved variables that counts renders."""
+
+        class TestBlueprint(Blueprint):
+            """Test blueprint."""
+
+            VARIABLES = {"Param1": {"type": str}, "Param2": {"type": CFNString}}
+
+            def create_template(self):
+                """Create template."""
+                calls.append(self.name)
+                self.template.set_transform("AWS::Serverless-2016-10-31")
+                self.add_output("Output1", self.get_variables()["Param1"])
+
+        blueprint = TestBlueprint(name="test", context=mock_context())
+        blueprint.resolve_variables(
+            [Variable("Param1", value, "cfngin"), Variable("Param2", "bar", "cfngin")]
+        )
+        return blueprint
+
+    def test_cached(self):
+        """Test an unchanged blueprint is read from the cache."""
+        calls = []
+        blueprint = self.build_blueprint(calls)
+        rendered = blueprint.rendered
+        version = blueprint.version
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        cached = self.build_blueprint(calls)
+        self.assertEqual(cached.rendered, rendered)
+        self.assertEqual(cached.version, version)
+        self.assertTrue(cached.requires_change_set)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cached.get_output_definitions(), {"Output1": {"Value": "foo"}})
+
+    def test_cached_variables_changed(self):
+        """Test a blueprint is rendered when its variables change."""
+        calls = []
+        rendered = self.build_blueprint(calls).rendered
+        self.assertNotEqual(self.build_blueprint(calls, "other").rendered, rendered)
+        self.assertEqual(len(calls), 2)
+
+    def test_cached_version_changed(self):
+        """Test a blueprint is rendered when runway or troposphere change."""
+        calls = []
+        path = self.build_blueprint(calls).get_template_cache_path()
+        with patch("runway.cfngin.blueprints.base.__version__", "0.0.1"):
+            self.assertNotEqual(
+                self.build_blueprint(calls).get_template_cache_path(), path
+            )
+        with patch("runway.cfngin.blueprints.base.troposphere.__version__", "0.0.1"):
+            self.assertNotEqual(
+                self.build_blueprint(calls).get_template_cache_path(), path
+            )
+
+    def test_cache_disabled(self):
+        """Test templates are not cached unless enabled."""
+        self.env.stop()
+        calls = []
+        self.build_blueprint(calls).rendered  # pylint: disable=expression-not-assigned
+        self.build_blueprint(calls).rendered  # pylint: disable=expression-not-assigned
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.env.start()
+
+    def test_get_source_hash(self):
+        """Test get_source_hash."""
+        self.assertEqual(
+            get_source_hash(TestTemplateCache), get_source_hash(TestTemplateCache)
+        )
+        self.assertIsNone(
+            get_source_hash(type("Dynamic", (object,), {"__module__": "missing"}))
+        )
+
+
 class TestVariables(unittest.TestCase):  # pylint: disable=too-many-public-methods
     """Tests for runway.cfngin.blueprints.base.Blueprint variables."""
 
@@ -4,6 +4,7 @@ import logging
 import os
 import os.path
 import random  # pylint: disable=syntax-error
+import subprocess
 import sys
 import unittest
 from io import BytesIO as StringIO
@@ -22,7 +23,14 @@ from runway.cfngin.context import Context
 from runway.cfngin.exceptions import InvalidDockerizePipConfiguration
 from runway.cfngin.hooks.aws_lambda import (
     ZIP_PERMS_MASK,
+    _FUNCTION_STATE,
     _calculate_hash,
+    _check_call_logged,
+    _dependency_cache_key,
+    _get_python_version,
+    _install_cached_dependencies,
+    _prune_dependency_cache,
+    _zip_files,
     copydir,
     dockerized_pip,
     find_requirements,
@@ -229,6 +237,27 @@ class TestLambdaHooks(unittest.TestCase):
         self.assertIsInstance(f2_code, Code)
         self.assert_s3_zip_file_list(f2_code.S3Bucket, f2_code.S3Key, F2_FILES)
 
+    @mock_s3
+    def test_multiple_functions_concurrency(self):
+        """Test multiple functions processed concurrently."""
+        with self.temp_directory_with_files() as temp_dir:
+            results = self.run_hook(
+                concurrency=4,
+                functions={
+                    "MyFunction": {"path": temp_dir.path + "/f1"},
+                    "OtherFunction": {"path": temp_dir.path + "/f2"},
+                    "LastFunction": {"path": temp_dir.path + "/f1"},
+                },
+            )
+
+        self.assertEqual(list(results), ["MyFunction", "OtherFunction", "LastFunction"])
+        self.assert_s3_zip_file_list(
+            results["OtherFunction"].S3Bucket, results["OtherFunction"].S3Key, F2_FILES,
+        )
+        self.assert_s3_zip_file_list(
+            results["LastFunction"].S3Bucket, results["LastFunction"].S3Key, F1_FILES
+        )
+
     @mock_s3
     def test_patterns_invalid(self):
         """Test patterns invalid."""
@@ -412,6 +441,28 @@ class TestLambdaHooks(unittest.TestCase):
                 hash2 = _calculate_hash(files2, root2)
                 self.assertEqual(hash1, hash2)
 
+    def test_zip_files(self):
+        """Test _zip_files."""
+        with TempDirectory() as temp_dir:
+            root = temp_dir.path
+            for file_name in ALL_FILES:
+                temp_dir.write(file_name, file_name.encode())
+            os.chmod(os.path.join(root, ALL_FILES[0]), 0o700)
+            zip_data, content_hash = _zip_files(iter(reversed(ALL_FILES)), root)
+            self.assertEqual(content_hash, _calculate_hash(ALL_FILES, root))
+
+        with zip_data, ZipFile(zip_data, "r") as zip_file:
+            for zip_info in zip_file.infolist():
+                self.assertEqual(zip_file.read(zip_info).decode(), zip_info.filename)
+            self.assertEqual(
+                sorted(zip_info.filename for zip_info in zip_file.infolist()),
+                sorted(ALL_FILES),
+            )
+            self.assertEqual(
+                (zip_file.getinfo(ALL_FILES[0]).external_attr & ZIP_PERMS_MASK) >> 16,
+                0o755,
+            )
+
     def test_select_bucket_region(self):
         """Test select bucket region."""
         tests = (
@@ -548,7 +599,7 @@ class TestLambdaHooks(unittest.TestCase):
     @patch("runway.cfngin.hooks.aws_lambda._find_files", MagicMock())
     @patch(
         "runway.cfngin.hooks.aws_lambda._zip_files",
-        MagicMock(return_value=("zip_contents", "content_hash")),
+        MagicMock(return_value=(MagicMock(), "content_hash")),
     )
     @patch("runway.cfngin.hooks.aws_lambda._upload_code", MagicMock())
     @patch("runway.cfngin.hooks.aws_lambda.sys")
@@ -841,3 +892,129 @@ def test_copydir():
         assert tmp_dir.read(("src", "lib", "example_file")) == example_file
         assert tmp_dir.read(("dest", "example_file")) == example_file
         assert tmp_dir.read(("dest", "lib", "example_file")) == example_file
+
+
+def test_dependency_cache_key(tmp_path):
+    """Test _dependency_cache_key."""
+    requirements = tmp_path / "requirements.txt"
+    assert not _dependency_cache_key(str(requirements))
+
+    requirements.write_text(u"foo==1.0")
+    key = _dependency_cache_key(str(requirements))
+    runtime_key = _dependency_cache_key(
+        str(requirements), dockerize_pip=True, runtime="python3.8"
+    )
+    image_key = _dependency_cache_key(
+        str(requirements), dockerize_pip=True, docker_image="custom"
+    )
+    assert key == _dependency_cache_key(str(requirements))
+    assert len({key, runtime_key, image_key}) == 3
+    with patch(
+        "runway.cfngin.hooks.aws_lambda._get_python_version",
+        MagicMock(side_effect=["(3, 7, 0)", "(3, 8, 0)"]),
+    ):
+        python_key = _dependency_cache_key(str(requirements), python_path="python")
+        assert key != python_key
+        assert python_key != _dependency_cache_key(
+            str(requirements), python_path="python"
+        )
+
+    requirements.write_text(u"foo==2.0")
+    assert key != _dependency_cache_key(str(requirements))
+
+
+@patch("runway.cfngin.hooks.aws_lambda.subprocess.check_output")
+def test_get_python_version(mock_check_output):
+    """Test _get_python_version."""
+    mock_check_output.return_value = b"((3, 8, 5, 'final', 0), 'linux')"
+    assert _get_python_version("python") == "((3, 8, 5, 'final', 0), 'linux')"
+    assert mock_check_output.call_args[0][0][:2] == ["python", "-c"]
+    mock_check_output.side_effect = OSError
+    assert _get_python_version("python") is None
+
+
+def test_get_python_version_current():
+    """Test _get_python_version with the current interpreter."""
+    assert _get_python_version(sys.executable) == repr(
+        (tuple(sys.version_info), sys.platform)
+    )
+
+
+@patch("runway.cfngin.hooks.aws_lambda.DEPENDENCY_CACHE_MAX_ENTRIES", 2)
+def test_prune_dependency_cache(tmp_path):
+    """Test _prune_dependency_cache."""
+    keys = [str(i) * 64 for i in range(4)]
+    for i, key in enumerate(keys):
+        (tmp_path / key).mkdir()
+        os.utime(str(tmp_path / key), (i, i))
+    (tmp_path / "staging-abc").mkdir()
+
+    _prune_dependency_cache(str(tmp_path), keep=keys[0])
+    assert sorted(os.listdir(str(tmp_path))) == sorted(
+        [keys[0], keys[3], "staging-abc"]
+    )
+
+
+@patch("runway.cfngin.hooks.aws_lambda._install_dependencies")
+def test_install_cached_dependencies(mock_install, tmp_path):
+    """Test _install_cached_dependencies."""
+
+    def install(target, requirements_path, **_kwargs):
+        assert requirements_path == "requirements.txt"
+        os.makedirs(os.path.join(target, "foo"))
+        for name in ["foo/__init__.py", "handler.py"]:
+            with open(os.path.join(target, name), "w") as file_:
+                file_.write("dependency")
+
+    mock_install.side_effect = install
+    cache_root = tmp_path / "cache"
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    (dest / "handler.py").write_text(u"source")
+
+    _install_cached_dependencies(
+        str(cache_root), "key", str(dest), "requirements.txt", python_path="python"
+    )
+    mock_install.assert_called_once_with(ANY, "requirements.txt", python_path="python")
+    assert (dest / "foo" / "__init__.py").read_text() == "dependency"
+    assert (dest / "handler.py").read_text() == "source"
+    assert os.listdir(str(cache_root)) == ["key"]
+
+    other = tmp_path / "other"
+    other.mkdir()
+    _install_cached_dependencies(str(cache_root), "key", str(other), "requirements.txt")
+    mock_install.assert_called_once()
+    assert (other / "handler.py").read_text() == "dependency"
+
+
+@patch("runway.cfngin.hooks.aws_lambda._install_dependencies")
+def test_install_cached_dependencies_concurrent(mock_install, tmp_path):
+    """Test _install_cached_dependencies when cached by another thread."""
+    cache_root = tmp_path / "cache"
+
+    def install(target, _requirements_path, **_kwargs):
+        with open(os.path.join(target, "dep.py"), "w") as file_:
+            file_.write("staged")
+        (cache_root / "key").mkdir()  # cached while installing
+        (cache_root / "key" / "dep.py").write_text(u"cached")
+
+    mock_install.side_effect = install
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    _install_cached_dependencies(str(cache_root), "key", str(dest), "requirements.txt")
+    assert (dest / "dep.py").read_text() == "cached"
+    assert os.listdir(str(cache_root)) == ["key"]
+
+
+def test_check_call_logged(caplog):
+    """Test _check_call_logged."""
+    caplog.set_level(logging.INFO, logger="runway.cfngin.hooks.aws_lambda")
+    _FUNCTION_STATE.name = "MyFunction"
+    try:
+        _check_call_logged([sys.executable, "-c", "print('line1'); print('line2')"])
+        with pytest.raises(subprocess.CalledProcessError):
+            _check_call_logged([sys.executable, "-c", "import sys; sys.exit(1)"])
+    finally:
+        _FUNCTION_STATE.name = None
+    assert caplog.messages == ["MyFunction:line1", "MyFunction:line2"]
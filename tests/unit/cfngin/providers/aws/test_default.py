@@ -1,6 +1,7 @@
 """Tests for runway.cfngin.providers.aws.default."""
-# pylint: disable=too-many-lines
+# pylint: disable=protected-access,too-many-lines
 import copy
+import json
 import os.path
 import random
 import string
@@ -21,6 +22,9 @@ from runway.cfngin.providers.aws.default import (
     DEFAULT_CAPABILITIES,
     MAX_TAIL_RETRIES,
     Provider,
+    SeenEvents,
+    StackEventTailer,
+    StackPoller,
     ask_for_approval,
     create_change_set,
     generate_cloudformation_args,
@@ -32,6 +36,7 @@ from runway.cfngin.providers.aws.default import (
 from runway.cfngin.providers.base import Template
 from runway.cfngin.session_cache import get_session
 from runway.cfngin.stack import Stack
+from runway.cfngin.util import parse_cloudformation_template
 from runway.util import MutableMap
 
 if sys.version_info.major < 3:
@@ -466,6 +471,186 @@ class TestMethods(unittest.TestCase):
         self.assertEqual(result, template_body_result)
 
 
+def generate_stack_event(stack_name, event_id):
+    """Generate describe stack events event."""
+    return {
+        "StackId": stack_name + "12345",
+        "EventId": event_id,
+        "StackName": stack_name,
+        "Timestamp": datetime.now(),
+    }
+
+
+class TestSeenEvents(unittest.TestCase):
+    """Tests for runway.cfngin.providers.aws.default.SeenEvents."""
+
+    def test_add(self):
+        """Test add."""
+        seen = SeenEvents(maxlen=2)
+        seen.add("1")
+        seen.add("1")
+        self.assertEqual(len(seen), 1)
+        seen.add("2")
+        seen.add("3")
+        self.assertEqual(len(seen), 2)
+        self.assertNotIn("1", seen)
+        self.assertIn("2", seen)
+        self.assertIn("3", seen)
+
+
+class TestStackEventTailer(unittest.TestCase):
+    """Tests for runway.cfngin.providers.aws.default.StackEventTailer."""
+
+    def test_watch(self):
+        """Test watch."""
+        provider = MagicMock()
+        events = [[generate_stack_event("stack1", "Event1")], []]
+
+        def get_new_events(_stack_name, _seen):
+            if len(events) > 1:
+                return events.pop(0)
+            cancel.set()
+            return events[0]
+
+        provider.get_new_events.side_effect = get_new_events
+        received_events = []
+        cancel = threading.Event()
+        tailer = StackEventTailer(provider, interval=0)
+        ready = threading.Event()
+        tailer.watch("stack1", cancel, received_events.append, ready=ready)
+
+        provider.prime_seen_events.assert_called_once()
+        self.assertTrue(ready.is_set())
+        self.assertEqual([e["EventId"] for e in received_events], ["Event1"])
+        self.assertEqual(tailer._stacks, {})
+
+    def test_watch_created(self):
+        """Test watch logs all events of a stack created after it is called."""
+        provider = MagicMock()
+        provider.prime_seen_events.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "does not exist"}},
+            "DescribeStackEvents",
+        )
+        events = [[generate_stack_event("stack1", "Event1")]]
+        provider.get_new_events.side_effect = lambda *_: (
+            events.pop(0) if events else []
+        )
+        cancel = threading.Event()
+        received_events = []
+
+        def log_func(event):
+            received_events.append(event)
+            cancel.set()
+
+        with patch.object(default, "TAIL_RETRY_SLEEP", 0):
+            StackEventTailer(provider, interval=0).watch(
+                "stack1", cancel, log_func, ready=threading.Event()
+            )
+        self.assertEqual([e["EventId"] for e in received_events], ["Event1"])
+
+    def test_watch_does_not_exist(self):
+        """Test watch when the stack is never created."""
+        provider = MagicMock()
+        error = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "does not exist"}},
+            "DescribeStackEvents",
+        )
+        provider.prime_seen_events.side_effect = error
+        provider.get_new_events.side_effect = error
+        tailer = StackEventTailer(provider, interval=0)
+
+        with patch.object(default, "TAIL_RETRY_SLEEP", 0):
+            self.assertIsNone(
+                tailer.watch("stack1", threading.Event(), None, action="destroy")
+            )
+            with self.assertRaises(ClientError):
+                tailer.watch("stack1", threading.Event(), None, retries=3)
+        self.assertEqual(provider.get_new_events.call_count, 2)
+        self.assertEqual(tailer._stacks, {})
+
+
+class TestStackPoller(unittest.TestCase):
+    """Tests for runway.cfngin.providers.aws.default.StackPoller."""
+
+    def setUp(self):
+        """Run before tests."""
+        self.cfn = boto3.client(
+            "cloudformation",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        self.stubber = Stubber(self.cfn)
+        self.poller = StackPoller(self.cfn, interval=0)
+
+    def test_wait(self):
+        """Test wait and get_stack."""
+        self.stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(
+                        "stack1", stack_status="CREATE_IN_PROGRESS"
+                    ),
+                    generate_describe_stacks_stack("stack2"),
+                ]
+            },
+        )
+        with self.stubber:
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 5))
+        self.assertEqual(
+            self.poller.get_stack("stack1")["StackStatus"], "CREATE_IN_PROGRESS"
+        )
+        # data is only returned once per wait
+        self.assertIsNone(self.poller.get_stack("stack1"))
+        self.assertIsNone(self.poller.get_stack("stack2"))
+
+    def test_wait_does_not_exist(self):
+        """Test wait for a stack that does not exist."""
+        self.stubber.add_response("describe_stacks", {"Stacks": []})
+        with self.stubber:
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 5))
+        with self.assertRaises(exceptions.StackDoesNotExist):
+            self.poller.get_stack("stack1")
+
+    def test_wait_canceled(self):
+        """Test wait when canceled."""
+        cancel = threading.Event()
+        cancel.set()
+        self.assertTrue(self.poller.wait("stack1", cancel, 5))
+        self.assertIsNone(self.poller.get_stack("stack1"))
+
+    def test_wait_thread_exits(self):
+        """Test the polling thread exits when no stacks are waiting."""
+        response = {"Stacks": [generate_describe_stacks_stack("stack1")]}
+        for _ in range(20):
+            self.stubber.add_response("describe_stacks", response)
+        self.poller.interval = 0.05
+        with self.stubber:
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 5))
+            thread = self.poller._thread
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+            self.assertIsNone(self.poller._thread)
+            self.poller.get_stack("stack1")
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 0.2))
+            self.assertIsNot(self.poller._thread, thread)
+
+    def test_wait_unchanged(self):
+        """Test wait returns after timeout when status is unchanged."""
+        response = {"Stacks": [generate_describe_stacks_stack("stack1")]}
+        for _ in range(20):
+            self.stubber.add_response("describe_stacks", response)
+        self.poller.interval = 0.05
+        with self.stubber:
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 5))
+            self.poller.get_stack("stack1")
+            self.assertFalse(self.poller.wait("stack1", threading.Event(), 0.2))
+        self.assertEqual(
+            self.poller.get_stack("stack1")["StackStatus"], "CREATE_COMPLETE"
+        )
+
+
 class TestProviderDefaultMode(unittest.TestCase):
     """Tests for runway.cfngin.providers.aws.default default mode."""
 
@@ -476,6 +661,53 @@ class TestProviderDefaultMode(unittest.TestCase):
         self.provider = Provider(self.session, region=region, recreate_failed=False)
         self.stubber = Stubber(self.provider.cloudformation)
 
+    def test_get_outputs(self):
+        """Test get_outputs only describes each stack once."""
+        stack = generate_describe_stacks_stack("test-stack")
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "Value"}]
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack]}, {"StackName": "test-stack"}
+        )
+
+        with self.stubber:
+            self.assertEqual(self.provider.get_outputs("test-stack"), {"Key": "Value"})
+            other = Provider(self.session, region="us-east-1")
+            self.assertEqual(other.get_output("test-stack", "Key"), "Value")
+        self.stubber.assert_no_pending_responses()
+
+    def test_invalidate_outputs(self):
+        """Test invalidate_outputs."""
+        stack = generate_describe_stacks_stack("test-stack")
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "Value"}]
+        self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+        self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+
+        with self.stubber:
+            self.provider.get_outputs("test-stack")
+            self.provider.invalidate_outputs("test-stack")
+            self.provider.get_outputs("test-stack")
+        self.stubber.assert_no_pending_responses()
+
+    def test_poll_stack(self):
+        """Test poll_stack."""
+        cancel = MagicMock()
+        cancel.wait.return_value = False
+        self.assertFalse(self.provider.poll_stack("fake_stack", cancel, 30))
+        cancel.wait.assert_called_once_with(30)
+
+    def test_poll_stack_poller(self):
+        """Test poll_stack with a stack poller."""
+        provider = Provider(self.session, region="us-east-1", poll_stacks=True)
+        cancel = threading.Event()
+        stack = generate_describe_stacks_stack("fake_stack")
+        with patch.object(provider.stack_poller, "wait") as mock_wait, patch.object(
+            provider.stack_poller, "get_stack", return_value=stack
+        ):
+            mock_wait.return_value = False
+            self.assertFalse(provider.poll_stack("fake_stack", cancel, 30))
+            mock_wait.assert_called_once_with("fake_stack", cancel, 30)
+            self.assertEqual(provider.get_stack("fake_stack"), stack)
+
     def test_create_stack_no_changeset(self):
         """Test create_stack, no changeset, template url."""
         stack_name = "fake_stack"
@@ -749,6 +981,154 @@ class TestProviderDefaultMode(unittest.TestCase):
             self.provider.noninteractive_destroy_stack("fake-stack")
         self.stubber.assert_no_pending_responses()
 
+    def test_is_stack_unchanged(self):
+        """Test is_stack_unchanged."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(
+            stack_name, tags=[{"Key": "key", "Value": "val"}]
+        )
+        stack["Parameters"] = [
+            {"ParameterKey": "Param1", "ParameterValue": "val"},
+            {"ParameterKey": "Param2", "ParameterValue": "default"},
+        ]
+        get_template = generate_get_template("cfn_template.yaml")
+        template = json.dumps(
+            parse_cloudformation_template(get_template["TemplateBody"])
+        )
+        parameters = [{"ParameterKey": "Param1", "ParameterValue": "val"}]
+        tags = [{"Key": "key", "Value": "val"}]
+
+        self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+        self.stubber.add_response("get_template", get_template)  # only once
+        for _ in range(3):
+            self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+
+        with self.stubber:
+            self.assertTrue(
+                self.provider.is_stack_unchanged(stack_name, template, parameters, tags)
+            )
+            self.assertTrue(
+                self.provider.is_stack_unchanged(
+                    stack_name,
+                    template,
+                    [{"ParameterKey": "Param1", "UsePreviousValue": True}],
+                    tags,
+                )
+            )
+            self.assertFalse(
+                self.provider.is_stack_unchanged(
+                    stack_name,
+                    template,
+                    [{"ParameterKey": "Param1", "ParameterValue": "new"}],
+                    tags,
+                )
+            )
+            self.assertFalse(
+                self.provider.is_stack_unchanged(stack_name, template, parameters, [])
+            )
+        self.stubber.assert_no_pending_responses()
+
+    def test_is_stack_unchanged_template(self):
+        """Test is_stack_unchanged with a different template."""
+        stack_name = "MockStack"
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        )
+        self.stubber.add_response(
+            "get_template", generate_get_template("cfn_template.yaml")
+        )
+
+        with self.stubber:
+            self.assertFalse(
+                self.provider.is_stack_unchanged(
+                    stack_name, '{"Resources": {}}', [], []
+                )
+            )
+        self.stubber.assert_no_pending_responses()
+
+    def test_is_stack_unchanged_default(self):
+        """Test is_stack_unchanged with a parameter default that is a number."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(stack_name)
+        stack["Parameters"] = [{"ParameterKey": "Count", "ParameterValue": "10"}]
+        template = json.dumps(
+            {
+                "Parameters": {"Count": {"Type": "Number", "Default": 10}},
+                "Resources": {"Topic": {"Type": "AWS::SNS::Topic"}},
+            }
+        )
+        self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+        self.stubber.add_response(
+            "get_template", {"StagesAvailable": ["Original"], "TemplateBody": template},
+        )
+
+        with self.stubber:
+            self.assertTrue(
+                self.provider.is_stack_unchanged(stack_name, template, [], [])
+            )
+        self.stubber.assert_no_pending_responses()
+
+    def test_is_stack_unchanged_resolved_values(self):
+        """Test is_stack_unchanged with values resolved by CloudFormation."""
+        templates = [
+            {
+                "Parameters": {"Ami": {"Type": "AWS::SSM::Parameter::Value<String>"}},
+                "Resources": {"Topic": {"Type": "AWS::SNS::Topic"}},
+            },
+            {
+                "Resources": {
+                    "Topic": {
+                        "Type": "AWS::SNS::Topic",
+                        "Properties": {"TopicName": "{{resolve:ssm:/topic/name:1}}"},
+                    }
+                }
+            },
+            {
+                "Resources": {
+                    "Topic": {
+                        "Type": "AWS::SNS::Topic",
+                        "Properties": {
+                            "TopicName": {
+                                "Fn::Sub": "{{resolve:secretsmanager:secret}}-topic"
+                            }
+                        },
+                    }
+                }
+            },
+        ]
+        for index, template in enumerate(templates):
+            stack_name = "MockStack%s" % index
+            template = json.dumps(template)
+            stack = generate_describe_stacks_stack(stack_name)
+            self.stubber.add_response("describe_stacks", {"Stacks": [stack]})
+            self.stubber.add_response(
+                "get_template",
+                {"StagesAvailable": ["Original"], "TemplateBody": template},
+            )
+            with self.stubber:
+                self.assertFalse(
+                    self.provider.is_stack_unchanged(stack_name, template, [], [])
+                )
+        self.stubber.assert_no_pending_responses()
+
+    def test_is_stack_unchanged_in_progress(self):
+        """Test is_stack_unchanged with a stack that is being updated."""
+        stack_name = "MockStack"
+        self.stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(
+                        stack_name, stack_status="UPDATE_IN_PROGRESS"
+                    )
+                ]
+            },
+        )
+
+        with self.stubber:
+            self.assertFalse(self.provider.is_stack_unchanged(stack_name, "{}", [], []))
+        self.stubber.assert_no_pending_responses()
+
     @patch("runway.cfngin.providers.aws.default.output_full_changeset")
     def test_get_stack_changes_update(self, mock_output_full_cs):
         """Test get stack changes update."""
@@ -942,6 +1322,108 @@ class TestProviderDefaultMode(unittest.TestCase):
 
         self.assertEqual(received_events[0]["EventId"], "Event1")
 
+    def test_get_events(self):
+        """Test get_events."""
+        default.GET_EVENTS_SLEEP = 0
+        stack_name = "fake-stack"
+        self.stubber.add_response(
+            "describe_stack_events",
+            {
+                "StackEvents": [
+                    generate_stack_event(stack_name, "Event3"),
+                    generate_stack_event(stack_name, "Event2"),
+                ],
+                "NextToken": "token",
+            },
+            {"StackName": stack_name},
+        )
+        self.stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [generate_stack_event(stack_name, "Event1")]},
+            {"StackName": stack_name, "NextToken": "token"},
+        )
+        with self.stubber:
+            result = [e["EventId"] for e in self.provider.get_events(stack_name)]
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(result, ["Event1", "Event2", "Event3"])
+
+    def test_get_new_events(self):
+        """Test get_new_events stops at the first event that has been seen."""
+        stack_name = "fake-stack"
+        seen = SeenEvents()
+        seen.add("Event1")
+        self.stubber.add_response(
+            "describe_stack_events",
+            {
+                "StackEvents": [
+                    generate_stack_event(stack_name, "Event3"),
+                    generate_stack_event(stack_name, "Event2"),
+                    generate_stack_event(stack_name, "Event1"),
+                ],
+                "NextToken": "token",
+            },
+            {"StackName": stack_name},
+        )
+        with self.stubber:
+            result = self.provider.get_new_events(stack_name, seen)
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual([e["EventId"] for e in result], ["Event2", "Event3"])
+        self.assertIn("Event2", seen)
+        self.assertIn("Event3", seen)
+
+    def test_tail(self):
+        """Test tail only fetches the latest events when not logging them."""
+        stack_name = "fake-stack"
+        cancel = MagicMock()
+        cancel.wait.return_value = True
+        received_events = []
+        self.stubber.add_response(
+            "describe_stack_events",
+            {
+                "StackEvents": [generate_stack_event(stack_name, "Event1")],
+                "NextToken": "token",
+            },
+            {"StackName": stack_name},
+        )
+        self.stubber.add_response(
+            "describe_stack_events",
+            {
+                "StackEvents": [
+                    generate_stack_event(stack_name, "Event2"),
+                    generate_stack_event(stack_name, "Event1"),
+                ],
+                "NextToken": "token",
+            },
+            {"StackName": stack_name},
+        )
+        with self.stubber:
+            self.provider.tail(
+                stack_name,
+                cancel,
+                log_func=received_events.append,
+                include_initial=False,
+            )
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual([e["EventId"] for e in received_events], ["Event2"])
+
+    def test_tail_stack_shared(self):
+        """Test tail_stack with a shared tailer."""
+        provider = Provider(self.session, region="us-east-1", poll_stacks=True)
+        stack = MagicMock(spec=Stack)
+        stack.fqn = "fake-stack"
+        cancel = threading.Event()
+        log_func = MagicMock()
+        with patch.object(provider.stack_tailer, "watch") as mock_watch:
+            provider.tail_stack(stack, cancel, log_func=log_func)
+        mock_watch.assert_called_once_with(
+            stack.fqn,
+            cancel,
+            log_func,
+            action=None,
+            retries=MAX_TAIL_RETRIES,
+            ready=None,
+        )
+
     def test_update_termination_protection(self):
         """Test update_termination_protection."""
         stack_name = "fake-stack"
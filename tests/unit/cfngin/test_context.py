@@ -459,7 +459,7 @@ class TestContext(unittest.TestCase):
         context._persistent_graph = Graph.from_dict(graph_dict, context)
         stubber = Stubber(context.s3_conn)
         expected_params = {
-            "Body": json.dumps(graph_dict, indent=4),
+            "Body": json.dumps(graph_dict),
             "ServerSideEncryption": "AES256",
             "ACL": "bucket-owner-full-control",
             "ContentType": "application/json",
@@ -478,6 +478,19 @@ class TestContext(unittest.TestCase):
             self.assertIsNone(context.put_persistent_graph(code))
             stubber.assert_no_pending_responses()
 
+    def test_put_persistent_graph_unchanged(self):
+        """Object is not uploaded when the persistent graph is unchanged."""
+        code = "0000"
+        context = Context(config=self.persist_graph_config)
+        context._s3_bucket_verified = True
+        context.persistent_graph = {"stack1": []}
+        context._persistent_graph_lock_code = code
+        stubber = Stubber(context.s3_conn)
+
+        with stubber:
+            self.assertIsNone(context.put_persistent_graph(code))
+            stubber.assert_no_pending_responses()
+
     def test_put_persistent_graph_unlocked(self):
         """Error raised when trying to update an unlocked object."""
         context = Context(config=self.persist_graph_config)
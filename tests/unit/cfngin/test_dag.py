@@ -1,9 +1,15 @@
 """Tests for runway.cfngin.dag."""
 import threading
+import time
 
 import pytest
 
-from runway.cfngin.dag import DAGValidationError, ThreadedWalker, UnlimitedSemaphore
+from runway.cfngin.dag import (
+    DAGValidationError,
+    QueuedWalker,
+    ThreadedWalker,
+    UnlimitedSemaphore,
+)
 
 
 def test_add_node(empty_dag):
@@ -213,3 +219,70 @@ def test_threaded_walker(empty_dag):
 
     walker.walk(dag, walk_func)
     assert nodes == ["d", "c", "b", "a"] or nodes == ["d", "b", "c", "a"]
+
+
+@pytest.mark.parametrize("concurrency", [0, 2])
+def test_queued_walker(concurrency, empty_dag):
+    """Test queued walker."""
+    dag = empty_dag
+
+    walker = QueuedWalker(concurrency)
+
+    # b and c should be executed at the same time.
+    dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+
+    lock = threading.Lock()  # Protects nodes from concurrent access
+    nodes = []
+
+    def walk_func(node):
+        with lock:
+            nodes.append(node)
+        return True
+
+    walker.walk(dag, walk_func)
+    assert nodes == ["d", "c", "b", "a"] or nodes == ["d", "b", "c", "a"]
+
+
+def test_queued_walker_concurrency(empty_dag):
+    """Test queued walker respects concurrency."""
+    dag = empty_dag
+    dag.from_dict(dict(("node%s" % i, []) for i in range(10)))
+
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0}
+    threads = set()
+
+    def walk_func(_node):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["active"], state["max_active"])
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return True
+
+    QueuedWalker(2).walk(dag, walk_func)
+    assert state["max_active"] <= 2
+    assert len(threads) <= 2
+
+
+def test_queued_walker_exception(empty_dag):
+    """Test queued walker continues to walk dependents after an exception."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": []})
+    nodes = []
+
+    def walk_func(node):
+        nodes.append(node)
+        if node == "b":
+            raise ValueError
+        return True
+
+    QueuedWalker().walk(dag, walk_func)
+    assert nodes == ["b", "a"]
+
+
+def test_queued_walker_empty(empty_dag):
+    """Test queued walker with an empty graph."""
+    QueuedWalker().walk(empty_dag, lambda _: True)
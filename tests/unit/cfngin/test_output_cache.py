@@ -0,0 +1,78 @@
+"""Tests for runway.cfngin.output_cache."""
+# pylint: disable=no-self-use
+import threading
+
+from mock import MagicMock
+
+from runway.cfngin.output_cache import OutputCache, get_access_key
+
+
+class TestOutputCache(object):
+    """Tests for runway.cfngin.output_cache.OutputCache."""
+
+    def test_get(self):
+        """Test get."""
+        cache = OutputCache()
+        fetch = MagicMock(return_value={"Key": "Value"})
+        assert cache.get("key", "us-east-1", "stack", fetch) == {"Key": "Value"}
+        assert cache.get("key", "us-east-1", "stack", fetch) == {"Key": "Value"}
+        fetch.assert_called_once_with("stack")
+        cache.get("other", "us-east-1", "stack", fetch)
+        cache.get("key", "us-west-2", "stack", fetch)
+        assert fetch.call_count == 3
+        assert cache.stats == {"hits": 1, "misses": 3}
+
+    def test_get_exception(self):
+        """Test get does not cache exceptions."""
+        cache = OutputCache()
+        fetch = MagicMock(side_effect=[ValueError, {"Key": "Value"}])
+        try:
+            cache.get("key", "us-east-1", "stack", fetch)
+        except ValueError:
+            pass
+        assert cache.get("key", "us-east-1", "stack", fetch) == {"Key": "Value"}
+        assert fetch.call_count == 2
+
+    def test_get_threads(self):
+        """Test get only fetches once when called from multiple threads."""
+        cache = OutputCache()
+        fetch = MagicMock(return_value={"Key": "Value"})
+        threads = [
+            threading.Thread(target=cache.get, args=("key", None, "stack", fetch))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        fetch.assert_called_once_with("stack")
+
+    def test_invalidate(self):
+        """Test invalidate."""
+        cache = OutputCache()
+        fetch = MagicMock(return_value={})
+        cache.get("key", "us-east-1", "stack", fetch)
+        cache.get("other", "us-east-1", "stack", fetch)
+        cache.get("key", "us-west-2", "stack", fetch)
+        cache.get("key", "us-east-1", "other-stack", fetch)
+        cache.invalidate("stack", region="us-east-1")
+        fetch.reset_mock()
+
+        cache.get("key", "us-west-2", "stack", fetch)
+        cache.get("key", "us-east-1", "other-stack", fetch)
+        fetch.assert_not_called()
+        cache.get("other", "us-east-1", "stack", fetch)
+        fetch.assert_called_once_with("stack")
+
+        cache.invalidate()
+        cache.get("key", "us-east-1", "other-stack", fetch)
+        assert fetch.call_count == 2
+
+
+def test_get_access_key():
+    """Test get_access_key."""
+    session = MagicMock()
+    session.get_credentials.return_value.access_key = "key"
+    assert get_access_key(session) == "key"
+    session.get_credentials.return_value = None
+    assert get_access_key(session) is None
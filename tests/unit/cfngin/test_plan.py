@@ -4,6 +4,7 @@ import json
 import os
 import shutil
 import tempfile
+import time
 import unittest
 
 import mock
@@ -20,7 +21,7 @@ from runway.cfngin.lookups.registry import (
     register_lookup_handler,
     unregister_lookup_handler,
 )
-from runway.cfngin.plan import Graph, Plan, Step
+from runway.cfngin.plan import Graph, PersistentGraphWriter, Plan, Step
 from runway.cfngin.stack import Stack
 from runway.cfngin.status import COMPLETE, FAILED, SKIPPED, SUBMITTED
 from runway.cfngin.util import stack_template_key_name
@@ -58,6 +59,25 @@ class TestStep(unittest.TestCase):
         self.assertNotEqual(self.step.status, False)
         self.assertNotEqual(self.step.status, "banana")
 
+    def test_run_watch_func(self):
+        """Test the step runs once its watch function is ready."""
+        calls = []
+
+        def _watch(stack, cancel, ready=None):
+            time.sleep(0.05)
+            calls.append("ready")
+            ready.set()
+            cancel.wait()
+            calls.append("stopped")
+
+        def _fn(stack, status=None):
+            calls.append("fn")
+            return COMPLETE
+
+        step = Step(stack=self.step.stack, fn=_fn, watch_func=_watch)
+        self.assertTrue(step.run())
+        self.assertEqual(calls, ["ready", "fn", "stopped"])
+
     def test_from_stack_name(self):
         """Return step from step name."""
         context = mock_context()
@@ -134,6 +154,45 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.graph_dict_expected, graph.to_dict())
 
 
+class TestPersistentGraphWriter(unittest.TestCase):
+    """Tests for runway.cfngin.plan.PersistentGraphWriter."""
+
+    def test_coalesce(self):
+        """Test changes made within the delay are uploaded together."""
+        context = mock.MagicMock()
+        graph = {}
+        writer = PersistentGraphWriter(context, "0000", delay=60)
+        writer.start()
+        writer.update(graph.update, {"stack1": []})
+        writer.update(graph.update, {"stack2": []})
+        context.put_persistent_graph.assert_not_called()
+        writer.close()
+        context.put_persistent_graph.assert_called_once_with("0000")
+        self.assertEqual({"stack1": [], "stack2": []}, graph)
+        self.assertIsNone(writer.error)
+
+    def test_close_no_changes(self):
+        """Test nothing is uploaded if the persistent graph was not changed."""
+        context = mock.MagicMock()
+        writer = PersistentGraphWriter(context, "0000")
+        writer.start()
+        writer.close()
+        context.put_persistent_graph.assert_not_called()
+
+    def test_error(self):
+        """Test uploads stop once an error is raised."""
+        context = mock.MagicMock()
+        context.put_persistent_graph.side_effect = ValueError
+        writer = PersistentGraphWriter(context, "0000", delay=0)
+        writer.start()
+        writer.update(lambda: None)
+        writer.close()
+        self.assertIsInstance(writer.error, ValueError)
+        writer.update(lambda: None)
+        writer._write()
+        context.put_persistent_graph.assert_called_once_with("0000")
+
+
 class TestPlan(unittest.TestCase):
     """Tests for runway.cfngin.plan.Plan."""
 
@@ -240,6 +299,68 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(set(["vpc.1"]), result_graph_dict.get("bastion.1"))
         self.assertIsNone(result_graph_dict.get("namespace-removed.1"))
 
+    def test_execute_plan_persist_error(self):
+        """Test error uploading the persistent graph is raised after the walk."""
+        context = Context(config=self.config)
+        context.put_persistent_graph = mock.MagicMock(side_effect=ValueError)
+        vpc = Stack(definition=generate_definition("vpc", 1), context=context)
+        bastion = Stack(
+            definition=generate_definition("bastion", 1, requires=[vpc.name]),
+            context=context,
+        )
+        context._persistent_graph = Graph.from_steps([Step(vpc, None)])
+        calls = []
+
+        def _launch_stack(stack, status=None):
+            calls.append(stack.fqn)
+            return COMPLETE
+
+        graph = Graph.from_steps(
+            [Step(vpc, _launch_stack), Step(bastion, _launch_stack)]
+        )
+        plan = Plan(description="Test", graph=graph, context=context)
+
+        with self.assertRaises(ValueError):
+            plan.execute(walk)
+        self.assertEqual(calls, ["namespace-vpc.1", "namespace-bastion.1"])
+        context.put_persistent_graph.assert_called_once_with(plan.lock_code)
+
+    def test_execute_plan_persist_error_cancel(self):
+        """Test steps are not run once the persistent graph can't be uploaded."""
+        context = Context(config=self.config)
+        context.put_persistent_graph = mock.MagicMock(side_effect=ValueError)
+        vpc = Stack(definition=generate_definition("vpc", 1), context=context)
+        bastion = Stack(
+            definition=generate_definition("bastion", 1, requires=[vpc.name]),
+            context=context,
+        )
+        context._persistent_graph = Graph.from_steps([Step(vpc, None)])
+        calls = []
+
+        def _launch_stack(stack, status=None):
+            calls.append(stack.fqn)
+            return COMPLETE
+
+        def _update(writer, func, *args, **kwargs):
+            """Upload the persistent graph as soon as it is changed."""
+            func(*args, **kwargs)
+            writer._pending = True
+            writer._write()
+
+        graph = Graph.from_steps(
+            [Step(vpc, _launch_stack), Step(bastion, _launch_stack)]
+        )
+        plan = Plan(description="Test", graph=graph, context=context)
+
+        with mock.patch.object(PersistentGraphWriter, "update", _update):
+            with self.assertRaises(ValueError):
+                plan.execute(walk)
+        self.assertEqual(calls, ["namespace-vpc.1"])
+        self.assertEqual(plan.steps[1].name, "bastion.1")
+        self.assertTrue(plan.steps[1].skipped)
+        self.assertEqual(plan.steps[1].status.reason, "canceled execution")
+        context.put_persistent_graph.assert_called_once_with(plan.lock_code)
+
     def test_execute_plan_no_persist(self):
         """Test execute plan with no persistent graph."""
         context = Context(config=self.config)
@@ -0,0 +1,113 @@
+"""Tests for runway.cfngin.session_cache."""
+# pylint: disable=no-self-use
+import threading
+
+from botocore.config import Config
+
+from runway.cfngin.session_cache import SessionPool, get_session
+
+
+class TestSessionPool(object):
+    """Tests for runway.cfngin.session_cache.SessionPool."""
+
+    def test_get(self):
+        """Test get."""
+        pool = SessionPool()
+        session = pool.get(region="us-east-1")
+        assert pool.get(region="us-east-1") is session
+        assert pool.get(region="us-west-2") is not session
+        assert pool.get(region="us-east-1", profile="test") is not session
+        assert (
+            pool.get(region="us-east-1", credentials={"access_key": "key"})
+            is not session
+        )
+        assert pool.stats["session_hits"] == 1
+        assert pool.stats["session_misses"] == 4
+
+    def test_get_env_credentials_changed(self, monkeypatch):
+        """Test get creates a new session when env credentials change."""
+        pool = SessionPool()
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "key1")
+        session = pool.get(region="us-east-1")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "key2")
+        assert pool.get(region="us-east-1") is not session
+
+    def test_get_thread(self):
+        """Test get does not share sessions between threads."""
+        pool = SessionPool()
+        session = pool.get(region="us-east-1")
+        result = {}
+
+        def _get():
+            result["session"] = pool.get(region="us-east-1")
+
+        thread = threading.Thread(target=_get)
+        thread.start()
+        thread.join()
+        assert result["session"] is not session
+
+    def test_get_prune_exited_thread(self):
+        """Test sessions of threads that have exited are released."""
+        pool = SessionPool()
+        result = {}
+
+        def _get():
+            result["session"] = pool.get(region="us-east-1")
+
+        thread = threading.Thread(target=_get)
+        thread.start()
+        thread.join()
+        assert len(pool._sessions) == 1  # pylint: disable=protected-access
+        session = pool.get(region="us-west-2")
+        assert list(pool._sessions.values()) == [  # pylint: disable=protected-access
+            session
+        ]
+
+    def test_get_max_size(self):
+        """Test the least recently used sessions are released."""
+        pool = SessionPool(max_size=2)
+        east = pool.get(region="us-east-1")
+        west = pool.get(region="us-west-2")
+        assert pool.get(region="us-east-1") is east
+        pool.get(region="eu-west-1")
+        assert pool.get(region="us-east-1") is east
+        assert pool.get(region="us-west-2") is not west
+
+    def test_client(self):
+        """Test client of a pooled session."""
+        pool = SessionPool()
+        session = pool.get(region="us-east-1")
+        client = session.client("s3")
+        assert session.client("s3") is client
+        assert session.client("s3", region_name="us-west-2") is not client
+        assert session.client("s3", config=Config()) is not client
+        assert pool.stats["client_hits"] == 1
+        assert pool.stats["client_misses"] == 3
+
+    def test_invalidate(self):
+        """Test invalidate."""
+        pool = SessionPool()
+        session = pool.get(region="us-east-1", credentials={"access_key": "key1"})
+        other = pool.get(region="us-east-1", credentials={"access_key": "key2"})
+        pool.invalidate(access_key="key1")
+        assert (
+            pool.get(region="us-east-1", credentials={"access_key": "key1"})
+            is not session
+        )
+        assert pool.get(region="us-east-1", credentials={"access_key": "key2"}) is other
+        pool.invalidate()
+        assert (
+            pool.get(region="us-east-1", credentials={"access_key": "key2"})
+            is not other
+        )
+
+
+def test_get_session():
+    """Test get_session."""
+    session = get_session(region="us-east-1", access_key="key", secret_key="secret")
+    assert session.region_name == "us-east-1"
+    assert session.get_credentials().access_key == "key"
+    assert (
+        get_session(region="us-east-1", access_key="key", secret_key="secret")
+        is session
+    )
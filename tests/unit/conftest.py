@@ -12,6 +12,7 @@ import yaml
 # from runway.config import Config
 # from runway.core.components import DeployEnvironment
 import runway
+from runway.cfngin.output_cache import OUTPUT_CACHE
 
 from .factories import (
     MockCFNginContext,
@@ -73,6 +74,13 @@ def aws_credentials():
     saved_env.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_output_cache():
+    # type: () -> None
+    """Clear CloudFormation stack outputs cached by other tests."""
+    OUTPUT_CACHE.invalidate()
+
+
 @pytest.fixture(scope="package")
 def fixture_dir():
     # type: () -> str
@@ -0,0 +1,184 @@
+"""Test runway.core.components._dependency_graph."""
+# pylint: disable=no-self-use
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mock import MagicMock, patch
+
+from runway.core.components._dependency_graph import (
+    build_graph,
+    has_dependencies,
+    run_graph,
+)
+from runway.core.components._worker_pool import WorkerPool
+
+MODULE = "runway.core.components._dependency_graph"
+
+
+def definition(name, depends_on=None):
+    """Create a mock definition."""
+    obj = MagicMock(depends_on=depends_on or [])
+    obj.name = name
+    return obj
+
+
+class Item(object):  # pylint: disable=too-few-public-methods
+    """Object run by run_graph."""
+
+    def __init__(self, name, calls, fail=False):
+        """Instantiate class."""
+        self.name = name
+        self.logger = MagicMock()
+        self.calls = calls
+        self.fail = fail
+
+    def deploy(self):
+        """Record the call."""
+        self.calls.append(self.name)
+        if self.fail:
+            raise ValueError(self.name)
+
+    def __getitem__(self, key):
+        """Make the object subscriptable."""
+        return getattr(self, key)
+
+
+def test_has_dependencies():
+    """Test has_dependencies."""
+    assert not has_dependencies([definition("a"), definition("b")])
+    assert not has_dependencies([MagicMock()])
+    assert has_dependencies([definition("a"), definition("b", ["a"])])
+
+
+class TestBuildGraph(object):
+    """Test runway.core.components._dependency_graph.build_graph."""
+
+    def test_build_graph(self):
+        """Test build_graph."""
+        definitions = [
+            definition("a"),
+            definition("b", ["a", "missing"]),
+            definition("c", ["b"]),
+        ]
+        assert build_graph(definitions).topological_sort() == ["c", "b", "a"]
+        assert build_graph(definitions, reverse=True).topological_sort() == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_build_graph_cycle(self, caplog):
+        """Test build_graph with a cycle."""
+        with pytest.raises(SystemExit):
+            build_graph([definition("a", ["b"]), definition("b", ["a"])])
+        assert 'invalid dependency of "b" on "a"' in caplog.text
+
+    def test_build_graph_duplicate(self, caplog):
+        """Test build_graph with duplicate names."""
+        with pytest.raises(SystemExit):
+            build_graph([definition("a"), definition("a")])
+        assert '"a" is defined more than once' in caplog.text
+
+
+class LogItem(object):  # pylint: disable=too-few-public-methods
+    """Object run by run_graph in a worker process that logs messages."""
+
+    def __init__(self, name):
+        """Instantiate class."""
+        self.name = name
+        self.logger = logging.getLogger("runway.test")
+
+    def deploy(self):
+        """Log messages with a delay between them."""
+        self.logger.info("%s:1", self.name)
+        time.sleep(0.2)
+        self.logger.info("%s:2", self.name)
+
+    def __getitem__(self, key):
+        """Make the object subscriptable."""
+        return getattr(self, key)
+
+
+class TestRunGraph(object):
+    """Test runway.core.components._dependency_graph.run_graph."""
+
+    DEFINITIONS = [
+        definition("a", ["c"]),
+        definition("b"),
+        definition("c"),
+        definition("d", ["a", "b"]),
+    ]
+
+    def test_sequential(self):
+        """Test items are run in order while respecting dependencies."""
+        calls = []
+        items = [Item(obj.name, calls) for obj in self.DEFINITIONS]
+        run_graph(build_graph(self.DEFINITIONS), items, "deploy", log_progress=True)
+        assert calls == ["b", "c", "a", "d"]
+        items[0].logger.notice.assert_called_once_with(
+            "processing %s (in progress)", "item"
+        )
+        items[0].logger.success.assert_called_once_with(
+            "processing %s (complete)", "item"
+        )
+
+    @pytest.mark.skipif(sys.version_info.major < 3, reason="only supported by python 3")
+    @patch("runway.core.components._worker_pool.create_executor", ThreadPoolExecutor)
+    def test_concurrent(self):
+        """Test items are run once their dependencies complete."""
+        calls = []
+        items = [Item(obj.name, calls) for obj in self.DEFINITIONS]
+        run_graph(
+            build_graph(self.DEFINITIONS),
+            items,
+            "deploy",
+            use_concurrent=True,
+            max_workers=2,
+        )
+        assert sorted(calls) == ["a", "b", "c", "d"]
+        assert calls.index("c") < calls.index("a") < calls.index("d")
+        assert calls.index("b") < calls.index("d")
+
+    @pytest.mark.skipif(sys.version_info.major < 3, reason="only supported by python 3")
+    @patch("runway.core.components._worker_pool.create_executor", ThreadPoolExecutor)
+    def test_concurrent_failure(self):
+        """Test dependents of a failed item are not run."""
+        calls = []
+        items = [
+            Item(obj.name, calls, fail=obj.name == "c") for obj in self.DEFINITIONS
+        ]
+        with pytest.raises(ValueError):
+            run_graph(
+                build_graph(self.DEFINITIONS), items, "deploy", use_concurrent=True
+            )
+        assert "a" not in calls
+        assert "d" not in calls
+
+    @pytest.mark.skipif(sys.version_info.major < 3, reason="only supported by python 3")
+    def test_concurrent_grouped_output(self, caplog):
+        """Test the log records of each item are grouped."""
+        caplog.set_level(logging.INFO, logger="runway")
+        items = [LogItem("a"), LogItem("b")]
+        with WorkerPool(max_workers=2):
+            run_graph(
+                build_graph([definition("a"), definition("b")]),
+                items,
+                "deploy",
+                use_concurrent=True,
+                label="deployment",
+            )
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "runway.test"
+        ]
+        assert sorted(messages) == ["a:1", "a:2", "b:1", "b:2"]
+        assert messages[0][0] == messages[1][0]
+        assert messages[2][0] == messages[3][0]
+        assert (
+            "processing deployments in parallel as their dependencies complete... "
+            "(output of each will be displayed once it completes)"
+        ) in caplog.messages
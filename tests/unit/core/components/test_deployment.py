@@ -203,15 +203,13 @@ class TestDeployment(object):
         assert not obj.deploy()
         mock_run.assert_called_once_with("deploy", "us-east-1")
 
-    @patch(MODULE + ".concurrent.futures")
+    @patch(MODULE + ".run_in_workers")
     @pytest.mark.skipif(sys.version_info.major < 3, reason="only supported by python 3")
     def test_deploy_async(
-        self, mock_futures, caplog, fx_deployments, monkeypatch, runway_context
+        self, mock_run_in_workers, caplog, fx_deployments, monkeypatch, runway_context
     ):
         """Test deploy async."""
         caplog.set_level(logging.INFO, logger="runway")
-        executor = MagicMock()
-        mock_futures.ProcessPoolExecutor.return_value = executor
         monkeypatch.setattr(Deployment, "use_async", True)
 
         obj = Deployment(
@@ -223,14 +221,10 @@ class TestDeployment(object):
             "deployment_1:processing regions in parallel... (output will be interwoven)"
             in caplog.messages
         )
-        mock_futures.ProcessPoolExecutor.assert_called_once_with(
-            max_workers=runway_context.env.max_concurrent_regions
+        mock_run_in_workers.assert_called_once_with(
+            [(obj.run, "deploy", "us-east-1"), (obj.run, "deploy", "us-west-2")],
+            max_workers=runway_context.env.max_concurrent_regions,
         )
-        executor.submit.assert_has_calls(
-            [call(obj.run, "deploy", "us-east-1"), call(obj.run, "deploy", "us-west-2")]
-        )
-        mock_futures.wait.assert_called_once()
-        assert executor.submit.return_value.result.call_count == 2
 
     def test_deploy_sync(self, caplog, fx_deployments, monkeypatch, runway_context):
         """Test deploy sync."""
@@ -416,3 +410,60 @@ class TestDeployment(object):
             runway_context, variables=mock_vars, pre_process=True
         )
         mock_action.assert_called_once_with()
+
+    def test_run_list_depends_on(self, monkeypatch, runway_context):
+        """Test run_list with depends_on."""
+        mock_run_graph = MagicMock()
+        monkeypatch.setattr(MODULE + ".run_graph", mock_run_graph)
+        deployments = DeploymentDefinition.from_list(
+            [
+                {"name": "a", "modules": ["a.cfn"], "regions": ["us-east-1"]},
+                {
+                    "name": "b",
+                    "modules": ["b.cfn"],
+                    "regions": ["us-east-1"],
+                    "depends_on": ["a"],
+                },
+            ]
+        )
+        assert not Deployment.run_list(
+            action="deploy",
+            context=runway_context,
+            deployments=deployments,
+            future=None,
+            variables=VariablesDefinition(),
+        )
+        dag, objects, action = mock_run_graph.call_args[0]
+        assert dag.topological_sort() == ["b", "a"]
+        assert [obj.name for obj in objects] == ["a", "b"]
+        assert action == "deploy"
+        assert mock_run_graph.call_args[1]["label"] == "deployment"
+
+    def test_run_list_depends_on_resolve(self, monkeypatch, runway_context):
+        """Test run_list with depends_on resolves each deployment when run."""
+        mock_run_graph = MagicMock()
+        monkeypatch.setattr(MODULE + ".run_graph", mock_run_graph)
+        mock_action = MagicMock()
+        monkeypatch.setattr(Deployment, "deploy", mock_action)
+        dep0 = MagicMock(depends_on=[], modules=["a.cfn"])
+        dep0.name = "a"
+        dep1 = MagicMock(depends_on=["a"], modules=["b.cfn"])
+        dep1.name = "b"
+        mock_vars = MagicMock()
+
+        assert not Deployment.run_list(
+            action="deploy",
+            context=runway_context,
+            deployments=[dep0, dep1],
+            future=None,
+            variables=mock_vars,
+        )
+        dep0.resolve.assert_not_called()
+        dep1.resolve.assert_not_called()
+        objects = mock_run_graph.call_args[0][1]
+        objects[0]["deploy"]()
+        dep0.resolve.assert_called_once_with(
+            objects[0].ctx, variables=mock_vars, pre_process=True
+        )
+        dep1.resolve.assert_not_called()
+        mock_action.assert_called_once_with()
@@ -8,7 +8,7 @@ import six
 import yaml
 from mock import MagicMock, call, patch
 
-from runway.config import FutureDefinition
+from runway.config import FutureDefinition, ModuleDefinition
 from runway.core.components import Deployment, Module
 from runway.core.components._module import validate_environment
 
@@ -241,15 +241,13 @@ class TestModule(object):
         assert mod.deploy()
         mock_run.assert_called_once_with("deploy")
 
-    @patch(MODULE + ".concurrent.futures")
+    @patch(MODULE + ".run_in_workers")
     @pytest.mark.skipif(sys.version_info.major < 3, reason="only supported by python 3")
     def test_deploy_async(
-        self, mock_futures, caplog, fx_deployments, monkeypatch, runway_context
+        self, mock_run_in_workers, caplog, fx_deployments, monkeypatch, runway_context
     ):
         """Test deploy async."""
         caplog.set_level(logging.INFO, logger="runway")
-        executor = MagicMock()
-        mock_futures.ProcessPoolExecutor.return_value = executor
         monkeypatch.setattr(Module, "use_async", True)
 
         obj = Module(
@@ -261,17 +259,13 @@ class TestModule(object):
             "parallel_parent:processing modules in parallel... (output "
             "will be interwoven)" in caplog.messages
         )
-        mock_futures.ProcessPoolExecutor.assert_called_once_with(
-            max_workers=runway_context.env.max_concurrent_modules
-        )
-        executor.submit.assert_has_calls(
+        mock_run_in_workers.assert_called_once_with(
             [
-                call(obj.child_modules[0].run, "deploy"),
-                call(obj.child_modules[1].run, "deploy"),
-            ]
+                (obj.child_modules[0].run, "deploy"),
+                (obj.child_modules[1].run, "deploy"),
+            ],
+            max_workers=runway_context.env.max_concurrent_modules,
         )
-        mock_futures.wait.assert_called_once()
-        assert executor.submit.return_value.result.call_count == 2
 
     def test_deploy_sync(self, caplog, fx_deployments, monkeypatch, runway_context):
         """Test deploy sync."""
@@ -421,6 +415,24 @@ class TestModule(object):
         )
         assert mock_deploy.call_count == 2
 
+    def test_run_list_depends_on(self, monkeypatch, runway_context):
+        """Test run_list with depends_on."""
+        mock_run_graph = MagicMock()
+        monkeypatch.setattr(MODULE + ".run_graph", mock_run_graph)
+        modules = ModuleDefinition.from_list(
+            [{"path": "a.cfn", "depends_on": ["b.cfn"]}, "b.cfn"]
+        )
+        assert not Module.run_list(
+            action="destroy",
+            context=runway_context,
+            modules=modules,
+            variables=MagicMock(),
+        )
+        dag, objects, action = mock_run_graph.call_args[0]
+        assert dag.topological_sort() == ["b.cfn", "a.cfn"]
+        assert [obj.name for obj in objects] == ["a.cfn", "b.cfn"]
+        assert action == "destroy"
+
 
 @pytest.mark.parametrize(
     "env_def, strict, expected, expected_logs",
@@ -0,0 +1,190 @@
+"""Test runway.core.components._worker_pool."""
+# pylint: disable=no-self-use
+import logging
+import os
+import sys
+import threading
+import time
+
+import pytest
+from mock import ANY, MagicMock, patch
+
+from runway.core.components._worker_pool import (
+    SerialExecutor,
+    WorkerPool,
+    get_executor,
+    get_parallel_output_note,
+    run_in_workers,
+)
+
+if sys.version_info.major > 2:
+    from concurrent.futures import ThreadPoolExecutor
+
+MODULE = "runway.core.components._worker_pool"
+LOGGER = logging.getLogger("runway.test")
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info.major < 3, reason="only supported by python 3"
+)
+
+
+def log_messages(name):
+    """Log messages with a delay between them."""
+    LOGGER.info("%s:1", name)
+    time.sleep(0.2)
+    LOGGER.info("%s:2", name)
+
+
+def thread_executor(max_workers=None, **_kwargs):
+    """Create an executor that uses threads instead of processes."""
+    return ThreadPoolExecutor(max_workers)
+
+
+class TestWorkerPool(object):
+    """Test runway.core.components._worker_pool.WorkerPool."""
+
+    @patch(MODULE + ".create_executor")
+    def test_context_manager(self, mock_create_executor):
+        """Test the pool is active while used as a context manager."""
+        executor = mock_create_executor.return_value
+        assert not WorkerPool.get_active()
+        with WorkerPool(max_workers=3) as pool:
+            assert WorkerPool.get_active() is pool
+            with get_executor(1) as first:
+                pass
+            with get_executor(2) as second:
+                pass
+            assert first is second is executor
+            executor.shutdown.assert_not_called()
+        assert not WorkerPool.get_active()
+        mock_create_executor.assert_called_once_with(3, log_queue=ANY, grouped=True)
+        executor.shutdown.assert_called_once_with(wait=True)
+
+    def test_get_active_worker_process(self):
+        """Test a pool inherited by a worker process is not used."""
+        with WorkerPool():
+            with patch(MODULE + ".os.getpid", MagicMock(return_value=-1)):
+                assert not WorkerPool.get_active()
+
+    @patch(MODULE + ".create_executor")
+    def test_get_executor_temporary(self, mock_create_executor):
+        """Test a temporary executor is used when no pool is active."""
+        with get_executor(2) as executor:
+            assert executor is mock_create_executor.return_value
+        mock_create_executor.assert_called_once_with(2)
+        executor.shutdown.assert_called_once_with(wait=True)
+
+    @patch(MODULE + "._IN_WORKER", True)
+    @patch(MODULE + ".create_executor")
+    def test_get_executor_worker_process(self, mock_create_executor):
+        """Test nested processing in a worker process is run serially."""
+        with get_executor(2) as executor:
+            assert isinstance(executor, SerialExecutor)
+        mock_create_executor.assert_not_called()
+        assert run_in_workers([(os.getpid,), (os.getpid,)], max_workers=2) == [
+            os.getpid(),
+            os.getpid(),
+        ]
+        assert get_parallel_output_note() == (
+            "run one at a time within this worker process"
+        )
+
+    def test_reuse_workers(self):
+        """Test worker processes are reused by separate calls."""
+        with WorkerPool(max_workers=1):
+            first = run_in_workers([(os.getpid,)])
+            second = run_in_workers([(os.getpid,)])
+        assert first == second
+        assert first != [os.getpid()]
+
+    @pytest.mark.parametrize("buffer_logs", [True, False])
+    def test_worker_logs(self, buffer_logs, caplog):
+        """Test log records of worker processes are handled by the parent."""
+        caplog.set_level(logging.INFO, logger="runway.test")
+        with WorkerPool(max_workers=2, buffer_logs=buffer_logs):
+            run_in_workers([(log_messages, "a"), (log_messages, "b")])
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "runway.test"
+        ]
+        assert sorted(messages) == ["a:1", "a:2", "b:1", "b:2"]
+        if buffer_logs:
+            assert messages[0][0] == messages[1][0]
+        else:
+            assert sorted(messages[:2]) == ["a:1", "b:1"]
+
+
+def test_get_parallel_output_note():
+    """Test get_parallel_output_note."""
+    assert get_parallel_output_note() == "output will be interwoven"
+    with WorkerPool(buffer_logs=True):
+        assert get_parallel_output_note() == (
+            "output of each will be displayed once it completes"
+        )
+    with WorkerPool(buffer_logs=False):
+        assert get_parallel_output_note() == "output will be interwoven"
+
+
+class TestSerialExecutor(object):
+    """Test runway.core.components._worker_pool.SerialExecutor."""
+
+    def test_submit(self):
+        """Test functions are run when submitted."""
+        future = SerialExecutor().submit(sum, [1, 2])
+        assert future.done()
+        assert future.result() == 3
+
+    @pytest.mark.parametrize("error", [ValueError, SystemExit])
+    def test_submit_exception(self, error):
+        """Test exceptions are set on the future."""
+
+        def _raise():
+            raise error
+
+        future = SerialExecutor().submit(_raise)
+        assert isinstance(future.exception(), error)
+
+
+@patch(MODULE + ".create_executor", thread_executor)
+class TestRunInWorkers(object):
+    """Test runway.core.components._worker_pool.run_in_workers."""
+
+    def test_max_workers(self):
+        """Test no more than max_workers functions run at the same time."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def _run(value):
+            with lock:
+                running.append(value)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(value)
+            return value * 2
+
+        with WorkerPool(max_workers=4):
+            assert run_in_workers([(_run, i) for i in range(5)], max_workers=2) == [
+                0,
+                2,
+                4,
+                6,
+                8,
+            ]
+        assert max(peak) == 2
+
+    def test_exception(self):
+        """Test exceptions are raised once all functions have finished."""
+        calls = []
+
+        def _run(value):
+            time.sleep(0.05 * value)
+            calls.append(value)
+            if not value:
+                raise ValueError
+
+        with pytest.raises(ValueError):
+            run_in_workers([(_run, i) for i in range(3)], max_workers=3)
+        assert sorted(calls) == [0, 1, 2]
@@ -0,0 +1,47 @@
+"""Test runway.hooks.staticsite.build_staticsite."""
+# pylint: disable=unused-argument
+import io
+import zipfile
+
+import boto3
+import pytest
+from mock import patch
+from moto import mock_s3
+
+from runway.hooks.staticsite.build_staticsite import zip_and_upload
+
+MODULE = "runway.hooks.staticsite.build_staticsite"
+
+
+def test_zip_and_upload(aws_credentials, tmp_path):
+    """Test zip_and_upload."""
+    (tmp_path / "img").mkdir()
+    (tmp_path / "index.html").write_text(u"<html></html>" * 100)
+    (tmp_path / "img" / "logo.png").write_bytes(b"\x89PNG" * 100)
+
+    with mock_s3():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="bucket")
+        zip_and_upload(str(tmp_path), "bucket", "site.zip", boto3.Session())
+        body = s3_client.get_object(Bucket="bucket", Key="site.zip")["Body"].read()
+
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert sorted(archive.namelist()) == ["img/", "img/logo.png", "index.html"]
+        assert archive.getinfo("index.html").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo("img/logo.png").compress_type == zipfile.ZIP_STORED
+        assert archive.read("index.html") == b"<html></html>" * 100
+
+
+def test_zip_and_upload_error(aws_credentials, tmp_path):
+    """Test an error writing the archive is raised instead of uploading it."""
+
+    def _write_archive(fileobj, _app_dir):
+        fileobj.write(b"partial")
+        raise ValueError("failed")
+
+    with mock_s3(), patch(MODULE + "._write_archive", side_effect=_write_archive):
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="bucket")
+        with pytest.raises(ValueError):
+            zip_and_upload(str(tmp_path), "bucket", "site.zip", boto3.Session())
+        assert "Contents" not in s3_client.list_objects_v2(Bucket="bucket")
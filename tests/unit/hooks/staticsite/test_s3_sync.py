@@ -0,0 +1,143 @@
+"""Test runway.hooks.staticsite.s3_sync."""
+# pylint: disable=no-self-use,redefined-outer-name,unused-argument
+import json
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from runway.hooks.staticsite.s3_sync import (
+    delete_keys,
+    get_local_files,
+    get_manifest,
+    sync_directory,
+)
+
+BUCKET = "test-bucket"
+ARTIFACT_BUCKET = "test-artifacts"
+MANIFEST = (ARTIFACT_BUCKET, "test-site-sync-manifest.json")
+
+
+@pytest.fixture
+def s3_client(aws_credentials):
+    """Mocked S3 client with an empty bucket."""
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        client.create_bucket(Bucket=ARTIFACT_BUCKET)
+        yield client
+
+
+@pytest.fixture
+def site(tmp_path):
+    """Directory containing a built site."""
+    (tmp_path / "css").mkdir()
+    (tmp_path / "index.html").write_text(u"<html></html>")
+    (tmp_path / "css" / "site.css").write_text(u"body {}")
+    (tmp_path / "config.json").write_text(u"{}")
+    return tmp_path
+
+
+def get_keys(s3_client):
+    """Get the keys in the test bucket."""
+    return sorted(
+        obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+    )
+
+
+def test_get_local_files(site):
+    """Test get_local_files."""
+    assert get_local_files(str(site), exclude=["*.json"]) == {
+        "css/site.css": str(site / "css" / "site.css"),
+        "index.html": str(site / "index.html"),
+    }
+
+
+def test_get_manifest_missing(s3_client):
+    """Test get_manifest with no manifest in the bucket."""
+    assert get_manifest(s3_client, *MANIFEST) == {}
+
+
+def test_get_manifest_invalid(s3_client):
+    """Test get_manifest with an invalid manifest in the bucket."""
+    s3_client.put_object(Bucket=ARTIFACT_BUCKET, Key=MANIFEST[1], Body=b"invalid")
+    assert get_manifest(s3_client, *MANIFEST) == {}
+
+
+def test_delete_keys(s3_client, monkeypatch):
+    """Test delete_keys deletes in batches."""
+    monkeypatch.setattr("runway.hooks.staticsite.s3_sync.MAX_DELETE_KEYS", 2)
+    for key in ["a", "b", "c", "d"]:
+        s3_client.put_object(Bucket=BUCKET, Key=key, Body=b"")
+    delete_keys(s3_client, BUCKET, ["a", "b", "c"])
+    assert get_keys(s3_client) == ["d"]
+
+
+class TestSyncDirectory(object):
+    """Test runway.hooks.staticsite.s3_sync.sync_directory."""
+
+    def test_initial(self, s3_client, site):
+        """Test all files are uploaded to an empty bucket."""
+        assert sync_directory(s3_client, str(site), BUCKET, MANIFEST) == [
+            "config.json",
+            "css/site.css",
+            "index.html",
+        ]
+        assert get_keys(s3_client) == [
+            "config.json",
+            "css/site.css",
+            "index.html",
+        ]
+        assert (
+            s3_client.head_object(Bucket=BUCKET, Key="index.html")["ContentType"]
+            == "text/html"
+        )
+        manifest = json.loads(
+            s3_client.get_object(Bucket=ARTIFACT_BUCKET, Key=MANIFEST[1])["Body"].read()
+        )
+        assert sorted(manifest["files"]) == [
+            "config.json",
+            "css/site.css",
+            "index.html",
+        ]
+
+    def test_changed(self, s3_client, site):
+        """Test only changed files are uploaded and removed files deleted."""
+        sync_directory(s3_client, str(site), BUCKET, MANIFEST)
+        (site / "index.html").write_text(u"<html>changed</html>")
+        (site / "css" / "site.css").unlink()
+        (site / "new.js").write_text(u"")
+        assert sync_directory(
+            s3_client, str(site), BUCKET, MANIFEST, max_workers=1
+        ) == ["css/site.css", "index.html", "new.js",]
+        assert get_keys(s3_client) == [
+            "config.json",
+            "index.html",
+            "new.js",
+        ]
+        assert sync_directory(s3_client, str(site), BUCKET, MANIFEST) == []
+
+    def test_missing_object(self, s3_client, site):
+        """Test files in the manifest that are not in the bucket are uploaded."""
+        sync_directory(s3_client, str(site), BUCKET, MANIFEST)
+        s3_client.delete_object(Bucket=BUCKET, Key="index.html")
+        assert sync_directory(s3_client, str(site), BUCKET, MANIFEST) == ["index.html"]
+
+    def test_exclude(self, s3_client, site):
+        """Test excluded keys are not uploaded or deleted."""
+        s3_client.put_object(Bucket=BUCKET, Key="extra.json", Body=b"{}")
+        assert sync_directory(
+            s3_client, str(site), BUCKET, MANIFEST, exclude=["*.json"]
+        ) == ["css/site.css", "index.html",]
+        assert "extra.json" in get_keys(s3_client)
+        assert "config.json" not in get_keys(s3_client)
+
+    def test_legacy_manifest(self, s3_client, site):
+        """Test a manifest left in the website bucket is deleted."""
+        s3_client.put_object(
+            Bucket=BUCKET, Key=".runway/sync-manifest.json", Body=b"{}"
+        )
+        assert ".runway/sync-manifest.json" in sync_directory(
+            s3_client, str(site), BUCKET, MANIFEST
+        )
+        assert ".runway/sync-manifest.json" not in get_keys(s3_client)
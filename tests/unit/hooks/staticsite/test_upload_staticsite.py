@@ -9,8 +9,11 @@ from botocore.stub import ANY
 from runway.hooks.staticsite.upload_staticsite import (
     auto_detect_content_type,
     calculate_hash_of_extra_files,
+    get_archives_to_prune,
     get_content,
     get_content_type,
+    get_invalidation_paths,
+    invalidate_distribution,
     sync_extra_files,
 )
 
@@ -83,6 +86,82 @@ class TestGetContent(object):
             get_content({"content": 123})
 
 
+def test_get_archives_to_prune():
+    """Test get_archives_to_prune keeps the latest archives and the manifest."""
+    archives = [{"Key": "ns-site-%s.zip" % i, "LastModified": i} for i in range(20)] + [
+        {"Key": "ns-site-sync-manifest.json", "LastModified": -1}
+    ]
+    assert get_archives_to_prune(
+        archives,
+        {"artifact_key_prefix": "ns-site-", "old_archive_filename": "ns-site-0.zip"},
+    ) == ["ns-site-%s.zip" % i for i in range(1, 5)]
+
+
+class TestGetInvalidationPaths(object):
+    """Test runway.hooks.staticsite.upload_staticsite.get_invalidation_paths."""
+
+    def test_exact(self):
+        """Test each changed key is invalidated."""
+        assert get_invalidation_paths(
+            ["index.html", "docs/index.html", "css/my site.css"]
+        ) == ["/", "/css/my%20site.css", "/docs/", "/docs/index.html", "/index.html"]
+
+    def test_collapse(self):
+        """Test paths are collapsed into wildcards of the deepest directories."""
+        keys = ["a.html", "b.html", "css/a/1.css", "css/a/2.css", "js/1.js", "js/2.js"]
+        assert get_invalidation_paths(keys, max_paths=5) == [
+            "/a.html",
+            "/b.html",
+            "/css/a/*",
+            "/js/1.js",
+            "/js/2.js",
+        ]
+        assert get_invalidation_paths(keys, max_paths=4) == [
+            "/a.html",
+            "/b.html",
+            "/css/a/*",
+            "/js/*",
+        ]
+        assert get_invalidation_paths(keys, max_paths=4, max_wildcards=1) == ["/*"]
+        assert get_invalidation_paths(keys, max_paths=2) == ["/*"]
+
+    def test_collapse_nested(self):
+        """Test collapsed directories are collapsed into their parent."""
+        keys = ["css/a/%s.css" % i for i in range(3)] + [
+            "css/b/%s.css" % i for i in range(2)
+        ]
+        assert get_invalidation_paths(keys, max_paths=3) == [
+            "/css/a/*",
+            "/css/b/0.css",
+            "/css/b/1.css",
+        ]
+        assert get_invalidation_paths(keys, max_paths=2) == ["/css/a/*", "/css/b/*"]
+        assert get_invalidation_paths(keys, max_paths=1) == ["/css/*"]
+        assert get_invalidation_paths(keys, max_paths=1, max_wildcards=0) == ["/*"]
+
+
+def test_invalidate_distribution(cfngin_context):
+    """Test invalidate_distribution."""
+    cf_stub = cfngin_context.add_stubber("cloudfront")
+    cf_stub.add_response(
+        "create_invalidation",
+        {},
+        {
+            "DistributionId": "id",
+            "InvalidationBatch": {
+                "Paths": {"Quantity": 2, "Items": ["/", "/index.html"]},
+                "CallerReference": ANY,
+            },
+        },
+    )
+
+    with cf_stub as stub:
+        assert invalidate_distribution(
+            cfngin_context.get_session(), identifier="id", paths=["/", "/index.html"]
+        )
+        stub.assert_no_pending_responses()
+
+
 class TestCalculateExtraFilesHash(object):
     """Test runway.hooks.staticsite.upload_staticsite.calculate_hash_of_extra_files."""
 
@@ -261,7 +340,7 @@ class TestSyncExtraFiles(object):
             {
                 "Name": "hash_nameextra",
                 "Description": ANY,
-                "Value": extra_hash,
+                "Value": json.dumps({"test": extra_hash}),
                 "Type": "String",
                 "Overwrite": True,
             },
@@ -287,3 +366,45 @@ class TestSyncExtraFiles(object):
             ) == ["test"]
             s3_stub.assert_no_pending_responses()
             ssm_stub.assert_no_pending_responses()
+
+    def test_hash_per_file(self, cfngin_context):
+        """Test only extra files with a changed hash are uploaded."""
+        s3_stub = cfngin_context.add_stubber("s3")
+        ssm_stub = cfngin_context.add_stubber("ssm")
+
+        unchanged = {"name": "a", "content": "a", "content_type": "text/plain"}
+        changed = {"name": "b", "content": "b", "content_type": "text/plain"}
+        unchanged_hash = calculate_hash_of_extra_files([unchanged])
+        changed_hash = calculate_hash_of_extra_files([changed])
+
+        ssm_stub.add_response(
+            "get_parameter",
+            {"Parameter": {"Value": json.dumps({"a": unchanged_hash, "b": "old"})}},
+            {"Name": "hash_nameextra"},
+        )
+        s3_stub.add_response(
+            "put_object",
+            {},
+            {"Bucket": "bucket", "Key": "b", "Body": "b", "ContentType": "text/plain"},
+        )
+        ssm_stub.add_response(
+            "put_parameter",
+            {},
+            {
+                "Name": "hash_nameextra",
+                "Description": ANY,
+                "Value": json.dumps({"a": unchanged_hash, "b": changed_hash}),
+                "Type": "String",
+                "Overwrite": True,
+            },
+        )
+
+        with s3_stub as s3_stub, ssm_stub as ssm_stub:
+            assert sync_extra_files(
+                cfngin_context,
+                "bucket",
+                extra_files=[unchanged, changed],
+                hash_tracking_parameter="hash_name",
+            ) == ["b"]
+            s3_stub.assert_no_pending_responses()
+            ssm_stub.assert_no_pending_responses()
@@ -0,0 +1,104 @@
+"""Test runway.hooks.staticsite.util."""
+# pylint: disable=no-self-use
+import json
+import os
+
+from mock import patch
+
+from runway.hooks.staticsite.util import (
+    calculate_hash_of_files,
+    get_hash_cache_path,
+    get_hash_of_files,
+    hash_file,
+)
+
+MODULE = "runway.hooks.staticsite.util"
+
+
+def test_hash_file(tmp_path):
+    """Test hash_file."""
+    path = tmp_path / "test"
+    path.write_text(u"test")
+    assert hash_file(str(path)) == "098f6bcd4621d373cade4e832627b4f6"
+
+
+def test_get_hash_cache_path(tmp_path):
+    """Test get_hash_cache_path."""
+    assert get_hash_cache_path("./a", str(tmp_path)) != get_hash_cache_path(
+        "./b", str(tmp_path)
+    )
+    assert os.path.dirname(get_hash_cache_path("./a", str(tmp_path))) == str(tmp_path)
+
+
+class TestCalculateHashOfFiles(object):
+    """Test runway.hooks.staticsite.util.calculate_hash_of_files."""
+
+    def test_hash(self, tmp_path):
+        """Test the hash changes with the name or content of files."""
+        (tmp_path / "a").write_text(u"a")
+        (tmp_path / "b").write_text(u"b")
+        result = calculate_hash_of_files(["a", "b"], str(tmp_path))
+        assert calculate_hash_of_files(["b", "a"], str(tmp_path)) == result
+        assert calculate_hash_of_files(["a"], str(tmp_path)) != result
+        (tmp_path / "b").write_text(u"c")
+        assert calculate_hash_of_files(["a", "b"], str(tmp_path)) != result
+
+    def test_cache(self, tmp_path):
+        """Test only files that changed since they were cached are read."""
+        root = tmp_path / "root"
+        root.mkdir()
+        cache_path = str(tmp_path / "cache" / "hashes.json")
+        for name in ["a", "b"]:
+            (root / name).write_text(name)
+            os.utime(str(root / name), (0, 0))
+
+        result = calculate_hash_of_files(["a", "b"], str(root), cache_path=cache_path)
+        with open(cache_path) as stream:
+            assert sorted(json.load(stream)) == ["a", "b"]
+
+        with patch(MODULE + ".hash_file", wraps=hash_file) as mock_hash_file:
+            assert (
+                calculate_hash_of_files(["a", "b"], str(root), cache_path=cache_path)
+                == result
+            )
+            mock_hash_file.assert_not_called()
+
+            (root / "b").write_text(u"changed")
+            assert (
+                calculate_hash_of_files(["a", "b"], str(root), cache_path=cache_path)
+                != result
+            )
+            mock_hash_file.assert_called_once_with(str(root / "b"))
+
+        # recently modified files are not cached
+        with open(cache_path) as stream:
+            assert sorted(json.load(stream)) == ["a"]
+
+    def test_cache_invalid(self, tmp_path):
+        """Test an invalid cache is ignored."""
+        (tmp_path / "a").write_text(u"a")
+        cache_path = tmp_path / "hashes.json"
+        cache_path.write_text(u"invalid")
+        assert calculate_hash_of_files(
+            ["a"], str(tmp_path), cache_path=str(cache_path)
+        ) == calculate_hash_of_files(["a"], str(tmp_path))
+
+
+def test_get_hash_of_files(tmp_path):
+    """Test get_hash_of_files."""
+    root = tmp_path / "root"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "a.js").write_text(u"a")
+    (root / "src" / "a.log").write_text(u"a")
+    (root / "other").write_text(u"other")
+    os.utime(str(root / "src" / "a.js"), (0, 0))
+    cache_dir = str(tmp_path / "cache")
+
+    result = get_hash_of_files(
+        str(root),
+        [{"path": "src", "exclusions": ["*.log"]}],
+        cache_dir=cache_dir,
+        max_workers=1,
+    )
+    assert result == calculate_hash_of_files([os.path.join("src", "a.js")], str(root))
+    assert os.path.isfile(get_hash_cache_path(str(root), cache_dir))
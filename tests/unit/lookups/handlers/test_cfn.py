@@ -11,6 +11,7 @@ from botocore.stub import Stubber
 from mock import MagicMock, patch
 
 from runway.cfngin.exceptions import OutputDoesNotExist, StackDoesNotExist
+from runway.cfngin.output_cache import OUTPUT_CACHE
 from runway.lookups.handlers.cfn import TYPE_NAME, CfnLookup, OutputQuery
 
 
@@ -68,6 +69,7 @@ class TestCfnLookup(object):
         mock_should_use.side_effect = [True, False]
         mock_format_results.return_value = "success"
         mock_context = MagicMock(name="context")
+        mock_context.boto3_credentials = {"aws_access_key_id": "key"}
         mock_get_stack_output.return_value = "cls.success"
         mock_session = MagicMock(name="session")
         mock_context.get_session.return_value = mock_session
@@ -99,7 +101,7 @@ class TestCfnLookup(object):
         mock_should_use.assert_called_with({"region": region}, None)
         mock_context.get_session.assert_called_once_with(region=region)
         mock_session.client.assert_called_once_with("cloudformation")
-        mock_get_stack_output.assert_called_once_with(mock_session, query)
+        mock_get_stack_output.assert_called_once_with(mock_session, query, "key")
         mock_format_results.assert_called_with("cls.success", region=region)
 
     @pytest.mark.parametrize(
@@ -118,6 +120,7 @@ class TestCfnLookup(object):
         """Test handle cls.get_stack_output raise exception."""
         caplog.set_level(logging.DEBUG, logger="runway.lookups.handlers.cfn")
         mock_context = MagicMock(name="context")
+        mock_context.boto3_credentials = None
         mock_session = MagicMock(name="session")
         mock_context.get_session.return_value = mock_session
         mock_session.client.return_value = mock_session
@@ -151,7 +154,7 @@ class TestCfnLookup(object):
 
         mock_context.get_session.assert_called_once()
         mock_session.client.assert_called_once_with("cloudformation")
-        CfnLookup.get_stack_output.assert_called_once_with(mock_session, query)
+        CfnLookup.get_stack_output.assert_called_once_with(mock_session, query, None)
 
     @pytest.mark.parametrize(
         "exception, default",
@@ -238,6 +241,40 @@ class TestCfnLookup(object):
             in caplog.messages
         )
 
+    def test_get_stack_output_cached(self):
+        """Test get_stack_output only describes each stack once."""
+        client, stubber = setup_cfn_client()
+        stack_name = "test-stack"
+        outputs = {"output1": "val1", "output2": "val2"}
+
+        stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack(stack_name, outputs)]},
+            {"StackName": stack_name},
+        )
+
+        with stubber:
+            assert (
+                CfnLookup.get_stack_output(client, OutputQuery(stack_name, "output1"))
+                == "val1"
+            )
+            assert (
+                CfnLookup.get_stack_output(client, OutputQuery(stack_name, "output2"))
+                == "val2"
+            )
+            stubber.assert_no_pending_responses()
+            OUTPUT_CACHE.invalidate(stack_name)
+            stubber.add_response(
+                "describe_stacks",
+                {"Stacks": [generate_describe_stacks_stack(stack_name, outputs)]},
+                {"StackName": stack_name},
+            )
+            assert (
+                CfnLookup.get_stack_output(client, OutputQuery(stack_name, "output1"))
+                == "val1"
+            )
+        stubber.assert_no_pending_responses()
+
     def test_get_stack_output_clienterror(self, caplog):
         """Test get_stack_output raising ClientError."""
         caplog.set_level(logging.DEBUG, logger="runway.lookups.handlers.cfn")
@@ -7,7 +7,8 @@ import pytest
 import yaml
 
 from runway.cfngin.exceptions import FailedVariableLookup
-from runway.variables import Variable
+from runway.lookups.handlers.ssm import SsmLookup
+from runway.variables import Variable, prefetch_lookups, resolve_variables
 
 
 def get_parameter_response(name, value, value_type="String", label=None, version=1):
@@ -175,3 +176,122 @@ class TestSsmLookup(object):
 
         assert "ParameterNotFound" in str(err.value)
         stub.assert_no_pending_responses()
+
+    def test_prefetch(self, runway_context):
+        """Test prefetch retrieves parameters in batches."""
+        names = ["/test/param{}".format(i) for i in range(12)]
+        stubber = runway_context.add_stubber("ssm")
+        variables = [
+            Variable("test_var{}".format(i), "${ssm %s}" % name, variable_type="runway")
+            for i, name in enumerate(names)
+        ]
+
+        for batch in [names[:10], names[10:]]:
+            stubber.add_response(
+                "get_parameters",
+                {
+                    "Parameters": [
+                        get_parameter_response(name, name.upper())["Parameter"]
+                        for name in batch
+                    ]
+                },
+                {"Names": batch, "WithDecryption": True},
+            )
+
+        with stubber as stub:
+            prefetch_lookups(variables, runway_context)
+            for var in variables:
+                var.resolve(context=runway_context)
+        stub.assert_no_pending_responses()
+        assert [var.value for var in variables] == [name.upper() for name in names]
+
+    def test_prefetch_not_found(self, runway_context):
+        """Test prefetch leaves parameters that were not found to handle."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        var = Variable(
+            "test_var", "${ssm %s::default=default}" % name, variable_type="runway"
+        )
+
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [], "InvalidParameters": [name]},
+            {"Names": [name], "WithDecryption": True},
+        )
+        stubber.add_client_error(
+            "get_parameter",
+            "ParameterNotFound",
+            expected_params=get_parameter_request(name),
+        )
+
+        with stubber as stub:
+            SsmLookup.prefetch(["%s::default=default" % name], runway_context)
+            var.resolve(context=runway_context)
+        stub.assert_no_pending_responses()
+        assert var.value == "default"
+
+    def test_prefetch_removed(self, runway_context):
+        """Test parameters removed since a previous prefetch are not cached."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        var = Variable("test_var", "${ssm %s}" % name, variable_type="runway")
+
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [get_parameter_response(name, "val")["Parameter"]]},
+            {"Names": [name], "WithDecryption": True},
+        )
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [], "InvalidParameters": [name]},
+            {"Names": [name], "WithDecryption": True},
+        )
+        stubber.add_client_error(
+            "get_parameter",
+            "ParameterNotFound",
+            expected_params=get_parameter_request(name),
+        )
+        stubber.add_client_error(
+            "get_parameters", "InternalServerError", http_status_code=500
+        )
+        stubber.add_client_error(
+            "get_parameter",
+            "ParameterNotFound",
+            expected_params=get_parameter_request(name),
+        )
+
+        with stubber as stub:
+            SsmLookup.prefetch([name], runway_context)
+            var.resolve(context=runway_context)
+            assert var.value == "val"
+            for _ in range(2):  # not found, then failed batch
+                SsmLookup.prefetch([name], runway_context)
+                with pytest.raises(FailedVariableLookup) as err:
+                    var.resolve(context=runway_context)
+                assert "ParameterNotFound" in str(err.value)
+        stub.assert_no_pending_responses()
+
+    def test_prefetch_not_used_after_resolve(self, runway_context):
+        """Test prefetched parameters are not used once variables are resolved."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        var = Variable("test_var", "${ssm %s}" % name, variable_type="runway")
+
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [get_parameter_response(name, "old")["Parameter"]]},
+            {"Names": [name], "WithDecryption": True},
+        )
+        stubber.add_response(
+            "get_parameter",
+            get_parameter_response(name, "new"),
+            get_parameter_request(name),
+        )
+
+        with stubber as stub:
+            resolve_variables([var], runway_context, None)
+            assert var.value == "old"
+            assert not runway_context.lookup_cache
+            var.resolve(context=runway_context)
+            assert var.value == "new"
+        stub.assert_no_pending_responses()
@@ -0,0 +1,63 @@
+"""Test runway.module.cdk."""
+# pylint: disable=no-self-use
+import time
+
+from mock import MagicMock, call, patch
+
+from runway.module.cdk import get_cdk_stacks, run_cdk_diffs
+
+MODULE = "runway.module.cdk"
+
+
+@patch(MODULE + ".generate_node_command")
+@patch(MODULE + ".subprocess.check_output")
+def test_get_cdk_stacks(mock_check_output, mock_gen):
+    """Test get_cdk_stacks."""
+    mock_check_output.return_value = b"stack0\nstack1\n"
+    assert get_cdk_stacks(
+        "./path", {"key": "val"}, ["-c", "a=b"], output_dir="cdk.out"
+    ) == ["stack0", "stack1"]
+    mock_gen.assert_called_once_with(
+        command="cdk",
+        command_opts=["list", "-c", "a=b", "--output", "cdk.out"],
+        path="./path",
+    )
+    mock_check_output.assert_called_once_with(mock_gen.return_value, env={"key": "val"})
+
+
+@patch(MODULE + ".generate_node_command", lambda _cmd, opts, _path: opts)
+@patch(MODULE + ".subprocess.Popen")
+def test_run_cdk_diffs(mock_popen, capsys):
+    """Test run_cdk_diffs writes combined output in the order of the stacks."""
+
+    def _popen(cmd_list, **_kwargs):
+        stack = cmd_list[-1]
+        proc = MagicMock()
+
+        def _communicate():
+            if stack == "stack0":
+                time.sleep(0.1)  # finish last
+            return (("%s diff\n" % stack).encode() + b"\xff\n", None)
+
+        proc.communicate.side_effect = _communicate
+        return proc
+
+    mock_popen.side_effect = _popen
+    run_cdk_diffs(["stack0", "stack1"], ["diff", "--app", "cdk.out"], "./", {})
+    mock_popen.assert_has_calls(
+        [
+            call(["diff", "--app", "cdk.out", "stack0"], env={}, stdout=-1, stderr=-2),
+            call(["diff", "--app", "cdk.out", "stack1"], env={}, stdout=-1, stderr=-2),
+        ],
+        any_order=True,
+    )
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert captured.err == "stack0 diff\n\ufffd\nstack1 diff\n\ufffd\n"
+
+
+@patch(MODULE + ".subprocess.Popen")
+def test_run_cdk_diffs_no_stacks(mock_popen):
+    """Test run_cdk_diffs with no stacks."""
+    assert not run_cdk_diffs([], ["diff"], "./", {})
+    mock_popen.assert_not_called()
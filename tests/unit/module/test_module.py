@@ -1,13 +1,24 @@
 """Test runway.module.__init__."""
 # pylint: disable=no-self-use,unused-argument
 import logging
+import os
 import sys
 from contextlib import contextmanager
 
 import pytest
+import six
 from mock import MagicMock, call, patch
 
-from runway.module import NPM_BIN, ModuleOptions, RunwayModuleNpm
+from runway.module import (
+    NPM_BIN,
+    ModuleOptions,
+    RunwayModuleNpm,
+    get_node_modules_cache_key,
+    has_lifecycle_scripts,
+    npm_ci_supported,
+    prune_node_modules_cache,
+    run_npm_ci,
+)
 
 if sys.version_info[0] > 2:  # TODO remove after droping python 2
     from pathlib import Path  # pylint: disable=E
@@ -21,6 +32,115 @@ def does_not_raise():
     yield
 
 
+@patch("runway.module.get_node_version", MagicMock(return_value="v12.0.0"))
+def test_get_node_modules_cache_key(tmp_path):
+    """Test get_node_modules_cache_key."""
+    (tmp_path / "package.json").write_text(u"{}")
+    key = get_node_modules_cache_key(str(tmp_path))
+    assert get_node_modules_cache_key(str(tmp_path)) == key
+    (tmp_path / "package-lock.json").write_text(u"{}")
+    assert get_node_modules_cache_key(str(tmp_path)) != key
+
+
+@patch("runway.module._NPM_CI_SUPPORTED", [])
+@patch("runway.module.subprocess.call")
+def test_npm_ci_supported(mock_call):
+    """Test npm_ci_supported is only checked once."""
+    mock_call.return_value = 0
+    assert npm_ci_supported()
+    assert npm_ci_supported()
+    mock_call.assert_called_once()
+
+
+@patch("runway.module.get_node_version", MagicMock(return_value="v12.0.0"))
+@patch("runway.module.subprocess.check_call")
+def test_run_npm_ci(mock_check_call, caplog, monkeypatch, tmp_path):
+    """Test run_npm_ci caches node_modules."""
+    caplog.set_level(logging.INFO, logger="runway")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("runway.module.NODE_MODULES_CACHE_DIR", str(cache_dir))
+    module = tmp_path / "module"
+    module.mkdir()
+    (module / "package-lock.json").write_text(u"{}")
+    node_modules = module / "node_modules"
+
+    def _npm_ci(_cmd):
+        (node_modules / "pkg").mkdir(parents=True)
+        (node_modules / "pkg" / "index.js").write_text(u"")
+
+    mock_check_call.side_effect = _npm_ci
+    run_npm_ci(str(module), ["npm", "ci"])
+    mock_check_call.assert_called_once_with(["npm", "ci"])
+    key = get_node_modules_cache_key(str(module))
+    assert (cache_dir / key / "pkg" / "index.js").is_file()
+    assert not (cache_dir / key / ".runway-cache-key").exists()
+
+    run_npm_ci(str(module), ["npm", "ci"])
+    mock_check_call.assert_called_once()
+
+    (node_modules / "pkg" / "index.js").unlink()
+    (node_modules / ".runway-cache-key").unlink()
+    run_npm_ci(str(module), ["npm", "ci"])
+    mock_check_call.assert_called_once()
+    assert (node_modules / "pkg" / "index.js").is_file()
+    (node_modules / "pkg" / "index.js").write_text(u"patched")
+    assert not (cache_dir / key / "pkg" / "index.js").read_text()
+    assert caplog.messages == [
+        "running npm ci...",
+        "skipped npm ci; node_modules is up to date",
+        "restoring node_modules from cache...",
+    ]
+
+
+@pytest.mark.parametrize(
+    "package_json, expected",
+    [
+        (None, False),
+        ('{"scripts": {"build": "tsc"}}', False),
+        ('{"scripts": {"postinstall": "patch-package"}}', True),
+        ('{"scripts": {"prepare": "husky install"}}', True),
+        ("invalid", True),
+    ],
+)
+def test_has_lifecycle_scripts(package_json, expected, tmp_path):
+    """Test has_lifecycle_scripts."""
+    if package_json:
+        (tmp_path / "package.json").write_text(six.text_type(package_json))
+    assert has_lifecycle_scripts(str(tmp_path)) is expected
+
+
+@patch("runway.module.subprocess.check_call")
+def test_run_npm_ci_lifecycle_scripts(mock_check_call, monkeypatch, tmp_path):
+    """Test run_npm_ci does not cache node_modules with lifecycle scripts."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("runway.module.NODE_MODULES_CACHE_DIR", str(cache_dir))
+    (tmp_path / "package.json").write_text(u'{"scripts": {"prepare": "tsc"}}')
+    (tmp_path / "package-lock.json").write_text(u"{}")
+    (tmp_path / "node_modules").mkdir()
+    run_npm_ci(str(tmp_path), ["npm", "ci"])
+    run_npm_ci(str(tmp_path), ["npm", "ci"])
+    assert mock_check_call.call_count == 2
+    assert not cache_dir.exists()
+    assert not (tmp_path / "node_modules" / ".runway-cache-key").exists()
+
+
+def test_prune_node_modules_cache(monkeypatch, tmp_path):
+    """Test prune_node_modules_cache removes the least recently used."""
+    monkeypatch.setattr("runway.module.NODE_MODULES_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("runway.module.NODE_MODULES_CACHE_MAX_ENTRIES", 2)
+    keys = [str(i) * 64 for i in range(4)]
+    for i, key in enumerate(keys):
+        (tmp_path / key).mkdir()
+        os.utime(str(tmp_path / key), (i, i))
+    (tmp_path / "tmp1234").mkdir()
+    prune_node_modules_cache(keep=keys[0])
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        keys[0],
+        keys[3],
+        "tmp1234",
+    ]
+
+
 class TestRunwayModuleNpm(object):
     """Test runway.module.RunwayModuleNpm."""
 
@@ -99,10 +219,18 @@ class TestRunwayModuleNpm(object):
         mock_log.assert_called_once_with(["npm", "test"])
         assert ["node command: success"] == caplog.messages
 
+    @patch("runway.module.run_npm_ci")
     @patch("runway.module.use_npm_ci")
     @patch("runway.module.subprocess")
     def test_npm_install(
-        self, moc_proc, mock_ci, caplog, monkeypatch, patch_module_npm, runway_context
+        self,
+        moc_proc,
+        mock_ci,
+        mock_run_ci,
+        caplog,
+        monkeypatch,
+        patch_module_npm,
+        runway_context,
     ):
         """Test npm_install."""
         monkeypatch.setattr(runway_context, "no_color", False)
@@ -110,6 +238,7 @@ class TestRunwayModuleNpm(object):
         obj = RunwayModuleNpm(context=runway_context, path="./tests", options={})
         expected_logs = []
         expected_calls = []
+        expected_ci_calls = []
 
         obj.options["skip_npm_ci"] = True
         assert not obj.npm_install()
@@ -119,8 +248,7 @@ class TestRunwayModuleNpm(object):
         obj.context.env.ci = True
         mock_ci.return_value = True
         assert not obj.npm_install()
-        expected_logs.append("running npm ci...")
-        expected_calls.append(call([NPM_BIN, "ci"]))
+        expected_ci_calls.append(call("tests", [NPM_BIN, "ci"], logger=obj.logger))
 
         obj.context.env.ci = False
         assert not obj.npm_install()
@@ -142,11 +270,13 @@ class TestRunwayModuleNpm(object):
         obj.context.env.ci = True
         mock_ci.return_value = True
         assert not obj.npm_install()
-        expected_logs.append("running npm ci...")
-        expected_calls.append(call([NPM_BIN, "ci", "--no-color"]))
+        expected_ci_calls.append(
+            call("tests", [NPM_BIN, "ci", "--no-color"], logger=obj.logger)
+        )
 
         assert expected_logs == caplog.messages
         moc_proc.check_call.assert_has_calls(expected_calls)
+        mock_run_ci.assert_has_calls(expected_ci_calls)
 
     def test_package_json_missing(
         self, caplog, patch_module_npm, runway_context, tmp_path
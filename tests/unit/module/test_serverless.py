@@ -1,6 +1,8 @@
 """Test runway.module.serverless."""
 # pylint: disable=no-self-use,unused-argument
 import logging
+import os
+import stat
 import subprocess
 import sys
 
@@ -8,10 +10,115 @@ import pytest
 import yaml
 from mock import ANY, MagicMock, patch
 
-from runway.module.serverless import Serverless, ServerlessOptions, gen_sls_config_files
+from runway.module.serverless import (
+    Serverless,
+    ServerlessOptions,
+    deploy_package,
+    gen_sls_config_files,
+    set_config_opt,
+    set_package_artifacts,
+)
 
 from ..factories import MockProcess
 
+if sys.version_info.major > 2:
+    from pathlib import Path  # pylint: disable=E
+else:
+    from pathlib2 import Path  # pylint: disable=E
+
+
+MODULE = "runway.module.serverless"
+
+
+@patch(MODULE + ".run_module_command")
+@patch(MODULE + ".generate_node_command")
+@patch(MODULE + ".upload")
+@patch(MODULE + ".download")
+@patch(MODULE + ".get_existing_s3_keys")
+@patch(MODULE + ".get_src_hash")
+@patch(MODULE + ".run_sls_print")
+@patch(MODULE + ".ensure_bucket_exists", MagicMock())
+def test_deploy_package(
+    mock_print,
+    mock_get_src_hash,
+    mock_existing,
+    mock_download,
+    mock_upload,
+    mock_gen,
+    mock_run,
+    runway_context,
+    tmp_path,
+):
+    """Test deploy_package only builds packages that do not exist."""
+    configs = []
+    modes = []
+    uploaded = []
+
+    def _download(_bucket, _key, file_path):
+        with open(file_path, "w") as stream:
+            stream.write("existing")
+        return file_path
+
+    def _run(cmd_list, **_kwargs):
+        if cmd_list[0] != "package":
+            return
+        configs.append(yaml.safe_load((tmp_path / cmd_list[-3]).read_text()))
+        modes.append(stat.S_IMODE(os.stat(str(tmp_path / cmd_list[-3])).st_mode))
+        for name in ["a", "b"]:
+            (Path(cmd_list[-1]) / (name + ".zip")).write_text(u"built")
+
+    def _upload(_bucket, _key, file_path):
+        uploaded.append(Path(file_path).read_text())
+
+    mock_print.return_value = {"functions": {"a": {}, "b": {}}, "service": "test"}
+    mock_get_src_hash.return_value = {"a": "hash_a", "b": "hash_b"}
+    mock_existing.return_value = {"hash_a.zip"}
+    mock_download.side_effect = _download
+    mock_gen.side_effect = lambda **kwargs: list(kwargs["command_opts"])
+    mock_run.side_effect = _run
+    mock_upload.side_effect = _upload
+
+    deploy_package(
+        ["deploy", "-c", "serverless.yml"], "bucket", runway_context, str(tmp_path)
+    )
+
+    mock_existing.assert_called_once_with("bucket", ANY)
+    assert sorted(mock_existing.call_args[0][1]) == ["hash_a.zip", "hash_b.zip"]
+    mock_download.assert_called_once_with("bucket", "hash_a.zip", ANY)
+    assert configs[0]["functions"]["a"]["package"]["artifact"].endswith("a.zip")
+    assert "package" not in configs[0]["functions"]["b"]
+    mock_upload.assert_called_once_with("bucket", "hash_b.zip", ANY)
+    assert uploaded == ["built"]
+    deploy_cmd = mock_run.call_args_list[-1][1]["cmd_list"]
+    assert deploy_cmd[0] == "deploy"
+    assert "serverless.yml" not in deploy_cmd
+    tmp_file = deploy_cmd[deploy_cmd.index("--config") + 1]
+    assert tmp_file.endswith(".tmp.serverless.yml")
+    assert os.path.basename(tmp_file) == tmp_file
+    assert not (tmp_path / tmp_file).exists()
+    assert not list(tmp_path.glob("*.tmp.serverless.yml"))
+    if os.name != "nt":
+        assert modes == [0o600]
+
+
+def test_set_config_opt():
+    """Test set_config_opt."""
+    assert set_config_opt(
+        ["deploy", "--config", "a.yml", "--stage", "test", "-c", "b.yml"], "c.yml"
+    ) == ["deploy", "--stage", "test", "--config", "c.yml"]
+
+
+def test_set_package_artifacts():
+    """Test set_package_artifacts."""
+    config = {"functions": {"func": {"handler": "index.handler"}}, "service": "svc"}
+    assert set_package_artifacts(config, {"func": "/module/func.zip"}, "/module")[
+        "functions"
+    ]["func"]["package"] == {"artifact": "func.zip"}
+    assert "package" not in config["functions"]["func"]
+    assert set_package_artifacts(config, {"svc": "/tmp/svc.zip"}, "/tmp")[
+        "package"
+    ] == {"artifact": "svc.zip"}
+
 
 @pytest.mark.usefixtures("patch_module_npm")
 class TestServerless(object):
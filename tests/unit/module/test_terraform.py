@@ -180,6 +180,131 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
         obj = Terraform(runway_context, tmp_path, options=options.copy())
         assert obj.required_workspace == options["options"]["terraform_workspace"]
 
+    def test_init_state(self, monkeypatch, runway_context, tmp_path):
+        """Test init_is_current and save_init_state."""
+        monkeypatch.setattr(Terraform, "tf_bin", "terraform")
+        monkeypatch.setattr(Terraform, "tf_version", "Terraform v0.13.5")
+        (tmp_path / "main.tf").write_text(u"terraform {}")
+        obj = Terraform(runway_context, tmp_path)
+
+        obj.save_init_state()  # .terraform does not exist
+        assert not obj.init_is_current()
+
+        (tmp_path / ".terraform").mkdir()
+        obj.save_init_state()
+        assert obj.init_is_current()
+
+        (tmp_path / ".terraform.lock.hcl").write_text(u"lock")
+        assert not obj.init_is_current()
+        obj.save_init_state()
+        assert obj.init_is_current()
+
+        (tmp_path / "main.tf").write_text(u"terraform { required_version = 0.13 }")
+        assert not obj.init_is_current()
+        obj.save_init_state()
+
+        obj.context.env.vars["TF_WORKSPACE"] = "test"
+        assert not obj.init_is_current()
+
+        obj.init_state_file.write_text(u"invalid")
+        assert not obj.init_is_current()
+
+    def test_init_state_local_modules(self, monkeypatch, runway_context, tmp_path):
+        """Test init_is_current with changes to local modules."""
+        monkeypatch.setattr(Terraform, "tf_bin", "terraform")
+        monkeypatch.setattr(Terraform, "tf_version", "Terraform v0.13.5")
+        (tmp_path / "main.tf").write_text(u'module "x" { source = "./modules/x" }')
+        module_dir = tmp_path / "modules" / "x"
+        module_dir.mkdir(parents=True)
+        (module_dir / "main.tf").write_text(u"")
+        (tmp_path / ".terraform" / "modules").mkdir(parents=True)
+        (tmp_path / ".terraform" / "modules" / "modules.json").write_text(
+            six.u(
+                json.dumps(
+                    {
+                        "Modules": [
+                            {"Key": "", "Source": "", "Dir": "."},
+                            {"Key": "x", "Source": "./modules/x", "Dir": "modules/x"},
+                            {
+                                "Key": "vpc",
+                                "Source": "terraform-aws-modules/vpc/aws",
+                                "Dir": ".terraform/modules/vpc",
+                            },
+                        ]
+                    }
+                )
+            )
+        )
+        obj = Terraform(runway_context, tmp_path)
+        assert obj.get_local_module_dirs() == [module_dir]
+
+        obj.save_init_state()
+        assert obj.init_is_current()
+        (module_dir / "versions.tf").write_text(
+            u"terraform { required_providers { null = {} } }"
+        )
+        assert not obj.init_is_current()
+        obj.save_init_state()
+        assert obj.init_is_current()
+
+    def test_init_state_version(self, monkeypatch, runway_context, tmp_path):
+        """Test init_is_current when the version of Terraform changes."""
+        monkeypatch.setattr(Terraform, "tf_bin", "terraform")
+        monkeypatch.setattr(Terraform, "tf_version", "Terraform v0.13.5")
+        (tmp_path / ".terraform").mkdir()
+        obj = Terraform(runway_context, tmp_path)
+        obj.save_init_state()
+        assert obj.init_is_current()
+        obj.tf_version = "Terraform v0.14.0"
+        assert not obj.init_is_current()
+
+    @patch(MODULE + ".subprocess.check_output")
+    def test_tf_version(self, mock_check_output, monkeypatch, runway_context, tmp_path):
+        """Test tf_version."""
+        monkeypatch.setattr(Terraform, "tf_bin", "terraform")
+        mock_check_output.return_value = (
+            b"Terraform v0.13.5\n+ provider registry.terraform.io/hashicorp/aws "
+            b"v3.22.0\n\nYour version of Terraform is out of date!\n"
+        )
+        obj = Terraform(runway_context, tmp_path)
+        assert obj.tf_version == "Terraform v0.13.5"
+        mock_check_output.assert_called_once_with(
+            ["terraform", "version"], env=obj.context.env.vars
+        )
+
+    @patch(MODULE + ".subprocess.check_output")
+    def test_tf_version_error(
+        self, mock_check_output, monkeypatch, runway_context, tmp_path
+    ):
+        """Test tf_version when Terraform can't be run."""
+        monkeypatch.setattr(Terraform, "tf_bin", "terraform")
+        mock_check_output.side_effect = OSError
+        assert Terraform(runway_context, tmp_path).tf_version == ""
+
+    @pytest.mark.parametrize(
+        "env_vars, expected",
+        [
+            ({}, "home/.runway_cache/terraform_plugins"),
+            ({"TF_PLUGIN_CACHE_DIR": "custom"}, "custom"),
+            ({"TF_PLUGIN_CACHE_DIR": ""}, None),
+        ],
+    )
+    def test_plugin_cache_dir(
+        self, env_vars, expected, monkeypatch, runway_context, tmp_path
+    ):
+        """Test plugin_cache_dir."""
+        monkeypatch.setattr(MODULE + ".os.path.expanduser", lambda _: "home")
+        runway_context.env.vars.pop("TF_PLUGIN_CACHE_DIR", None)
+        runway_context.env.vars.update(env_vars)
+        obj = Terraform(runway_context, tmp_path)
+        if expected:
+            assert obj.plugin_cache_dir.as_posix() == expected
+            assert obj.context.env.vars["TF_PLUGIN_CACHE_DIR"] == str(
+                obj.plugin_cache_dir
+            )
+        else:
+            assert obj.plugin_cache_dir is None
+
     @pytest.mark.parametrize(
         "env, param, expected",
         [
@@ -496,6 +621,7 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
             }
         }
         obj = Terraform(runway_context, tmp_path, options=options)
+        obj.plugin_cache_dir = tmp_path / "plugins"
 
         expected_arg_list = [
             "-reconfigure",
@@ -511,6 +637,7 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
             exit_on_error=False,
             logger=obj.logger,
         )
+        assert obj.plugin_cache_dir.is_dir()
 
         mock_run_command.side_effect = subprocess.CalledProcessError(1, "")
         with pytest.raises(SystemExit) as excinfo:
@@ -620,6 +747,8 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
         monkeypatch.setattr(Terraform, "cleanup_dot_terraform", MagicMock())
         monkeypatch.setattr(Terraform, "handle_parameters", MagicMock())
         monkeypatch.setattr(Terraform, "terraform_init", MagicMock())
+        monkeypatch.setattr(Terraform, "init_is_current", MagicMock(return_value=False))
+        monkeypatch.setattr(Terraform, "save_init_state", MagicMock())
         monkeypatch.setattr(Terraform, "current_workspace", "test")
         monkeypatch.setattr(
             Terraform, "terraform_workspace_list", MagicMock(return_value="* test")
@@ -659,6 +788,7 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
         obj.terraform_workspace_select.assert_not_called()
         obj.terraform_workspace_new.assert_not_called()
         obj.terraform_get.assert_called_once_with()
+        obj.save_init_state.assert_called_once_with()
         obj["terraform_" + command].assert_called_once_with()
         assert obj.auto_tfvars.exists.call_count == 2
         assert obj.auto_tfvars.unlink.call_count == 1
@@ -686,6 +816,15 @@ class TestTerraform(object):  # pylint: disable=too-many-public-methods
         assert not obj[action]()
         obj.terraform_workspace_new.assert_called_once_with("test")
 
+        # module is run; init is skipped
+        obj.cleanup_dot_terraform.reset_mock()
+        obj.terraform_init.reset_mock()
+        obj.init_is_current.return_value = True
+        monkeypatch.setattr(Terraform, "current_workspace", "test")
+        assert not obj[action]()
+        obj.cleanup_dot_terraform.assert_not_called()
+        obj.terraform_init.assert_not_called()
+
 
 class TestTerraformOptions(object):
     """Test runway.module.terraform.TerraformOptions."""
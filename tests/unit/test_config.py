@@ -113,6 +113,7 @@ class TestDeploymentDefinition(object):
         "_account_alias",
         "_account_id",
         "_assume_role",
+        "depends_on",
         "_env_vars",
         "_environments",
         "_module_options",
@@ -219,6 +220,7 @@ class TestModuleDefinition(object):
     ATTRS = [
         "child_modules",
         "_class_path",
+        "depends_on",
         "_env_vars",
         "_environments",
         "name",
@@ -258,6 +260,22 @@ class TestModuleDefinition(object):
         assert module.path == "sampleapp.cfn"
         assert module.tags == {}
 
+    def test_from_list_depends_on(self):
+        """Test depends_on of modules and parallel modules."""
+        modules = ModuleDefinition.from_list(
+            [
+                "a.cfn",
+                {"path": "b.cfn", "depends_on": ["a.cfn"]},
+                {
+                    "name": "c",
+                    "parallel": ["c1.cfn", "c2.cfn"],
+                    "depends_on": ["b.cfn"],
+                },
+            ]
+        )
+        assert [module.name for module in modules] == ["a.cfn", "b.cfn", "c"]
+        assert [module.depends_on for module in modules] == [[], ["a.cfn"], ["b.cfn"]]
+
 
 class TestTestDefinition(object):
     """Test TestDefinition."""
@@ -0,0 +1,63 @@
+"""Test runway._logging."""
+# pylint: disable=no-self-use
+import logging
+import sys
+
+import pytest
+
+from runway._logging import LogMultiplexHandler, new_log_unit, run_log_unit
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info.major < 3, reason="only supported by python 3"
+)
+
+
+def record(msg, unit=None, complete=False):
+    """Create a log record as received from a worker process."""
+    return logging.makeLogRecord(
+        {
+            "name": "runway.test",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": msg,
+            "runway_unit": unit,
+            "runway_unit_complete": complete,
+        }
+    )
+
+
+class TestLogMultiplexHandler(object):
+    """Test runway._logging.LogMultiplexHandler."""
+
+    def test_buffered(self, caplog):
+        """Test records of a unit are handled together once it completes."""
+        caplog.set_level(logging.INFO, logger="runway.test")
+        handler = LogMultiplexHandler()
+        handler.handle(record("a:1", "a"))
+        handler.handle(record("b:1", "b"))
+        handler.handle(record("no unit"))
+        handler.handle(record("a/c:1", "a/c"))
+        handler.handle(record("a:2", "a"))
+        assert caplog.messages == ["no unit"]
+        handler.handle(record("", "a/c", complete=True))
+        assert caplog.messages == ["no unit"]
+        handler.handle(record("", "a", complete=True))
+        assert caplog.messages == ["no unit", "a:1", "a:2", "a/c:1"]
+        handler.flush()
+        assert caplog.messages == ["no unit", "a:1", "a:2", "a/c:1", "b:1"]
+        assert not handler.buffers
+
+    def test_not_buffered(self, caplog):
+        """Test records are handled as they are received."""
+        caplog.set_level(logging.INFO, logger="runway.test")
+        handler = LogMultiplexHandler(buffered=False)
+        handler.handle(record("a:1", "a"))
+        handler.handle(record("b:1", "b"))
+        handler.handle(record("", "a", complete=True))
+        assert caplog.messages == ["a:1", "b:1"]
+
+
+def test_run_log_unit():
+    """Test run_log_unit."""
+    assert run_log_unit("a", new_log_unit).startswith("a/")
+    assert "/" not in new_log_unit()
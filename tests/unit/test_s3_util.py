@@ -0,0 +1,19 @@
+"""Test runway.s3_util."""
+# pylint: disable=unused-argument
+import boto3
+from moto import mock_s3
+
+from runway.s3_util import get_existing_s3_keys
+
+
+def test_get_existing_s3_keys(aws_credentials):
+    """Test get_existing_s3_keys."""
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="test-bucket")
+        client.put_object(Bucket="test-bucket", Key="a.zip", Body=b"")
+        client.put_object(Bucket="test-bucket", Key="c.zip", Body=b"")
+        assert get_existing_s3_keys(
+            "test-bucket", ["a.zip", "b.zip", "c.zip"], max_workers=2
+        ) == {"a.zip", "c.zip"}
+        assert get_existing_s3_keys("test-bucket", []) == set()
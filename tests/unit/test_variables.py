@@ -10,7 +10,12 @@ from runway.cfngin.exceptions import UnresolvedVariable
 from runway.cfngin.lookups import register_lookup_handler
 from runway.cfngin.stack import Stack
 from runway.util import MutableMap
-from runway.variables import Variable
+from runway.variables import (
+    Variable,
+    clear_lookup_cache,
+    prefetch_lookups,
+    resolve_variables,
+)
 
 from .cfngin.factories import generate_definition
 
@@ -270,3 +275,60 @@ class TestRunwayVariables(TestCase):
 
         with self.assertRaises(UnresolvedVariable):
             print(var.value)
+
+
+class TestPrefetchLookups(TestCase):
+    """Tests for runway.variables.prefetch_lookups."""
+
+    def test_lookups(self):
+        """Test lookups of a variable include nested lookups."""
+        var = Variable(
+            "test", {"key": ["${env ${env what}}", "a ${env test}"]}, "runway"
+        )
+        self.assertEqual(
+            [lookup.lookup_data.resolved for lookup in var.lookups],
+            [False, True, True],
+        )
+        self.assertEqual(
+            [lookup.lookup_data.value for lookup in var.lookups[1:]], ["what", "test"],
+        )
+
+    def test_prefetch_lookups(self):
+        """Test lookups are grouped by handler and nested lookups skipped."""
+        handler = MagicMock()
+        handler.__name__ = "handler"
+        register_lookup_handler("prefetch_test", handler)
+        variables = [
+            Variable("test1", "${prefetch_test a} ${prefetch_test b}"),
+            Variable("test2", "${prefetch_test ${prefetch_test c}}"),
+        ]
+        prefetch_lookups(variables, CONTEXT, provider="provider")
+        handler.prefetch.assert_called_once_with(
+            ["a", "b", "c"], CONTEXT, provider="provider"
+        )
+
+    def test_prefetch_lookups_error(self):
+        """Test errors raised by handlers are suppressed."""
+        handler = MagicMock()
+        handler.__name__ = "handler"
+        handler.prefetch.side_effect = ValueError
+        register_lookup_handler("prefetch_test_error", handler)
+        prefetch_lookups([Variable("test", "${prefetch_test_error a}")], CONTEXT)
+        handler.prefetch.assert_called_once()
+
+    def test_clear_lookup_cache(self):
+        """Test clear_lookup_cache."""
+        context = MagicMock(lookup_cache={"ssm": {"key": "val"}})
+        clear_lookup_cache(context)
+        self.assertEqual(context.lookup_cache, {})
+        clear_lookup_cache(object())  # context without a cache is ignored
+
+    def test_resolve_variables_clears_lookup_cache(self):
+        """Test resolve_variables clears the lookup cache even on error."""
+        context = MagicMock(lookup_cache={"ssm": {"key": "val"}})
+        var = MagicMock()
+        var.lookups = []
+        var.resolve.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            resolve_variables([var], context, None)
+        self.assertEqual(context.lookup_cache, {})